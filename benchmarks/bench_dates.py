@@ -0,0 +1,60 @@
+"""
+Microbenchmark for date normalization.
+
+Compares validate_dates and split_date against the previous approach of
+running dateutil's general parser on every call.
+
+Run with: python -m benchmarks.bench_dates [--number N]
+"""
+import argparse
+import timeit
+from typing import Tuple
+
+from dateutil.parser import parse as date_parse
+
+from wikiedits.date_utils import split_date, validate_dates
+
+
+def _dateutil_validate(start: str, end: str) -> Tuple[str, str]:
+  return (date_parse(start).strftime("%Y%m%d"), date_parse(end).strftime("%Y%m%d"))
+
+
+def _report(label: str, seconds: float, number: int) -> None:
+  print(f"{label:48} {seconds / number * 1e6:8.2f} us/call")
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--number", type=int, default=20000)
+  options = parser.parse_args()
+  n = options.number
+
+  cases = [
+    ("YYYYMMDD", "20240101", "20241231"),
+    ("YYYY-MM-DD", "2024-01-01", "2024-12-31"),
+    ("free-form", "January 1, 2024", "December 31, 2024"),
+  ]
+  for label, start, end in cases:
+    _report(f"dateutil parse x2 ({label})",
+            timeit.timeit(lambda: _dateutil_validate(start, end), number=n), n)
+
+    def uncached() -> None:
+      validate_dates.cache_clear()
+      validate_dates("daily", start, end)
+
+    _report(f"validate_dates, cold ({label})", timeit.timeit(uncached, number=n), n)
+    _report(f"validate_dates, memoized ({label})",
+            timeit.timeit(lambda: validate_dates("daily", start, end), number=n), n)
+
+  for label, date in [("YYYYMMDD", "20240315"), ("YYYY-MM-DD", "2024-03-15")]:
+    def split_uncached() -> None:
+      split_date.cache_clear()
+      split_date(date)
+
+    _report(f"split_date, cold ({label})", timeit.timeit(split_uncached, number=n), n)
+    _report(f"split_date, memoized ({label})",
+            timeit.timeit(lambda: split_date(date), number=n), n)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,124 @@
+"""
+Compare JSON decoders on large Wikimedia-shaped responses.
+
+Times the standard library, requests' Response.json(), orjson and msgspec
+(generic and with typed structs) on a multi-year daily per-page series and
+a large top-by list, and reports the peak memory traced while decoding.
+
+Run with: python -m benchmarks.bench_decode [--years N] [--top-size N]
+"""
+import argparse
+import json
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import requests
+
+from benchmarks.stub_server import build_payload
+
+try:
+  import orjson
+except ImportError:
+  orjson = None  # type: ignore[assignment]
+
+try:
+  import msgspec
+except ImportError:
+  msgspec = None  # type: ignore[assignment]
+
+
+def _response(body: bytes) -> requests.Response:
+  response = requests.Response()
+  response.status_code = 200
+  response._content = body
+  return response
+
+
+def _typed_decoders() -> Dict[str, Callable[[bytes], Any]]:
+  if msgspec is None:
+    return {}
+
+  class Point(msgspec.Struct):
+    timestamp: str
+    edits: int
+
+  class Item(msgspec.Struct):
+    results: List[Point]
+
+  class Series(msgspec.Struct):
+    items: List[Item]
+
+  class Entry(msgspec.Struct):
+    page_title: str
+    edits: int
+    rank: int
+
+  class Day(msgspec.Struct):
+    timestamp: str
+    top: List[Entry]
+
+  class TopItem(msgspec.Struct):
+    results: List[Day]
+
+  class Top(msgspec.Struct):
+    items: List[TopItem]
+
+  return {
+    "series": msgspec.json.Decoder(Series).decode,
+    "top": msgspec.json.Decoder(Top).decode,
+  }
+
+
+def _peak_kib(fn: Callable[[], Any]) -> float:
+  tracemalloc.start()
+  try:
+    fn()
+    return tracemalloc.get_traced_memory()[1] / 1024
+  finally:
+    tracemalloc.stop()
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--years", type=int, default=10,
+                      help="years of daily points in the series payload")
+  parser.add_argument("--top-size", type=int, default=1000)
+  parser.add_argument("--number", type=int, default=50)
+  options = parser.parse_args()
+
+  end_year = 2015 + options.years
+  payloads = {
+    "series": build_payload(
+      f"/metrics/edits/per-page/en.wikipedia/Main_Page/all-editor-types/daily/"
+      f"20150101/{end_year}0101"
+    ),
+    "top": build_payload(
+      "/metrics/edited-pages/top-by-edits/en.wikipedia/all-editor-types/"
+      "content/2024/01/01",
+      options.top_size,
+    ),
+  }
+  typed = _typed_decoders()
+
+  for label, payload in payloads.items():
+    body = json.dumps(payload).encode()
+    print(f"{label}: {len(body) / 1024:.0f} KiB")
+    decoders: Dict[str, Callable[[], Any]] = {
+      "json.loads": lambda: json.loads(body),
+      "requests Response.json()": lambda: _response(body).json(),
+    }
+    if orjson is not None:
+      decoders["orjson.loads"] = lambda: orjson.loads(body)
+    if msgspec is not None:
+      generic = msgspec.json.Decoder()
+      decoders["msgspec (generic)"] = lambda: generic.decode(body)
+      decoders["msgspec (typed structs)"] = lambda: typed[label](body)
+
+    for name, fn in decoders.items():
+      seconds = timeit.timeit(fn, number=options.number) / options.number
+      print(f"  {name:26} {seconds * 1e3:8.2f} ms   peak {_peak_kib(fn):9.0f} KiB")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,60 @@
+"""
+Import-time benchmark for `import wikiedits`.
+
+Runs the import in fresh interpreters and reports the best wall time, next to
+the bare interpreter startup for reference. Exits with status 1 if the import
+costs more than --max-ms or pulls in a heavy dependency, so it can gate CI.
+
+Run with: python -m benchmarks.bench_import [--runs N] [--max-ms MS]
+"""
+import argparse
+import subprocess
+import sys
+import time
+from typing import List
+
+HEAVY_MODULES = ("requests", "urllib3", "dateutil", "numpy", "aiohttp")
+
+
+def _best_of(code: str, runs: int) -> float:
+  timings: List[float] = []
+  for _ in range(runs):
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)
+    timings.append(time.perf_counter() - t0)
+  return min(timings)
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--runs", type=int, default=10)
+  parser.add_argument("--max-ms", type=float, default=20.0,
+                      help="largest acceptable import cost over bare startup")
+  options = parser.parse_args()
+
+  baseline = _best_of("pass", options.runs)
+  package = _best_of("import wikiedits", options.runs)
+  cost_ms = (package - baseline) * 1000
+  print(f"interpreter startup     {baseline * 1000:8.1f} ms")
+  print(f"import wikiedits        {package * 1000:8.1f} ms")
+  print(f"import cost             {cost_ms:8.1f} ms (limit {options.max_ms} ms)")
+
+  loaded = subprocess.run(
+    [sys.executable, "-c",
+     "import sys, wikiedits\n"
+     f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"],
+    check=True, capture_output=True, text=True,
+  ).stdout.split()
+
+  failed = False
+  if loaded:
+    print(f"FAIL: import loaded {', '.join(loaded)}")
+    failed = True
+  if cost_ms > options.max_ms:
+    print("FAIL: import time regressed")
+    failed = True
+  sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,55 @@
+"""
+Compare requests/sec with and without connection pooling.
+
+Run with: python -m benchmarks.bench_pooling [--requests N]
+"""
+import argparse
+import time
+from typing import Callable
+
+import requests
+
+from benchmarks.stub_server import start_server
+from wikiedits.api import DEFAULT_HEADERS
+from wikiedits.transport import HTTPTransport
+
+
+def _measure(fetch: Callable[[str], object], url: str, n: int) -> float:
+  started = time.perf_counter()
+  for _ in range(n):
+    fetch(url)
+  return n / (time.perf_counter() - started)
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--requests", type=int, default=2000)
+  options = parser.parse_args()
+
+  server, base_url = start_server()
+  url = (
+    f"{base_url}/edits/aggregate/en.wikipedia.org/all-editor-types/"
+    "all-page-types/daily/20250101/20250102"
+  )
+  transport = HTTPTransport()
+
+  try:
+    unpooled = _measure(
+      lambda u: requests.get(u, headers=DEFAULT_HEADERS, timeout=30),
+      url, options.requests,
+    )
+    pooled = _measure(
+      lambda u: transport.get(u, headers=DEFAULT_HEADERS, timeout=30),
+      url, options.requests,
+    )
+  finally:
+    transport.close()
+    server.shutdown()
+
+  print(f"requests.get (new connection per call): {unpooled:8.1f} req/s")
+  print(f"HTTPTransport (pooled keep-alive):      {pooled:8.1f} req/s")
+  print(f"speedup: {pooled / unpooled:.2f}x")
+
+
+if __name__ == "__main__":
+  main()
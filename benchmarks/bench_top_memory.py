@@ -0,0 +1,78 @@
+"""
+Measure the memory held by many daily top-by lists, as dicts and as
+compact TopEntry records.
+
+Each day's list is decoded from its own JSON body, as it would be when
+fetched, and the titles recur across days the way popular pages do.
+
+Run with: python -m benchmarks.bench_top_memory [--days N] [--top-size N]
+"""
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from typing import Any, Callable, List
+
+from wikiedits.records import compact_top
+
+
+def _bodies(days: int, top_size: int, distinct: int) -> List[bytes]:
+  rng = random.Random(0)
+  pool = [f"Synthetic_page_title_{i}" for i in range(distinct)]
+  bodies = []
+  for _ in range(days):
+    titles = rng.sample(pool, top_size)
+    top = [
+      {"page_title": title, "edits": 100000 // rank, "rank": rank}
+      for rank, title in enumerate(titles, start=1)
+    ]
+    bodies.append(json.dumps({"items": [{"results": [{"top": top}]}]}).encode())
+  return bodies
+
+
+def _retained(build: Callable[[], Any]) -> int:
+  gc.collect()
+  tracemalloc.start()
+  try:
+    held = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+  finally:
+    tracemalloc.stop()
+  del held
+  return size
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--days", type=int, default=180)
+  parser.add_argument("--top-size", type=int, default=100)
+  parser.add_argument("--distinct", type=int, default=2000,
+                      help="number of distinct titles across all days")
+  options = parser.parse_args()
+
+  bodies = _bodies(options.days, options.top_size, options.distinct)
+  entries = options.days * options.top_size
+
+  def as_dicts() -> List[Any]:
+    return [json.loads(body)["items"][0]["results"][0]["top"] for body in bodies]
+
+  def as_records() -> List[Any]:
+    return [
+      compact_top(json.loads(body)["items"][0]["results"][0]["top"], "edits")
+      for body in bodies
+    ]
+
+  print(f"{options.days} days x {options.top_size} entries, "
+        f"{options.distinct} distinct titles")
+  baseline = None
+  for label, build in [("dicts", as_dicts), ("TopEntry, interned", as_records)]:
+    size = _retained(build)
+    baseline = baseline or size
+    print(f"  {label:20} {size / 1024:9.0f} KiB  {size / entries:7.1f} bytes/entry"
+          f"  ({size / baseline:.0%})")
+
+
+if __name__ == "__main__":
+  main()
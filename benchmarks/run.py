@@ -0,0 +1,149 @@
+"""
+Benchmark every public function against the local stub server.
+
+Reports calls/sec, p50 and p99 latency, and peak traced memory per call.
+
+With --replay, every case is recorded against the stub once and then timed
+from a cassette through ReplayTransport, which takes sockets and the server
+out of the measurement and leaves only the library's own overhead.
+
+Run with: python -m benchmarks.run [--calls N] [--days N] [--latency S]
+          [--only NAME ...] [--replay] [--json PATH]
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+import wikiedits
+from benchmarks.stub_server import start_server
+from wikiedits import api, ratelimit, transport
+from wikiedits.cassette import RecordingTransport, ReplayTransport
+
+PROJECT = "en.wikipedia.org"
+PAGE = "Python_(programming_language)"
+
+
+def _cases(start: str, end: str, date: str) -> Dict[str, Callable[[], Any]]:
+  return {
+    "edits_aggregate": lambda: wikiedits.edits_aggregate(
+      PROJECT, "daily", start, end),
+    "edits_per_page": lambda: wikiedits.edits_per_page(
+      PROJECT, PAGE, "daily", start, end),
+    "bytes_diff_net_aggregate": lambda: wikiedits.bytes_diff_net_aggregate(
+      PROJECT, "daily", start, end),
+    "bytes_diff_net_per_page": lambda: wikiedits.bytes_diff_net_per_page(
+      PROJECT, PAGE, "daily", start, end),
+    "bytes_diff_abs_aggregate": lambda: wikiedits.bytes_diff_abs_aggregate(
+      PROJECT, "daily", start, end),
+    "bytes_diff_abs_per_page": lambda: wikiedits.bytes_diff_abs_per_page(
+      PROJECT, PAGE, "daily", start, end),
+    "new_pages": lambda: wikiedits.new_pages(PROJECT, "daily", start, end),
+    "edited_pages": lambda: wikiedits.edited_pages(PROJECT, "daily", start, end),
+    "top_by_edits": lambda: wikiedits.top_by_edits(PROJECT, date),
+    "top_by_net_diff": lambda: wikiedits.top_by_net_diff(PROJECT, date),
+    "top_by_abs_diff": lambda: wikiedits.top_by_abs_diff(PROJECT, date),
+    "edits": lambda: wikiedits.edits(start, end, project=PROJECT, page_title=PAGE),
+    "bytes": lambda: wikiedits.bytes(start, end, project=PROJECT),
+    "pages": lambda: wikiedits.pages(start, end, project=PROJECT),
+    "top": lambda: wikiedits.top(date, project=PROJECT),
+  }
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+  ordered = sorted(samples)
+  index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+  return ordered[index]
+
+
+def measure(call: Callable[[], Any], calls: int) -> Dict[str, float]:
+  """
+  Time calls sequential invocations, then trace peak memory of one more.
+  """
+  call()  # warm up connections and caches of the stub
+  latencies = []
+  started = time.perf_counter()
+  for _ in range(calls):
+    t0 = time.perf_counter()
+    call()
+    latencies.append(time.perf_counter() - t0)
+  elapsed = time.perf_counter() - started
+
+  tracemalloc.start()
+  call()
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+
+  return {
+    "calls_per_sec": calls / elapsed,
+    "p50_ms": statistics.median(latencies) * 1000,
+    "p99_ms": _percentile(latencies, 99) * 1000,
+    "peak_kib": peak / 1024,
+  }
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--calls", type=int, default=200,
+                      help="timed calls per function")
+  parser.add_argument("--days", type=int, default=365,
+                      help="days covered by each range request")
+  parser.add_argument("--top-size", type=int, default=100,
+                      help="entries in each top-by response")
+  parser.add_argument("--latency", type=float, default=0.0,
+                      help="stub server latency per request in seconds")
+  parser.add_argument("--only", nargs="*", help="functions to run")
+  parser.add_argument("--replay", action="store_true",
+                      help="time replays from a recorded cassette instead of HTTP")
+  parser.add_argument("--json", help="write results to this file")
+  options = parser.parse_args()
+
+  server, base_url = start_server(latency=options.latency,
+                                  top_size=options.top_size)
+  api.set_base_url(base_url)
+  # Measure the library itself, not the limiter protecting the real API
+  ratelimit.configure(rate=1e9, burst=10**9)
+
+  start_day = datetime(2020, 1, 1)
+  start = start_day.strftime("%Y%m%d")
+  end = (start_day + timedelta(days=options.days)).strftime("%Y%m%d")
+  cases = {
+    name: call for name, call in _cases(start, end, "20200101").items()
+    if not options.only or name in options.only
+  }
+
+  results: Dict[str, Dict[str, float]] = {}
+  tmp = tempfile.TemporaryDirectory()
+  try:
+    if options.replay:
+      cassette = os.path.join(tmp.name, "bench.cassette")
+      transport.set_transport(RecordingTransport(cassette))
+      for call in cases.values():
+        call()
+      transport.set_transport(ReplayTransport(cassette))
+
+    print(f"{'function':28} {'calls/s':>10} {'p50 ms':>9} {'p99 ms':>9} "
+          f"{'peak KiB':>10}")
+    for name, call in cases.items():
+      result = results[name] = measure(call, options.calls)
+      print(f"{name:28} {result['calls_per_sec']:10.1f} {result['p50_ms']:9.2f} "
+            f"{result['p99_ms']:9.2f} {result['peak_kib']:10.1f}")
+  finally:
+    transport.set_transport(None)
+    tmp.cleanup()
+    api.set_base_url()
+    ratelimit.configure()
+    server.shutdown()
+
+  if options.json:
+    with open(options.json, "w") as f:
+      json.dump({"options": vars(options), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,137 @@
+"""
+Local stub of the Wikimedia metrics API for benchmarks.
+
+Serves synthetic but realistically shaped responses for every endpoint the
+library calls: one point per day (or month) between the requested start and
+end dates for the range endpoints, and a ranked list for the top-by
+endpoints. Response size and per-request latency are configurable.
+"""
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+
+from dateutil.relativedelta import relativedelta
+
+FIELDS = {
+  "edits/aggregate": "edits",
+  "edits/per-page": "edits",
+  "bytes-difference/net/aggregate": "net_bytes_diff",
+  "bytes-difference/net/per-page": "net_bytes_diff",
+  "bytes-difference/absolute/aggregate": "abs_bytes_diff",
+  "bytes-difference/absolute/per-page": "abs_bytes_diff",
+  "edited-pages/new": "new_pages",
+  "edited-pages/aggregate": "edited_pages",
+  "edited-pages/top-by-edits": "edits",
+  "edited-pages/top-by-net-bytes-difference": "net_bytes_diff",
+  "edited-pages/top-by-absolute-bytes-difference": "abs_bytes_diff",
+}
+
+
+def _split_path(path: str) -> Tuple[str, List[str]]:
+  """
+  Split '/metrics/<endpoint>/<args>' into the endpoint and its arguments.
+  """
+  parts = path.split("?")[0].strip("/").split("/")
+  if parts and parts[0] == "metrics":
+    parts = parts[1:]
+  for length in (3, 2):
+    endpoint = "/".join(parts[:length])
+    if endpoint in FIELDS:
+      return endpoint, parts[length:]
+  raise KeyError(path)
+
+
+def _series(field: str, granularity: str, start: str, end: str) -> List[Dict[str, Any]]:
+  day = datetime.strptime(start, "%Y%m%d")
+  stop = datetime.strptime(end, "%Y%m%d")
+  step = relativedelta(months=1) if granularity == "monthly" else timedelta(days=1)
+  rng = random.Random(start + end)
+  results = []
+  while day < stop:
+    low = -5000 if field == "net_bytes_diff" else 0
+    value = rng.randint(low, 100000)
+    results.append({"timestamp": day.strftime("%Y-%m-%dT00:00:00.000Z"), field: value})
+    day += step
+  return results
+
+
+def build_payload(path: str, top_size: int = 100) -> Dict[str, Any]:
+  """
+  Build the JSON response the real API would return for path.
+  """
+  endpoint, args = _split_path(path)
+  field = FIELDS[endpoint]
+
+  if "top-by" in endpoint:
+    project, editor_type, page_type, year, month, day = args
+    top = [
+      {"page_title": f"Synthetic_page_{rank}", field: 100000 // rank, "rank": rank}
+      for rank in range(1, top_size + 1)
+    ]
+    return {"items": [{
+      "project": project, "editor-type": editor_type, "page-type": page_type,
+      "granularity": "daily",
+      "results": [{"timestamp": f"{year}-{month}-{day}T00:00:00.000Z", "top": top}],
+    }]}
+
+  granularity, start, end = args[-3:]
+  item: Dict[str, Any] = {"project": args[0], "granularity": granularity}
+  if endpoint.endswith("per-page"):
+    item["page-title"] = args[1]
+  item["results"] = _series(field, granularity, start, end)
+  return {"items": [item]}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+  protocol_version = "HTTP/1.1"
+  disable_nagle_algorithm = True
+
+  def do_GET(self) -> None:
+    server = self.server
+    latency = getattr(server, "latency", 0.0)
+    if latency:
+      time.sleep(latency)
+
+    try:
+      payload = build_payload(self.path, getattr(server, "top_size", 100))
+    except (KeyError, ValueError):
+      self._send(404, b'{"detail": "Not found"}')
+      return
+    self._send(200, json.dumps(payload).encode())
+
+  def _send(self, status: int, body: bytes) -> None:
+    self.send_response(status)
+    self.send_header("Content-Type", "application/json")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, format: str, *args: object) -> None:
+    pass
+
+
+def start_server(
+  latency: float = 0.0, top_size: int = 100
+) -> Tuple[ThreadingHTTPServer, str]:
+  """
+  Start the stub server on a free local port in a background thread.
+
+  Args:
+    latency: Seconds to wait before answering each request
+    top_size: Number of entries in each top-by response
+
+  Returns:
+    tuple: (server, base_url) where base_url can be passed to set_base_url()
+  """
+  server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+  server.daemon_threads = True
+  server.latency = latency  # type: ignore[attr-defined]
+  server.top_size = top_size  # type: ignore[attr-defined]
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  host, port = server.server_address[:2]
+  return server, f"http://{host}:{port}/metrics"
@@ -0,0 +1,14 @@
+import pytest
+
+from wikiedits import decode
+
+
+@pytest.fixture(autouse=True)
+def stdlib_decoder():
+  """
+  Decode responses with response.json(), which the mocked responses in these
+  tests stub out. tests/test_decode.py covers the fast decoders.
+  """
+  decode.set_decoder("json")
+  yield
+  decode.set_decoder()
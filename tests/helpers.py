@@ -0,0 +1,67 @@
+"""
+Fake API series shared by the tests.
+"""
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import requests
+
+
+def _by_day(day):
+  return day.day
+
+
+def daily_results(start, end, value=_by_day):
+  """Build one point per day in [start, end), with edits set to value(day)"""
+  day = datetime.strptime(start, "%Y%m%d")
+  stop = datetime.strptime(end, "%Y%m%d")
+  results = []
+  while day < stop:
+    results.append({"timestamp": day.strftime("%Y-%m-%dT00:00:00.000Z"),
+                    "edits": value(day)})
+    day += timedelta(days=1)
+  return results
+
+
+def monthly_results(start, end, value=_by_day):
+  """Build one point per month in [start, end), summing value(day) over it"""
+  month = datetime.strptime(start, "%Y%m%d")
+  stop = datetime.strptime(end, "%Y%m%d")
+  results = []
+  while month < stop:
+    following = (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+    days = daily_results(month.strftime("%Y%m%d"), following.strftime("%Y%m%d"),
+                         value)
+    results.append({"timestamp": month.strftime("%Y-%m-%dT00:00:00.000Z"),
+                    "edits": sum(point["edits"] for point in days)})
+    month = following
+  return results
+
+
+def series_response(url, value=_by_day, **kwargs):
+  """
+  Build a fake response to a series URL ending in granularity/start/end,
+  with the points of daily_results() or monthly_results() for its range.
+  Other keyword arguments are ignored, so it can be a Session.get
+  side_effect directly.
+  """
+  granularity, start, end = url.split("/")[-3:]
+  if granularity == "monthly":
+    results = monthly_results(start, end, value)
+  else:
+    results = daily_results(start, end, value)
+  response = Mock()
+  response.json.return_value = {"items": [{"results": results}]}
+  response.raise_for_status = Mock()
+  return response
+
+
+def not_found_response(url, **kwargs):
+  """Build a fake 404 response, as the API sends for a range without data"""
+  response = Mock()
+  response.status_code = 404
+  response.text = "Not found"
+  response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+    response=response
+  )
+  return response
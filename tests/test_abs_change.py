@@ -5,7 +5,7 @@ from wikiedits.api import bytes_diff_abs_aggregate, bytes_diff_abs_per_page
 
 
 class TestAbsChange(unittest.TestCase):
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_bytes_diff_abs_aggregate_basic(self, mock_get):
     """Test basic absolute change aggregate functionality"""
     mock_response = Mock()
@@ -43,7 +43,7 @@ class TestAbsChange(unittest.TestCase):
     self.assertEqual(result[0]["abs_bytes_diff"], 25000)
     self.assertEqual(result[1]["abs_bytes_diff"], 28000)
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_bytes_diff_abs_aggregate_custom_parameters(self, mock_get):
     """Test absolute change aggregate with custom parameters"""
     mock_response = Mock()
@@ -68,7 +68,7 @@ class TestAbsChange(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_bytes_diff_abs_per_page_basic(self, mock_get):
     """Test basic absolute change per page functionality"""
     mock_response = Mock()
@@ -109,7 +109,7 @@ class TestAbsChange(unittest.TestCase):
     self.assertEqual(result[0]["abs_bytes_diff"], 750)
     self.assertEqual(result[1]["abs_bytes_diff"], 620)
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_bytes_diff_abs_per_page_custom_parameters(self, mock_get):
     """Test absolute change per page with custom parameters"""
     mock_response = Mock()
@@ -135,7 +135,7 @@ class TestAbsChange(unittest.TestCase):
     )
 
   @patch("wikiedits.api.validate_dates")
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_abs_change_date_validation(self, mock_get, mock_validate):
     """Test that date validation is called for both functions"""
     mock_response = Mock()
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import requests
+
+from wikiedits import aio
+
+
+def _body(payload):
+  return json.dumps(payload).encode()
+
+
+@unittest.skipIf(aio.aiohttp is None, "aiohttp is not installed")
+class TestAio(unittest.IsolatedAsyncioTestCase):
+  async def asyncTearDown(self):
+    await aio.close()
+
+  @patch("wikiedits.aio.AsyncTransport.get", new_callable=AsyncMock)
+  async def test_edits_per_page(self, mock_get):
+    """Test async edits_per_page builds the same URL as the sync API"""
+    mock_get.return_value = (200, {}, _body({
+      "items": [{"results": [
+        {"edits": 45, "timestamp": "20250101"},
+        {"edits": 52, "timestamp": "20250102"},
+      ]}]
+    }))
+
+    result = await aio.edits_per_page(
+      "en.wikipedia.org", "Python", "daily", "20250101", "20250102"
+    )
+
+    mock_get.assert_awaited_once_with(
+      "https://wikimedia.org/api/rest_v1/metrics/edits/per-page/"
+      "en.wikipedia.org/Python/all-editor-types/daily/20250101/20250102",
+      headers={
+        "User-Agent": "wikiedits-api/0.1.0",
+        "Accept": "application/json"
+      },
+      timeout=30,
+    )
+    self.assertEqual([r["edits"] for r in result], [45, 52])
+
+  @patch("wikiedits.aio.AsyncTransport.get", new_callable=AsyncMock)
+  async def test_top_by_edits(self, mock_get):
+    """Test async top_by_edits returns the top list"""
+    mock_get.return_value = (200, {}, _body({
+      "items": [{"results": [{"top": [
+        {"page_title": "Python", "edits": 10, "rank": 1}
+      ]}]}]
+    }))
+
+    result = await aio.top_by_edits("en.wikipedia.org", "2025-01-01")
+
+    url = mock_get.await_args.args[0]
+    self.assertTrue(url.endswith(
+      "edited-pages/top-by-edits/en.wikipedia.org/all-editor-types/"
+      "all-page-types/2025/01/01"
+    ))
+    self.assertEqual(result[0]["page_title"], "Python")
+
+  @patch("wikiedits.aio.AsyncTransport.get", new_callable=AsyncMock)
+  async def test_concurrent_edits(self, mock_get):
+    """Test that client helpers can be gathered on one event loop"""
+    mock_get.return_value = (200, {}, _body({
+      "items": [{"results": [
+        {"edits": 1, "timestamp": "20250101"},
+        {"edits": 2, "timestamp": "20250102"},
+      ]}]
+    }))
+
+    results = await asyncio.gather(*[
+      aio.edits("20250101", "20250103", page_title=f"Page_{i}")
+      for i in range(20)
+    ])
+
+    self.assertEqual(results, [3] * 20)
+    self.assertEqual(mock_get.await_count, 20)
+
+  @patch("wikiedits.aio.AsyncTransport.get", new_callable=AsyncMock)
+  async def test_http_error(self, mock_get):
+    """Test that HTTP errors raise RequestException like the sync API"""
+    mock_get.return_value = (404, {}, b"Not Found")
+
+    with self.assertRaises(requests.exceptions.RequestException) as context:
+      await aio.edits_aggregate("en.wikipedia.org", "daily", "20250101",
+                                "20250102")
+
+    self.assertIn("HTTP error 404", str(context.exception))
+    self.assertIn("Not Found", str(context.exception))
+
+  @patch("wikiedits.aio.AsyncTransport.get", new_callable=AsyncMock)
+  async def test_timeout_error(self, mock_get):
+    """Test that timeouts raise RequestException like the sync API"""
+    mock_get.side_effect = asyncio.TimeoutError()
+
+    with self.assertRaises(requests.exceptions.RequestException) as context:
+      await aio.new_pages("en.wikipedia.org", "daily", "20250101", "20250102")
+
+    self.assertIn("Request timed out", str(context.exception))
+
+  @patch("wikiedits.aio.AsyncTransport.get", new_callable=AsyncMock)
+  async def test_invalid_json(self, mock_get):
+    """Test that invalid JSON raises RequestException"""
+    mock_get.return_value = (200, {}, b"not json")
+
+    with self.assertRaises(requests.exceptions.RequestException) as context:
+      await aio.edited_pages("en.wikipedia.org", "daily", "20250101",
+                             "20250102")
+
+    self.assertIn("Invalid JSON response", str(context.exception))
+
+  async def test_top_invalid_by(self):
+    """Test that top() rejects an unknown metric"""
+    with self.assertRaises(ValueError):
+      await aio.top("20250101", by="invalid-metric")
+
+  def test_configure_sets_concurrency(self):
+    """Test that configure() replaces the shared transport limits"""
+    aio.configure(concurrency=5, pool_size=7)
+
+    self.assertEqual(aio.get_transport().concurrency, 5)
+    self.assertEqual(aio.get_transport().pool_size, 7)
+
+
+if __name__ == "__main__":
+  unittest.main()
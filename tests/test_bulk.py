@@ -0,0 +1,131 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from wikiedits.bulk import (
+    bytes_diff_abs_per_page_many,
+    bytes_diff_net_per_page_many,
+    edits_per_page_many,
+)
+
+
+class TestBulk(unittest.TestCase):
+  @patch("wikiedits.bulk.edits_per_page")
+  def test_edits_per_page_many_keyed_by_title(self, mock_per_page):
+    """Test that every title gets its own result"""
+    mock_per_page.side_effect = lambda **kwargs: [
+      {"edits": len(kwargs["page_title"]), "timestamp": "20250101"}
+    ]
+
+    titles = ["A", "BB", "CCC"]
+    results = {
+      r.page_title: r
+      for r in edits_per_page_many(
+        "en.wikipedia.org", titles, "daily", "20250101", "20250102"
+      )
+    }
+
+    self.assertEqual(set(results), set(titles))
+    for title in titles:
+      self.assertIsNone(results[title].error)
+      self.assertEqual(results[title].results[0]["edits"], len(title))
+    mock_per_page.assert_any_call(
+      project="en.wikipedia.org",
+      page_title="BB",
+      granularity="daily",
+      start="20250101",
+      end="20250102",
+      editor_type="all-editor-types",
+    )
+
+  @patch("wikiedits.bulk.edits_per_page")
+  def test_failed_title_does_not_fail_batch(self, mock_per_page):
+    """Test that one failing title is reported per item"""
+    def fetch(**kwargs):
+      if kwargs["page_title"] == "Missing":
+        raise requests.exceptions.RequestException("HTTP error 404: Not Found")
+      return [{"edits": 1, "timestamp": "20250101"}]
+
+    mock_per_page.side_effect = fetch
+
+    results = {
+      r.page_title: r
+      for r in edits_per_page_many(
+        "en.wikipedia.org", ["Ok", "Missing"], "daily", "20250101", "20250102"
+      )
+    }
+
+    self.assertIsNone(results["Missing"].results)
+    self.assertIn("404", str(results["Missing"].error))
+    self.assertEqual(results["Ok"].results, [{"edits": 1, "timestamp": "20250101"}])
+
+  @patch("wikiedits.bulk.edits_per_page")
+  def test_results_stream_in_completion_order(self, mock_per_page):
+    """Test that finished titles are yielded before slow ones complete"""
+    release = threading.Event()
+
+    def fetch(**kwargs):
+      if kwargs["page_title"] == "Slow":
+        release.wait(5)
+      return []
+
+    mock_per_page.side_effect = fetch
+
+    results = edits_per_page_many(
+      "en.wikipedia.org", ["Slow", "Fast"], "daily", "20250101", "20250102",
+      max_workers=2,
+    )
+    first = next(results)
+    release.set()
+    second = next(results)
+
+    self.assertEqual(first.page_title, "Fast")
+    self.assertEqual(second.page_title, "Slow")
+
+  @patch("wikiedits.bulk.edits_per_page")
+  def test_titles_consumed_lazily(self, mock_per_page):
+    """Test that a large title iterable is not queued all at once"""
+    mock_per_page.return_value = []
+    consumed = []
+
+    def titles():
+      for i in range(1000):
+        consumed.append(i)
+        yield f"Page_{i}"
+
+    results = edits_per_page_many(
+      "en.wikipedia.org", titles(), "daily", "20250101", "20250102",
+      max_workers=2,
+    )
+    next(results)
+
+    self.assertLessEqual(len(consumed), 5)
+    results.close()
+
+  @patch("wikiedits.bulk.bytes_diff_net_per_page")
+  @patch("wikiedits.bulk.bytes_diff_abs_per_page")
+  def test_bytes_variants_route_to_matching_function(self, mock_abs, mock_net):
+    """Test that the bytes variants call their per-page functions"""
+    mock_abs.return_value = [{"abs_bytes_diff": 10}]
+    mock_net.return_value = [{"net_bytes_diff": -5}]
+
+    abs_results = list(bytes_diff_abs_per_page_many(
+      "en.wikipedia.org", ["A"], "daily", "20250101", "20250102"))
+    net_results = list(bytes_diff_net_per_page_many(
+      "en.wikipedia.org", ["A"], "daily", "20250101", "20250102"))
+
+    self.assertEqual(abs_results[0].results, [{"abs_bytes_diff": 10}])
+    self.assertEqual(net_results[0].results, [{"net_bytes_diff": -5}])
+
+  def test_invalid_max_workers(self):
+    """Test that max_workers below one is rejected"""
+    with self.assertRaises(ValueError):
+      list(edits_per_page_many(
+        "en.wikipedia.org", ["A"], "daily", "20250101", "20250102",
+        max_workers=0))
+
+
+if __name__ == "__main__":
+  unittest.main()
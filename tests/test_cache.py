@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import Mock, patch
+
+from wikiedits.api import edits_aggregate
+from wikiedits.cache import ResponseCache, disable_cache, enable_cache
+
+PAYLOAD = {"items": [{"results": [{"edits": 7, "timestamp": "20240101"}]}]}
+
+
+class TestResponseCache(unittest.TestCase):
+  def setUp(self):
+    self.cache = ResponseCache(":memory:", recent_days=3, recent_ttl=60)
+
+  def tearDown(self):
+    self.cache.close()
+
+  def test_past_range_cached_forever(self):
+    """Test that ranges ending well in the past never expire"""
+    ttl = self.cache.ttl_for(
+      "en.wikipedia.org/all-editor-types/all-page-types/daily/20240101/20241231",
+      today=date(2025, 6, 1),
+    )
+    self.assertIsNone(ttl)
+
+  def test_recent_range_gets_short_ttl(self):
+    """Test that ranges touching the last few days expire"""
+    ttl = self.cache.ttl_for(
+      "en.wikipedia.org/all-editor-types/all-page-types/daily/20250501/20250530",
+      today=date(2025, 6, 1),
+    )
+    self.assertEqual(ttl, 60)
+
+  def test_top_by_date_parsed(self):
+    """Test that top-by YYYY/MM/DD arguments are recognized"""
+    args = "en.wikipedia.org/all-editor-types/all-page-types/2024/01/01"
+    self.assertIsNone(self.cache.ttl_for(args, today=date(2025, 6, 1)))
+    self.assertEqual(self.cache.ttl_for(args, today=date(2024, 1, 2)), 60)
+
+  def test_get_set_roundtrip(self):
+    """Test that stored responses are returned unchanged"""
+    self.cache.set("https://example.com/a", PAYLOAD, None)
+    self.assertEqual(self.cache.get("https://example.com/a"), PAYLOAD)
+    self.assertIsNone(self.cache.get("https://example.com/b"))
+
+  @patch("wikiedits.cache.time.time")
+  def test_expired_entries_are_misses(self, mock_time):
+    """Test that entries past their TTL are not returned"""
+    mock_time.return_value = 1000.0
+    self.cache.set("https://example.com/a", PAYLOAD, 60)
+
+    mock_time.return_value = 1059.0
+    self.assertEqual(self.cache.get("https://example.com/a"), PAYLOAD)
+    mock_time.return_value = 1061.0
+    self.assertIsNone(self.cache.get("https://example.com/a"))
+    self.assertEqual(self.cache.purge_expired(), 1)
+
+  def test_persists_across_instances(self):
+    """Test that a file-backed cache survives reopening"""
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, "nested", "cache.sqlite")
+      first = ResponseCache(path)
+      first.set("https://example.com/a", PAYLOAD, None)
+      first.close()
+
+      second = ResponseCache(path)
+      self.assertEqual(second.get("https://example.com/a"), PAYLOAD)
+      second.close()
+
+
+class TestMakeRequestCache(unittest.TestCase):
+  def setUp(self):
+    enable_cache(":memory:")
+
+  def tearDown(self):
+    disable_cache()
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_repeated_call_served_from_cache(self, mock_get):
+    """Test that a second identical request does not hit the network"""
+    mock_response = Mock()
+    mock_response.json.return_value = PAYLOAD
+    mock_response.raise_for_status = Mock()
+    mock_get.return_value = mock_response
+
+    first = edits_aggregate("en.wikipedia.org", "daily", "20240101", "20240102")
+    second = edits_aggregate("en.wikipedia.org", "daily", "20240101", "20240102")
+
+    mock_get.assert_called_once()
+    self.assertEqual(first, second)
+    self.assertEqual(second[0]["edits"], 7)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_cache_disabled_by_default(self, mock_get):
+    """Test that no caching happens once the cache is disabled"""
+    disable_cache()
+    mock_response = Mock()
+    mock_response.json.return_value = PAYLOAD
+    mock_response.raise_for_status = Mock()
+    mock_get.return_value = mock_response
+
+    edits_aggregate("en.wikipedia.org", "daily", "20240101", "20240102")
+    edits_aggregate("en.wikipedia.org", "daily", "20240101", "20240102")
+
+    self.assertEqual(mock_get.call_count, 2)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,123 @@
+import os
+import tempfile
+import time
+import unittest
+from datetime import timedelta
+from unittest.mock import Mock
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from wikiedits import ratelimit
+
+from wikiedits.api import _make_request
+from wikiedits.cassette import (
+    Cassette,
+    Interaction,
+    RecordingTransport,
+    ReplayTransport,
+)
+from wikiedits.transport import is_rate_limited, set_transport
+
+BODY = b'{"items": [{"results": []}]}'
+
+
+def _live_response(status=200, body=BODY):
+  response = requests.Response()
+  response.status_code = status
+  response.headers = CaseInsensitiveDict(
+    {"Content-Type": "application/json", "Server": "x"}
+  )
+  response._content = body
+  response.elapsed = timedelta(seconds=0.02)
+  return response
+
+
+class TestCassette(unittest.TestCase):
+  def setUp(self):
+    self.tmp = tempfile.TemporaryDirectory()
+    self.path = os.path.join(self.tmp.name, "traffic.cassette")
+
+  def tearDown(self):
+    set_transport(None)
+    ratelimit.configure()
+    self.tmp.cleanup()
+
+  def test_put_get_roundtrip(self):
+    """Test that interactions survive a round trip, latest wins"""
+    cassette = Cassette(self.path)
+    cassette.put(Interaction("u", 200, {"Content-Type": "a"}, b"old", 0.1))
+    cassette.put(Interaction("u", 200, {"Content-Type": "a"}, b"new" * 100, 0.2))
+
+    self.assertEqual(len(cassette), 1)
+    self.assertEqual(cassette.get("u"),
+                     Interaction("u", 200, {"Content-Type": "a"}, b"new" * 100, 0.2))
+    self.assertIsNone(cassette.get("missing"))
+    cassette.close()
+
+  def test_record_then_replay(self):
+    """Test that a recorded session replays through the API offline"""
+    ratelimit.configure(backoff_base=0)
+    inner = Mock()
+    inner.get.side_effect = [_live_response(503), _live_response()]
+    recorder = RecordingTransport(self.path, inner=inner)
+    set_transport(recorder)
+
+    live = _make_request("edits/aggregate", "args", api_base_url="https://x")
+    set_transport(ReplayTransport(self.path))
+    replayed = _make_request("edits/aggregate", "args", api_base_url="https://x")
+
+    self.assertEqual(live, replayed)
+    self.assertEqual(replayed, {"items": [{"results": []}]})
+    inner.close.assert_called_once()
+
+    cassette = Cassette(self.path)
+    self.assertEqual(len(cassette), 1)  # the 503 was not recorded
+    self.assertEqual(cassette.get("https://x/edits/aggregate/args").headers,
+                     {"Content-Type": "application/json"})
+    cassette.close()
+
+  def test_replayed_response_behaves_like_requests(self):
+    """Test status, headers, errors and latency of replayed responses"""
+    cassette = Cassette(self.path)
+    cassette.put(Interaction("u404", 404, {}, b"Not found", 0.05))
+    cassette.close()
+
+    replay = ReplayTransport(self.path, latency=0.01, recorded_latency=True)
+    started = time.perf_counter()
+    response = replay.get("u404", headers={}, timeout=30)
+
+    self.assertGreaterEqual(time.perf_counter() - started, 0.06)
+    self.assertEqual(response.status_code, 404)
+    self.assertEqual(response.text, "Not found")
+    self.assertEqual(response.elapsed, timedelta(seconds=0.05))
+    with self.assertRaises(requests.exceptions.HTTPError):
+      response.raise_for_status()
+    with self.assertRaises(requests.exceptions.ConnectionError):
+      replay.get("unrecorded", headers={}, timeout=30)
+    replay.close()
+
+  def test_replay_skips_rate_limiter(self):
+    """Test that replayed requests are not throttled, recorded ones are"""
+    cassette = Cassette(self.path)
+    for i in range(20):
+      cassette.put(Interaction(f"https://x/edits/aggregate/{i}", 200, {}, BODY, 0.0))
+    cassette.close()
+    ratelimit.configure(rate=1, burst=1)
+
+    set_transport(ReplayTransport(self.path))
+    started = time.perf_counter()
+    for i in range(20):
+      _make_request("edits/aggregate", str(i), api_base_url="https://x")
+
+    self.assertLess(time.perf_counter() - started, 1.0)
+    self.assertTrue(is_rate_limited(RecordingTransport(self.path, inner=Mock())))
+
+  def test_replay_requires_cassette(self):
+    """Test that replaying a missing cassette fails fast"""
+    with self.assertRaises(FileNotFoundError):
+      ReplayTransport(os.path.join(self.tmp.name, "missing.cassette"))
+
+
+if __name__ == "__main__":
+  unittest.main()
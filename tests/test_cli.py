@@ -0,0 +1,130 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import Mock, patch
+
+from wikiedits import cli, ratelimit, transport
+
+
+def _response(url, **kwargs):
+  response = Mock()
+  response.status_code = 200
+  response.raise_for_status = Mock()
+  if "top-by-edits" in url:
+    top = [{"page_title": f"P{i}", "edits": 10 - i, "rank": i} for i in range(1, 4)]
+    response.json.return_value = {"items": [{"results": [{"top": top}]}]}
+  else:
+    response.json.return_value = {"items": [{"results": [
+      {"timestamp": "2024-01-01T00:00:00.000Z", "edits": 5},
+      {"timestamp": "2024-01-02T00:00:00.000Z", "edits": 7},
+    ]}]}
+  return response
+
+
+class TestCli(unittest.TestCase):
+  def setUp(self):
+    self.tmp = tempfile.TemporaryDirectory()
+
+  def tearDown(self):
+    self.tmp.cleanup()
+    transport.set_transport(None)
+    ratelimit.configure()
+
+  def _manifest(self, name, content):
+    path = os.path.join(self.tmp.name, name)
+    with open(path, "w") as f:
+      f.write(content)
+    return path
+
+  def _run(self, *argv):
+    output = io.StringIO()
+    with redirect_stdout(output):
+      status = cli.main(list(argv))
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    return status, sorted(records, key=lambda r: r["line"])
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_jsonl_manifest(self, mock_get):
+    """Test that each JSONL query produces one NDJSON record"""
+    mock_get.side_effect = _response
+    path = self._manifest("queries.jsonl", "\n".join([
+      '{"function": "edits", "start": "20240101", "end": "20240103"}',
+      '{"function": "edits_aggregate", "project": "en.wikipedia.org",'
+      ' "granularity": "daily", "start": "20240101", "end": "20240103"}',
+      "",
+      '{"function": "top", "date": "20240101", "count": 2}',
+    ]))
+
+    status, records = self._run(path, "--parallel", "2", "--rate", "1000")
+
+    self.assertEqual(status, 0)
+    self.assertEqual([r["line"] for r in records], [1, 2, 4])
+    self.assertEqual(records[0]["result"], 12)
+    self.assertEqual(len(records[1]["result"]), 2)
+    self.assertEqual([p["page_title"] for p in records[2]["result"]], ["P1", "P2"])
+    self.assertEqual(records[2]["query"]["function"], "top")
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_csv_manifest_converts_ints(self, mock_get):
+    """Test CSV rows, empty cells and int conversion"""
+    mock_get.side_effect = _response
+    path = self._manifest("queries.csv", (
+      "function,start,end,date,count\n"
+      "edits,20240101,20240103,,\n"
+      "top,,,20240101,1\n"
+    ))
+
+    status, records = self._run(path)
+
+    self.assertEqual(status, 0)
+    self.assertEqual(records[0]["result"], 12)
+    self.assertEqual(len(records[1]["result"]), 1)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_csv_manifest_converts_bools(self, mock_get):
+    """Test bool conversion and that invalid values fail only their row"""
+    mock_get.side_effect = _response
+    path = self._manifest("queries.csv", (
+      "function,date,count,compact\n"
+      "top,20240101,2,false\n"
+      "top,20240101,2,True\n"
+      "top,20240101,2,maybe\n"
+    ))
+
+    status, records = self._run(path)
+
+    self.assertEqual(status, 1)
+    self.assertEqual(records[0]["result"][0]["page_title"], "P1")
+    self.assertEqual(records[1]["result"][0], ["P1", 9, 1, None])
+    self.assertIn("Invalid value for compact", records[2]["error"])
+
+  def test_bad_rows_are_reported(self):
+    """Test that invalid rows become error records and a non-zero status"""
+    path = self._manifest("queries.jsonl", "\n".join([
+      "not json",
+      '["a list"]',
+      '{"function": "nope"}',
+      '{"function": "edits", "start": "20240101", "bogus": 1}',
+    ]))
+
+    status, records = self._run(path)
+
+    self.assertEqual(status, 1)
+    self.assertEqual(len(records), 4)
+    self.assertTrue(all("error" in r for r in records))
+    self.assertIn("Unknown function", records[2]["error"])
+    self.assertIn("Unexpected argument", records[3]["error"])
+
+  def test_read_manifest_is_lazy(self):
+    """Test that rows are read on demand rather than all at once"""
+    stream = io.StringIO('{"function": "edits"}\n' * 1000)
+    rows = cli.read_manifest(stream, "jsonl")
+    next(rows)
+    self.assertLess(stream.tell(), len(stream.getvalue()))
+
+
+if __name__ == "__main__":
+  unittest.main()
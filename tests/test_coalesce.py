@@ -0,0 +1,90 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from wikiedits.api import top_by_edits
+from wikiedits.coalesce import SingleFlight
+
+PAYLOAD = {"items": [{"results": [{"top": [
+  {"page_title": "Python", "edits": 10, "rank": 1}
+]}]}]}
+
+
+class TestSingleFlight(unittest.TestCase):
+  def test_concurrent_calls_share_one_execution(self):
+    """Test that callers arriving during a call wait for its result"""
+    group = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+      calls.append(1)
+      started.set()
+      release.wait(5)
+      return {"value": 42}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+      leader = executor.submit(group.do, "key", slow)
+      started.wait(5)
+      followers = [executor.submit(group.do, "key", slow) for _ in range(4)]
+      # Give every follower time to join the in-flight call
+      threading.Event().wait(0.2)
+      release.set()
+      results = [leader.result()] + [f.result() for f in followers]
+
+    self.assertEqual(len(calls), 1)
+    self.assertTrue(all(r is results[0] for r in results))
+    self.assertEqual(group.in_flight(), 0)
+
+  def test_error_is_shared_and_not_remembered(self):
+    """Test that a failure propagates and the next call runs again"""
+    group = SingleFlight()
+
+    def fail():
+      raise RuntimeError("boom")
+
+    with self.assertRaises(RuntimeError):
+      group.do("key", fail)
+    self.assertEqual(group.do("key", lambda: 1), 1)
+
+  def test_different_keys_run_separately(self):
+    """Test that distinct keys are not coalesced"""
+    group = SingleFlight()
+    self.assertEqual(group.do("a", lambda: 1), 1)
+    self.assertEqual(group.do("b", lambda: 2), 2)
+
+
+class TestRequestCoalescing(unittest.TestCase):
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_identical_requests_make_one_http_call(self, mock_get):
+    """Test that concurrent identical top_by_edits calls share one request"""
+    release = threading.Event()
+
+    def slow_get(*args, **kwargs):
+      release.wait(5)
+      response = Mock()
+      response.json.return_value = PAYLOAD
+      response.raise_for_status = Mock()
+      return response
+
+    mock_get.side_effect = slow_get
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+      futures = [
+        executor.submit(top_by_edits, "en.wikipedia.org", "20250101")
+        for _ in range(8)
+      ]
+      # Give every worker time to join the in-flight request
+      threading.Event().wait(0.2)
+      release.set()
+      results = [f.result() for f in futures]
+
+    mock_get.assert_called_once()
+    self.assertTrue(all(r == results[0] for r in results))
+    self.assertEqual(results[0][0]["page_title"], "Python")
+
+
+if __name__ == "__main__":
+  unittest.main()
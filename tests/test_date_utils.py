@@ -0,0 +1,66 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from wikiedits.date_utils import add_months, parse_date, validate_dates
+
+
+class TestParseDate(unittest.TestCase):
+  @patch("dateutil.parser.parse")
+  def test_common_formats_skip_dateutil(self, mock_parse):
+    """Test that YYYYMMDD and YYYY-MM-DD use the strict fast path"""
+    self.assertEqual(parse_date("20250315"), datetime(2025, 3, 15))
+    self.assertEqual(parse_date("2025-03-15"), datetime(2025, 3, 15))
+    mock_parse.assert_not_called()
+
+  def test_free_form_falls_back_to_dateutil(self):
+    """Test that other formats are still accepted"""
+    self.assertEqual(parse_date("March 15, 2025"), datetime(2025, 3, 15))
+    self.assertEqual(parse_date("03/15/2025"), datetime(2025, 3, 15))
+
+  def test_invalid_dates_raise(self):
+    """Test that impossible dates are rejected on the fast path"""
+    with self.assertRaises(ValueError):
+      parse_date("20250230")
+    with self.assertRaises(ValueError):
+      parse_date("2025-13-01")
+
+
+class TestValidateDates(unittest.TestCase):
+  def test_normalizes_formats(self):
+    """Test that mixed input formats normalize to YYYYMMDD"""
+    self.assertEqual(
+      validate_dates("daily", "2025-01-01", "March 1, 2025"),
+      ("20250101", "20250301"),
+    )
+
+  def test_equal_dates(self):
+    """Test that equal dates expand to one day or one month"""
+    self.assertEqual(validate_dates("daily", "20241231", "20241231"),
+                     ("20241231", "20250101"))
+    self.assertEqual(validate_dates("monthly", "20241215", "2024-12-15"),
+                     ("20241201", "20250101"))
+
+  def test_errors_are_not_memoized(self):
+    """Test that invalid input raises every time"""
+    for _ in range(2):
+      with self.assertRaises(ValueError):
+        validate_dates("daily", "20250102", "20250101")
+      with self.assertRaises(ValueError):
+        validate_dates("hourly", "20250101", "20250101")
+
+  def test_results_are_memoized(self):
+    """Test that repeated calls are served from the memo"""
+    validate_dates.cache_clear()
+    validate_dates("daily", "20250101", "20250201")
+    validate_dates("daily", "20250101", "20250201")
+    self.assertEqual(validate_dates.cache_info().hits, 1)
+
+  def test_add_months(self):
+    """Test month arithmetic across year boundaries"""
+    self.assertEqual(add_months(datetime(2024, 12, 15), 1), datetime(2025, 1, 1))
+    self.assertEqual(add_months(datetime(2024, 1, 31), 13), datetime(2025, 2, 1))
+
+
+if __name__ == "__main__":
+  unittest.main()
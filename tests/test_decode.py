@@ -0,0 +1,90 @@
+import json
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from wikiedits import decode
+from wikiedits.api import _make_request
+
+PAYLOAD = {"items": [{"results": [
+  {"timestamp": "2024-01-01T00:00:00.000Z", "edits": 5},
+  {"timestamp": "2024-01-02T00:00:00.000Z", "edits": 7},
+], "page-title": "Café"}]}
+
+
+def _response(body: bytes, status: int = 200) -> requests.Response:
+  response = requests.Response()
+  response.status_code = status
+  response._content = body
+  response.url = "https://example.org/"
+  return response
+
+
+class TestDecode(unittest.TestCase):
+  def test_default_is_fastest_installed(self):
+    """Test that set_decoder() picks the first available decoder"""
+    decode.set_decoder()
+    self.assertEqual(decode.get_decoder(), next(iter(decode.DECODERS)))
+    self.assertIn("json", decode.DECODERS)
+
+  def test_fast_decoders_imported_lazily(self):
+    """Test that importing the module does not import orjson or msgspec"""
+    code = (
+      "import sys, wikiedits.decode as d; "
+      "print(sorted({'orjson', 'msgspec'} & set(sys.modules)))"
+    )
+    output = subprocess.run(
+      [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    self.assertEqual(output.strip(), "[]")
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_make_request_with_auto_selected_decoder(self, mock_get):
+    """Test a request end to end with the decoder picked on first use"""
+    mock_get.return_value = _response(json.dumps(PAYLOAD).encode())
+    decode.set_decoder()
+    self.assertEqual(_make_request("edits/per-page", "auto/args"), PAYLOAD)
+    self.assertEqual(decode.get_decoder(), decode.DECODERS[0])
+
+  def test_unknown_decoder(self):
+    """Test that an unknown or missing decoder raises ValueError"""
+    with self.assertRaises(ValueError):
+      decode.set_decoder("simplejson")
+    self.assertEqual(decode.get_decoder(), "json")
+
+  def test_decoders_agree(self):
+    """Test that every installed decoder returns the same plain objects"""
+    body = json.dumps(PAYLOAD).encode()
+    for name in decode.DECODERS:
+      with self.subTest(decoder=name):
+        decode.set_decoder(name)
+        result = decode.decode(body)
+        self.assertEqual(result, PAYLOAD)
+        self.assertIs(type(result), dict)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_make_request_with_each_decoder(self, mock_get):
+    """Test that responses decode the same through every decoder"""
+    mock_get.side_effect = lambda *a, **k: _response(json.dumps(PAYLOAD).encode())
+    for name in decode.DECODERS:
+      with self.subTest(decoder=name):
+        decode.set_decoder(name)
+        self.assertEqual(_make_request("edits/per-page", f"{name}/args"), PAYLOAD)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_invalid_json(self, mock_get):
+    """Test that an undecodable body raises RequestException"""
+    mock_get.side_effect = lambda *a, **k: _response(b"<html>oops</html>")
+    for name in decode.DECODERS:
+      with self.subTest(decoder=name):
+        decode.set_decoder(name)
+        with self.assertRaises(requests.exceptions.RequestException) as ctx:
+          _make_request("edits/per-page", f"{name}/invalid")
+        self.assertIn("Invalid JSON", str(ctx.exception))
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -5,7 +5,7 @@ from wikiedits.api import edited_pages
 
 
 class TestEditedPages(unittest.TestCase):
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edited_pages_basic(self, mock_get):
     """Test basic edited pages functionality"""
     mock_response = Mock()
@@ -48,7 +48,7 @@ class TestEditedPages(unittest.TestCase):
     self.assertEqual(result[0]["edited_pages"], 2500)
     self.assertEqual(result[1]["edited_pages"], 2800)
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edited_pages_with_custom_parameters(self, mock_get):
     """Test edited pages with all custom parameters"""
     mock_response = Mock()
@@ -80,7 +80,7 @@ class TestEditedPages(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edited_pages_with_default_parameters(self, mock_get):
     """Test edited pages with default parameters"""
     mock_response = Mock()
@@ -104,7 +104,7 @@ class TestEditedPages(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edited_pages_with_partial_custom_parameters(self, mock_get):
     """Test edited pages with some custom parameters"""
     mock_response = Mock()
@@ -135,7 +135,7 @@ class TestEditedPages(unittest.TestCase):
     )
 
   @patch("wikiedits.api.validate_dates")
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edited_pages_date_validation(self, mock_get, mock_validate):
     """Test that date validation is called"""
     mock_response = Mock()
@@ -5,7 +5,7 @@ from wikiedits.api import edits_aggregate
 
 
 class TestEditsAggregate(unittest.TestCase):
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edits_aggregate_basic(self, mock_get):
     """Test basic edits aggregate functionality"""
     mock_response = Mock()
@@ -49,7 +49,7 @@ class TestEditsAggregate(unittest.TestCase):
     self.assertEqual(result[0]["edits"], 1000)
     self.assertEqual(result[1]["edits"], 1200)
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edits_aggregate_with_custom_parameters(self, mock_get):
     """Test edits aggregate with custom parameters"""
     mock_response = Mock()
@@ -79,7 +79,7 @@ class TestEditsAggregate(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edits_aggregate_with_default_parameters(self, mock_get):
     """Test edits aggregate with default parameters"""
     mock_response = Mock()
@@ -104,7 +104,7 @@ class TestEditsAggregate(unittest.TestCase):
     )
 
   @patch("wikiedits.api.validate_dates")
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edits_aggregate_date_validation(self, mock_get, mock_validate):
     """Test that date validation is called"""
     mock_response = Mock()
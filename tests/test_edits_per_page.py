@@ -5,7 +5,7 @@ from wikiedits.api import edits_per_page
 
 
 class TestEditsPerPage(unittest.TestCase):
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edits_per_page_basic(self, mock_get):
     """Test basic edits per page functionality"""
     mock_response = Mock()
@@ -51,7 +51,7 @@ class TestEditsPerPage(unittest.TestCase):
     self.assertEqual(result[0]["edits"], 45)
     self.assertEqual(result[1]["edits"], 52)
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edits_per_page_with_custom_parameters(self, mock_get):
     """Test edits per page with custom parameters"""
     mock_response = Mock()
@@ -81,7 +81,7 @@ class TestEditsPerPage(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edits_per_page_with_default_parameters(self, mock_get):
     """Test edits per page with default parameters"""
     mock_response = Mock()
@@ -109,7 +109,7 @@ class TestEditsPerPage(unittest.TestCase):
     )
 
   @patch("wikiedits.api.validate_dates")
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_edits_per_page_date_validation(self, mock_get, mock_validate):
     """Test that date validation is called"""
     mock_response = Mock()
@@ -0,0 +1,58 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from tests.helpers import series_response
+from wikiedits.client import edits, edits_windows
+
+
+def _response(url, **kwargs):
+  return series_response(url, value=lambda day: day.day * 3)
+
+
+class TestEditsWindows(unittest.TestCase):
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_matches_edits_per_window(self, mock_get):
+    """Test that every window total equals a separate edits() call"""
+    mock_get.side_effect = _response
+    start = datetime(2024, 1, 1)
+    windows = [
+      ((start + timedelta(days=i)).strftime("%Y%m%d"),
+       (start + timedelta(days=i + 7)).strftime("%Y%m%d"))
+      for i in range(0, 366, 5)
+    ]
+    windows.append(("2024-03-01", "2024-03-01"))
+    windows.append(("20240101", "20241231"))
+
+    totals = edits_windows(windows, project="en.wikipedia.org", page_title="A")
+
+    # The enclosing range is fetched once, as two yearly shards
+    fetched = sorted(
+      tuple(call.args[0].split("/")[-2:]) for call in mock_get.call_args_list
+    )
+    self.assertEqual(fetched, [("20240101", "20241231"), ("20241231", "20250107")])
+    expected = [
+      edits(s, e, project="en.wikipedia.org", page_title="A") for s, e in windows
+    ]
+    self.assertEqual(totals, expected)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_aggregate_and_empty(self, mock_get):
+    """Test routing to the aggregate endpoint and an empty window list"""
+    mock_get.side_effect = _response
+
+    self.assertEqual(edits_windows([]), [])
+    mock_get.assert_not_called()
+
+    totals = edits_windows([("20240105", "20240107"), ("20240101", "20240102")])
+    self.assertIn("/edits/aggregate/", mock_get.call_args.args[0])
+    self.assertEqual(totals, [(5 + 6) * 3, 3])
+
+  def test_invalid_window(self):
+    """Test that a reversed window raises ValueError before any request"""
+    with self.assertRaises(ValueError):
+      edits_windows([("20240110", "20240101")])
+
+
+if __name__ == "__main__":
+  unittest.main()
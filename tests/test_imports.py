@@ -0,0 +1,56 @@
+import subprocess
+import sys
+import unittest
+
+import wikiedits
+
+HEAVY_MODULES = ("requests", "urllib3", "dateutil", "numpy", "aiohttp")
+
+
+def _run(code: str) -> str:
+  return subprocess.run(
+    [sys.executable, "-c", code], check=True, capture_output=True, text=True
+  ).stdout
+
+
+class TestLazyImports(unittest.TestCase):
+  def test_import_skips_heavy_dependencies(self):
+    """Test that importing the package loads no heavy dependency"""
+    loaded = _run(
+      "import sys, wikiedits\n"
+      f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    self.assertEqual(loaded.strip(), "")
+
+  def test_dependencies_load_on_first_use(self):
+    """Test that using a public name imports its module"""
+    loaded = _run(
+      "import sys, wikiedits\n"
+      "wikiedits.edits_aggregate\n"
+      "print('requests' in sys.modules)"
+    )
+    self.assertEqual(loaded.strip(), "True")
+
+  def test_all_public_names_resolve(self):
+    """Test that every name in __all__ resolves to the defining object"""
+    from wikiedits import api, series
+
+    for name in wikiedits.__all__:
+      with self.subTest(name=name):
+        self.assertIsNotNone(getattr(wikiedits, name))
+    self.assertIs(wikiedits.edits_aggregate, api.edits_aggregate)
+    self.assertIs(wikiedits.TimeSeries, series.TimeSeries)
+    self.assertIs(wikiedits.api, api)
+
+  def test_all_matches_lazy_table(self):
+    """Test that __all__ and the lazy name table list the same names"""
+    self.assertCountEqual(wikiedits.__all__, wikiedits._LAZY_NAMES)
+
+  def test_unknown_attribute(self):
+    """Test that unknown names still raise AttributeError"""
+    with self.assertRaises(AttributeError):
+      wikiedits.not_a_function
+
+
+if __name__ == "__main__":
+  unittest.main()
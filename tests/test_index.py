@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import patch
+
+from tests.helpers import daily_results, series_response
+from wikiedits import client
+from wikiedits.api import edits_per_page
+from wikiedits.index import PrefixSumIndex, day_range
+from wikiedits.segments import (
+    SegmentCache,
+    SeriesKey,
+    disable_segment_cache,
+    enable_segment_cache,
+)
+
+KEY = SeriesKey("edits/per-page", "p", "A", "all-editor-types", None, "daily")
+
+
+class TestPrefixSumIndex(unittest.TestCase):
+  def test_window_totals(self):
+    """Test that any window total matches summing the days"""
+    index = PrefixSumIndex.from_results(
+      daily_results("20250101", "20250201"), "edits", "20250101", "20250201"
+    )
+
+    self.assertEqual(len(index), 31)
+    self.assertEqual(index.end, "20250201")
+    self.assertEqual(index.total("20250101", "20250201"), sum(range(1, 32)))
+    self.assertEqual(index.total("20250110", "20250113"), 10 + 11 + 12)
+    self.assertEqual(index.total("20250110", "20250110"), 0)
+
+  def test_missing_days_and_extension(self):
+    """Test zero-filled gaps and incremental appends"""
+    results = [{"timestamp": "2025-01-02T00:00:00.000Z", "edits": 5}]
+    index = PrefixSumIndex.from_results(results, "edits", "20250101", "20250104")
+    self.assertEqual(index.total("20250101", "20250104"), 5)
+
+    index.extend([1, 2])
+    self.assertEqual(index.end, "20250106")
+    self.assertEqual(index.total("20250103", "20250106"), 3)
+
+  def test_window_outside_index(self):
+    """Test that windows beyond the indexed days are rejected"""
+    index = PrefixSumIndex.from_results([], "edits", "20250101", "20250110")
+    with self.assertRaises(ValueError):
+      index.total("20241231", "20250105")
+    with self.assertRaises(ValueError):
+      index.total("20250105", "20250111")
+
+  def test_day_range(self):
+    """Test day iteration across a month boundary"""
+    self.assertEqual(list(day_range("20250130", "20250202")),
+                     ["20250130", "20250131", "20250201"])
+
+
+class TestSegmentCacheTotals(unittest.TestCase):
+  def test_totals_extend_incrementally(self):
+    """Test that appending days extends the existing index"""
+    cache = SegmentCache()
+    cache.store(KEY, "20250101", "20250201", daily_results("20250101", "20250201"))
+    self.assertEqual(cache.total(KEY, "20250101", "20250108"), 28)
+    index = cache._series[KEY].index
+
+    cache.store(KEY, "20250201", "20250301", daily_results("20250201", "20250301"))
+    self.assertEqual(cache.total(KEY, "20250130", "20250203"), 30 + 31 + 1 + 2)
+    self.assertIs(cache._series[KEY].index, index)
+
+  def test_uncovered_or_overwritten_ranges(self):
+    """Test fallbacks when the index can't answer or is stale"""
+    cache = SegmentCache()
+    self.assertIsNone(cache.total(KEY, "20250101", "20250102"))
+    cache.store(KEY, "20250101", "20250110", daily_results("20250101", "20250110"))
+    cache.store(KEY, "20250115", "20250120", daily_results("20250115", "20250120"))
+    self.assertIsNone(cache.total(KEY, "20250105", "20250116"))
+    self.assertEqual(cache.total(KEY, "20250101", "20250103"), 3)
+
+    cache.store(KEY, "20250101", "20250103",
+                daily_results("20250101", "20250103", value=lambda day: 10))
+    self.assertEqual(cache.total(KEY, "20250101", "20250103"), 20)
+    monthly = KEY._replace(granularity="monthly")
+    self.assertIsNone(cache.total(monthly, "20250101", "20250103"))
+
+
+class TestClientUsesIndex(unittest.TestCase):
+  def setUp(self):
+    enable_segment_cache()
+
+  def tearDown(self):
+    disable_segment_cache()
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_windows_over_cached_history(self, mock_get):
+    """Test that windows inside cached daily data make no requests"""
+    mock_get.side_effect = series_response
+    edits_per_page("en.wikipedia.org", "A", "daily", "20240101", "20250101")
+    mock_get.reset_mock()
+
+    for day in range(1, 24):
+      start = f"202406{day:02d}"
+      end = f"202406{day + 7:02d}"
+      self.assertEqual(
+        client.edits(start, end, project="en.wikipedia.org", page_title="A"),
+        sum(range(day, day + 7)),
+      )
+    mock_get.assert_not_called()
+
+    client.edits("20241201", "20250201", project="en.wikipedia.org",
+                 page_title="A")
+    mock_get.assert_called()
+
+
+if __name__ == "__main__":
+  unittest.main()
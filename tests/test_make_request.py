@@ -3,11 +3,11 @@ from unittest.mock import Mock, patch
 
 import requests
 
-from wikiedits.api import _make_request
+from wikiedits.api import _make_request, get_base_url, set_base_url
 
 
 class TestMakeRequest(unittest.TestCase):
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_make_request_success(self, mock_get):
     """Test successful request"""
     mock_response = Mock()
@@ -30,7 +30,7 @@ class TestMakeRequest(unittest.TestCase):
     )
     self.assertEqual(result, {"success": True, "data": "test"})
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_make_request_with_custom_base_url(self, mock_get):
     """Test request with custom base URL"""
     mock_response = Mock()
@@ -52,7 +52,25 @@ class TestMakeRequest(unittest.TestCase):
       )
     self.assertEqual(result, {"data": "custom"})
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_make_request_with_set_base_url(self, mock_get):
+    """Test that set_base_url changes the default base URL"""
+    mock_response = Mock()
+    mock_response.json.return_value = {"data": "mirror"}
+    mock_response.raise_for_status = Mock()
+    mock_get.return_value = mock_response
+
+    set_base_url("http://localhost:8080/metrics/")
+    try:
+      _make_request("endpoint", "args")
+    finally:
+      set_base_url()
+
+    self.assertEqual(mock_get.call_args.args[0],
+                     "http://localhost:8080/metrics/endpoint/args")
+    self.assertEqual(get_base_url(), "https://wikimedia.org/api/rest_v1/metrics")
+
+  @patch("wikiedits.transport.requests.Session.get")
   def test_make_request_timeout_error(self, mock_get):
     """Test timeout error handling"""
     mock_get.side_effect = requests.exceptions.Timeout()
@@ -66,7 +84,7 @@ class TestMakeRequest(unittest.TestCase):
     )
     self.assertIn(expected_url, str(context.exception))
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_make_request_connection_error(self, mock_get):
     """Test connection error handling"""
     mock_get.side_effect = requests.exceptions.ConnectionError()
@@ -80,7 +98,7 @@ class TestMakeRequest(unittest.TestCase):
     )
     self.assertIn(expected_url, str(context.exception))
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_make_request_http_error(self, mock_get):
     """Test HTTP error handling"""
     mock_response = Mock()
@@ -95,7 +113,7 @@ class TestMakeRequest(unittest.TestCase):
     self.assertIn("HTTP error 404", str(context.exception))
     self.assertIn("Not Found", str(context.exception))
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_make_request_json_decode_error(self, mock_get):
     """Test JSON decode error handling"""
     mock_response = Mock()
@@ -114,7 +132,7 @@ class TestMakeRequest(unittest.TestCase):
     )
     self.assertIn(expected_url, str(context.exception))
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_make_request_generic_request_exception(self, mock_get):
     """Test generic request exception handling"""
     mock_get.side_effect = requests.exceptions.RequestException(
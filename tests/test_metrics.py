@@ -0,0 +1,144 @@
+import unittest
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import requests
+
+from wikiedits import cache, metrics, ratelimit
+from wikiedits.api import _make_request
+from wikiedits.metrics import Histogram, MetricsAggregator, RequestEvent
+
+
+def _response(status, payload=None, content=b'{"items": []}', elapsed=0.01):
+  response = Mock()
+  response.status_code = status
+  response.headers = {}
+  response.text = "error"
+  response.content = content
+  response.elapsed = timedelta(seconds=elapsed)
+  response.json.return_value = payload
+  if status >= 400:
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+  else:
+    response.raise_for_status = Mock()
+  return response
+
+
+class TestHistogram(unittest.TestCase):
+  def test_buckets_and_quantiles(self):
+    """Test bucket placement and interpolated quantiles"""
+    histogram = Histogram([0.1, 1.0])
+    for value in (0.05, 0.05, 0.5, 0.5, 5.0):
+      histogram.observe(value)
+
+    self.assertEqual(histogram.counts, [2, 2, 1])
+    self.assertEqual(histogram.count, 5)
+    self.assertAlmostEqual(histogram.sum, 6.1)
+    self.assertAlmostEqual(histogram.quantile(0.2), 0.05)
+    self.assertAlmostEqual(histogram.quantile(0.6), 0.55)
+    self.assertEqual(histogram.quantile(1.0), 1.0)
+    self.assertIsNone(Histogram().quantile(0.5))
+
+
+class TestMetricsAggregator(unittest.TestCase):
+  def test_counts_per_endpoint(self):
+    """Test counters and that only network fetches feed the histograms"""
+    aggregator = MetricsAggregator()
+    aggregator(RequestEvent("edits/aggregate", "u1", status=200, total=0.2,
+                            ttfb=0.1, size=100, retries=1))
+    aggregator(RequestEvent("edits/aggregate", "u1", cache_hit=True))
+    aggregator(RequestEvent("edits/aggregate", "u1", status=200, coalesced=True))
+    aggregator(RequestEvent("edited-pages/new", "u2", status=500,
+                            total=0.1, error=ValueError()))
+
+    snapshot = aggregator.snapshot()
+    edits = snapshot["edits/aggregate"]
+    self.assertEqual(edits["requests"], 3)
+    self.assertEqual(edits["cache_hits"], 1)
+    self.assertEqual(edits["coalesced"], 1)
+    self.assertEqual(edits["retries"], 1)
+    self.assertEqual(edits["bytes"], 100)
+    self.assertEqual(edits["statuses"], {200: 2})
+    self.assertEqual(edits["latency"]["total"]["count"], 1)
+    self.assertEqual(edits["latency"]["decode"]["count"], 0)
+    self.assertEqual(snapshot["edited-pages/new"]["errors"], 1)
+
+    aggregator.reset()
+    self.assertEqual(aggregator.snapshot(), {})
+
+
+class TestRequestObservers(unittest.TestCase):
+  def setUp(self):
+    self.events = []
+    metrics.add_observer(self.events.append)
+    ratelimit.configure(backoff_base=0)
+
+  def tearDown(self):
+    metrics.remove_observer(self.events.append)
+    ratelimit.configure()
+    cache.disable_cache()
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_event_for_successful_request(self, mock_get):
+    """Test that a fetch reports status, size, timings and retries"""
+    mock_get.side_effect = [_response(503), _response(200, {"items": []})]
+
+    _make_request("edits/aggregate", "args")
+
+    [event] = self.events
+    self.assertEqual(event.endpoint, "edits/aggregate")
+    self.assertTrue(event.url.endswith("/edits/aggregate/args"))
+    self.assertEqual(event.status, 200)
+    self.assertEqual(event.retries, 1)
+    self.assertEqual(event.size, len(b'{"items": []}'))
+    self.assertAlmostEqual(event.ttfb, 0.01)
+    self.assertIsNone(event.connect)
+    self.assertIsNotNone(event.download)
+    self.assertIsNotNone(event.decode)
+    self.assertFalse(event.cache_hit)
+    self.assertIsNone(event.error)
+    self.assertGreaterEqual(event.total, event.decode)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_event_for_failed_request(self, mock_get):
+    """Test that failures are reported with the error"""
+    mock_get.return_value = _response(404)
+
+    with self.assertRaises(requests.exceptions.RequestException):
+      _make_request("edits/aggregate", "args")
+
+    [event] = self.events
+    self.assertEqual(event.status, 404)
+    self.assertIsInstance(event.error, requests.exceptions.RequestException)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_event_for_cache_hit(self, mock_get):
+    """Test that cache hits are reported without a network fetch"""
+    cache.enable_cache(":memory:")
+    mock_get.return_value = _response(200, {"items": []})
+
+    _make_request("edits/aggregate", "args")
+    _make_request("edits/aggregate", "args")
+
+    self.assertEqual(mock_get.call_count, 1)
+    self.assertEqual([e.cache_hit for e in self.events], [False, True])
+
+  def test_enable_metrics_registers_aggregator(self):
+    """Test the shared aggregator lifecycle"""
+    aggregator = metrics.enable_metrics()
+    try:
+      self.assertIs(metrics.get_metrics(), aggregator)
+      metrics.notify(RequestEvent("edits/aggregate", "u", status=200))
+      self.assertEqual(aggregator.snapshot()["edits/aggregate"]["requests"], 1)
+    finally:
+      metrics.disable_metrics()
+    self.assertIsNone(metrics.get_metrics())
+
+  def test_remove_unknown_observer(self):
+    """Test that removing an unregistered observer raises ValueError"""
+    with self.assertRaises(ValueError):
+      metrics.remove_observer(print)
+
+
+if __name__ == "__main__":
+  unittest.main()
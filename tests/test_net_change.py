@@ -5,7 +5,7 @@ from wikiedits.api import bytes_diff_net_aggregate, bytes_diff_net_per_page
 
 
 class TestNetChange(unittest.TestCase):
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_net_bytes_diff_aggregate_basic(self, mock_get):
     """Test basic net change aggregate functionality"""
     mock_response = Mock()
@@ -44,7 +44,7 @@ class TestNetChange(unittest.TestCase):
     self.assertEqual(result[0]["net_bytes_diff"], 15000)
     self.assertEqual(result[1]["net_bytes_diff"], 18000)
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_net_bytes_diff_aggregate_custom_parameters(self, mock_get):
     """Test net change aggregate with custom parameters"""
     mock_response = Mock()
@@ -68,7 +68,7 @@ class TestNetChange(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_net_bytes_diff_net_per_page_basic(self, mock_get):
     """Test basic net change per page functionality"""
     mock_response = Mock()
@@ -109,7 +109,7 @@ class TestNetChange(unittest.TestCase):
     self.assertEqual(result[0]["net_bytes_diff"], 500)
     self.assertEqual(result[1]["net_bytes_diff"], -200)
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_net_bytes_diff_net_per_page_custom_parameters(self, mock_get):
     """Test net change per page with custom parameters"""
     mock_response = Mock()
@@ -135,7 +135,7 @@ class TestNetChange(unittest.TestCase):
     )
 
   @patch("wikiedits.api.validate_dates")
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_net_change_date_validation(self, mock_get, mock_validate):
     """Test that date validation is called for both functions"""
     mock_response = Mock()
@@ -5,7 +5,7 @@ from wikiedits.api import new_pages
 
 
 class TestNewPages(unittest.TestCase):
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_new_pages_basic(self, mock_get):
     """Test basic new pages functionality"""
     mock_response = Mock()
@@ -48,7 +48,7 @@ class TestNewPages(unittest.TestCase):
     self.assertEqual(result[0]["new_pages"], 150)
     self.assertEqual(result[1]["new_pages"], 175)
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_new_pages_with_custom_parameters(self, mock_get):
     """Test new pages with custom parameters"""
     mock_response = Mock()
@@ -78,7 +78,7 @@ class TestNewPages(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_new_pages_with_default_parameters(self, mock_get):
     """Test new pages with default parameters"""
     mock_response = Mock()
@@ -103,7 +103,7 @@ class TestNewPages(unittest.TestCase):
     )
 
   @patch("wikiedits.api.validate_dates")
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_new_pages_date_validation(self, mock_get, mock_validate):
     """Test that date validation is called"""
     mock_response = Mock()
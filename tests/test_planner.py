@@ -0,0 +1,103 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from wikiedits.client import edits, pages
+from wikiedits.planner import Segment, plan_range
+
+
+class TestPlanRange(unittest.TestCase):
+  def test_short_range_passes_through(self):
+    """Test that a range without a whole month is one daily request"""
+    self.assertEqual(
+      plan_range("2025-01-05", "2025-01-20"),
+      [Segment("daily", "2025-01-05", "2025-01-20")],
+    )
+    self.assertEqual(
+      plan_range("20250115", "20250215"),
+      [Segment("daily", "20250115", "20250215")],
+    )
+
+  def test_edges_and_whole_months(self):
+    """Test that whole months are monthly and the edges daily"""
+    self.assertEqual(
+      plan_range("20200115", "20250110"),
+      [
+        Segment("daily", "20200115", "20200201"),
+        Segment("monthly", "20200201", "20250101"),
+        Segment("daily", "20250101", "20250110"),
+      ],
+    )
+
+  def test_month_aligned_range(self):
+    """Test that a month-aligned range needs no daily requests"""
+    self.assertEqual(
+      plan_range("2024-01-01", "2025-01-01"),
+      [Segment("monthly", "20240101", "20250101")],
+    )
+
+
+class TestPlannedClient(unittest.TestCase):
+  @patch("wikiedits.client.edits_per_page")
+  def test_edits_long_range_uses_monthly(self, mock_per_page):
+    """Test that edits() sums monthly and daily segments"""
+    def fetch(**kwargs):
+      if kwargs["granularity"] == "monthly":
+        return [{"edits": 100, "timestamp": "20200201"},
+                {"edits": 200, "timestamp": "20200301"}]
+      return [{"edits": 1, "timestamp": kwargs["start"]}]
+
+    mock_per_page.side_effect = fetch
+
+    result = edits("20200115", "20200410", project="en.wikipedia.org",
+                   page_title="Python")
+
+    self.assertEqual(result, 302)
+    calls = sorted(
+      (c.kwargs["granularity"], c.kwargs["start"], c.kwargs["end"])
+      for c in mock_per_page.call_args_list
+    )
+    self.assertEqual(calls, [
+      ("daily", "20200115", "20200201"),
+      ("daily", "20200401", "20200410"),
+      ("monthly", "20200201", "20200401"),
+    ])
+
+  @patch("wikiedits.client.edits_per_page")
+  def test_segment_without_data_counts_as_zero(self, mock_per_page):
+    """Test that a 404 segment is empty unless every segment is 404"""
+    not_found = requests.exceptions.RequestException(
+      "HTTP error 404", response=Mock(status_code=404)
+    )
+
+    def fetch(**kwargs):
+      if kwargs["start"] == "20200115":  # before the page existed
+        raise not_found
+      return [{"edits": 10, "timestamp": kwargs["start"]}]
+
+    mock_per_page.side_effect = fetch
+    self.assertEqual(
+      edits("20200115", "20200410", project="en.wikipedia.org", page_title="A"),
+      20,
+    )
+
+    mock_per_page.side_effect = not_found
+    with self.assertRaises(requests.exceptions.RequestException):
+      edits("20200115", "20200410", project="en.wikipedia.org", page_title="A")
+
+  @patch("wikiedits.client.edited_pages")
+  def test_edited_pages_stay_daily(self, mock_edited_pages):
+    """Test that non-additive edited page counts are never planned monthly"""
+    mock_edited_pages.return_value = [
+      {"edited_pages": 5, "timestamp": "20200115"}
+    ]
+
+    pages("20200115", "20200410", change_type="edited")
+
+    mock_edited_pages.assert_called_once()
+    self.assertEqual(mock_edited_pages.call_args.kwargs["granularity"], "daily")
+
+
+if __name__ == "__main__":
+  unittest.main()
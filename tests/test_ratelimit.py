@@ -0,0 +1,180 @@
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import Mock, patch
+
+import requests
+
+from wikiedits import ratelimit
+from wikiedits.api import _make_request
+from wikiedits.ratelimit import RateLimiter, RetryPolicy, parse_retry_after
+
+
+def _response(status, payload=None, headers=None):
+  response = Mock()
+  response.status_code = status
+  response.headers = headers or {}
+  response.text = "Too Many Requests"
+  response.json.return_value = payload
+  if status >= 400:
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+  else:
+    response.raise_for_status = Mock()
+  return response
+
+
+class TestRateLimiter(unittest.TestCase):
+  @patch("wikiedits.ratelimit.time.monotonic")
+  def test_burst_then_waits(self, mock_monotonic):
+    """Test that requests beyond the burst wait for new tokens"""
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(rate=10, burst=2)
+
+    self.assertEqual(limiter.reserve(), 0.0)
+    self.assertEqual(limiter.reserve(), 0.0)
+    self.assertAlmostEqual(limiter.reserve(), 0.1)
+    self.assertAlmostEqual(limiter.reserve(), 0.2)
+
+  @patch("wikiedits.ratelimit.time.monotonic")
+  def test_throttle_halves_rate_and_pauses(self, mock_monotonic):
+    """Test that a throttling response slows down every caller"""
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(rate=10, burst=5, min_rate=1)
+
+    limiter.on_throttle(pause=2.0)
+
+    self.assertEqual(limiter.rate, 5)
+    self.assertAlmostEqual(limiter.reserve(), 2.0 + 1 / 5)
+
+  @patch("wikiedits.ratelimit.time.monotonic")
+  def test_rate_adapts_within_bounds(self, mock_monotonic):
+    """Test additive increase and multiplicative decrease limits"""
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(rate=4, min_rate=1, max_rate=4.25, increase=0.1,
+                          cooldown=1.0)
+
+    for _ in range(10):
+      limiter.on_success()
+    self.assertEqual(limiter.rate, 4.25)
+
+    for i in range(10):
+      mock_monotonic.return_value = 100.0 + i
+      limiter.on_throttle()
+    self.assertEqual(limiter.rate, 1)
+
+  @patch("wikiedits.ratelimit.time.monotonic")
+  def test_throttle_burst_halves_once(self, mock_monotonic):
+    """Test that concurrent throttles within the cooldown halve the rate once"""
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(rate=50, min_rate=1, cooldown=1.0)
+
+    workers = [
+      threading.Thread(target=limiter.on_throttle) for _ in range(10)
+    ]
+    for worker in workers:
+      worker.start()
+    for worker in workers:
+      worker.join()
+    self.assertEqual(limiter.rate, 25)
+
+    mock_monotonic.return_value = 100.5
+    limiter.on_throttle()
+    self.assertEqual(limiter.rate, 25)
+
+    mock_monotonic.return_value = 101.0
+    limiter.on_throttle()
+    self.assertEqual(limiter.rate, 12.5)
+
+  @patch("wikiedits.ratelimit.time.monotonic")
+  def test_cooldown_covers_pause(self, mock_monotonic):
+    """Test that throttles during a Retry-After pause don't halve again"""
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(rate=10, min_rate=1, cooldown=1.0)
+
+    limiter.on_throttle(pause=5.0)
+    mock_monotonic.return_value = 104.0
+    limiter.on_throttle(pause=5.0)
+
+    self.assertEqual(limiter.rate, 5)
+
+  def test_invalid_rate(self):
+    """Test that a non-positive rate is rejected"""
+    with self.assertRaises(ValueError):
+      RateLimiter(rate=0)
+
+
+class TestRetry(unittest.TestCase):
+  def test_parse_retry_after_seconds(self):
+    """Test Retry-After given in seconds"""
+    self.assertEqual(parse_retry_after("3"), 3.0)
+    self.assertIsNone(parse_retry_after(None))
+    self.assertIsNone(parse_retry_after("soon"))
+
+  def test_parse_retry_after_http_date(self):
+    """Test Retry-After given as an HTTP date"""
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+    self.assertGreater(seconds, 25)
+    self.assertLessEqual(seconds, 30)
+
+  def test_backoff_is_jittered_and_capped(self):
+    """Test that backoff stays under the exponential ceiling"""
+    policy = RetryPolicy(backoff_base=1, backoff_cap=4)
+    for attempt, ceiling in [(0, 1), (1, 2), (2, 4), (5, 4)]:
+      for _ in range(20):
+        self.assertLessEqual(policy.delay(attempt), ceiling)
+
+
+class TestMakeRequestRetries(unittest.TestCase):
+  def setUp(self):
+    ratelimit.configure(rate=1000, burst=100, max_retries=2)
+
+  def tearDown(self):
+    ratelimit.configure()
+
+  @patch("wikiedits.api.time.sleep")
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_retries_throttled_response(self, mock_get, mock_sleep):
+    """Test that a 429 is retried after the Retry-After delay"""
+    mock_get.side_effect = [
+      _response(429, headers={"Retry-After": "2"}),
+      _response(200, {"ok": True}),
+    ]
+
+    result = _make_request("endpoint", "args")
+
+    self.assertEqual(result, {"ok": True})
+    self.assertEqual(mock_get.call_count, 2)
+    mock_sleep.assert_called_once()
+    self.assertAlmostEqual(mock_sleep.call_args.args[0], 2.0, places=1)
+    self.assertLess(ratelimit.get_rate_limiter().rate, 1000)
+
+  @patch("wikiedits.api.time.sleep")
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_gives_up_after_max_retries(self, mock_get, mock_sleep):
+    """Test that persistent 503s eventually raise an HTTP error"""
+    mock_get.side_effect = lambda *args, **kwargs: _response(503)
+
+    with self.assertRaises(requests.exceptions.RequestException) as context:
+      _make_request("endpoint", "args")
+
+    self.assertIn("HTTP error 503", str(context.exception))
+    self.assertEqual(mock_get.call_count, 3)
+    self.assertGreaterEqual(mock_sleep.call_count, 2)
+
+  @patch("wikiedits.api.time.sleep")
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_client_errors_not_retried(self, mock_get, mock_sleep):
+    """Test that a 404 fails immediately"""
+    mock_get.return_value = _response(404)
+
+    with self.assertRaises(requests.exceptions.RequestException):
+      _make_request("endpoint", "args")
+
+    mock_get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+  unittest.main()
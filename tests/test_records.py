@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from wikiedits import aio
+from wikiedits.api import top_by_net_diff
+from wikiedits.client import top
+from wikiedits.records import TopEntry, compact_top
+
+
+def _top_response(field, titles):
+  mock_response = Mock()
+  mock_response.json.return_value = {"items": [{"results": [{"top": [
+    {"page_title": title, field: 100 - rank, "rank": rank}
+    for rank, title in enumerate(titles, start=1)
+  ]}]}]}
+  mock_response.raise_for_status = Mock()
+  return mock_response
+
+
+class TestRecords(unittest.TestCase):
+  def test_compact_top(self):
+    """Test conversion of top-by dicts to TopEntry records"""
+    entries = compact_top([
+      {"page_title": "Python", "edits": 150, "rank": 1},
+      {"project": "de.wikipedia", "page_title": "Java", "edits": 145, "rank": 2},
+    ], "edits")
+    self.assertEqual(entries, [
+      TopEntry("Python", 150, 1),
+      TopEntry("Java", 145, 2, "de.wikipedia"),
+    ])
+    self.assertEqual(entries[0].page_title, "Python")
+    self.assertFalse(hasattr(entries[0], "__dict__"))
+
+  def test_titles_are_interned(self):
+    """Test that equal titles from separate lists share one string"""
+    first = compact_top([{"page_title": "".join(["Mai", "n_Page"]), "edits": 1,
+                          "rank": 1}], "edits")
+    second = compact_top([{"page_title": "".join(["Main", "_Page"]), "edits": 2,
+                           "rank": 1}], "edits")
+    self.assertIs(first[0].page_title, second[0].page_title)
+
+  def test_as_dict_round_trip(self):
+    """Test that as_dict restores the API's dict form"""
+    entry = {"page_title": "Python", "net_bytes_diff": -20, "rank": 3}
+    self.assertEqual(compact_top([entry], "net_bytes_diff")[0].as_dict(
+      "net_bytes_diff"), entry)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_top_by_compact(self, mock_get):
+    """Test compact results from a top-by function"""
+    mock_get.return_value = _top_response("net_bytes_diff", ["A", "B"])
+
+    result = top_by_net_diff("en.wikipedia.org", "20250315", compact=True)
+
+    self.assertEqual(result, [TopEntry("A", 99, 1), TopEntry("B", 98, 2)])
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_top_compact(self, mock_get):
+    """Test that top() slices before converting to records"""
+    mock_get.return_value = _top_response("abs_bytes_diff", ["A", "B", "C"])
+
+    result = top("20250315", by="absolute-diff", count=2, compact=True)
+
+    self.assertEqual(result, [TopEntry("A", 99, 1), TopEntry("B", 98, 2)])
+
+  def test_aio_top_compact(self):
+    """Test compact results from the asyncio client"""
+    payload = {"items": [{"results": [{"top": [
+      {"page_title": "A", "edits": 7, "rank": 1},
+    ]}]}]}
+
+    with patch("wikiedits.aio._make_request", AsyncMock(return_value=payload)):
+      result = asyncio.run(aio.top("20250315", compact=True))
+
+    self.assertEqual(result, [TopEntry("A", 7, 1)])
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,322 @@
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+import requests
+
+from tests.helpers import not_found_response, series_response
+from wikiedits.api import edited_pages, edits_aggregate, edits_per_page, new_pages
+from wikiedits.segments import (
+    EDITOR_TYPE_COMPONENTS,
+    SegmentCache,
+    SeriesKey,
+    _add_interval,
+    _gaps,
+    disable_segment_cache,
+    enable_segment_cache,
+)
+
+
+def _range(url):
+  return tuple(url.split("/")[-2:])
+
+
+class TestIntervals(unittest.TestCase):
+  def test_add_interval_merges_touching(self):
+    """Test that adjacent and overlapping intervals are merged"""
+    covered = _add_interval([("20250101", "20250110")], "20250110", "20250120")
+    self.assertEqual(covered, [("20250101", "20250120")])
+
+    covered = _add_interval(covered, "20250201", "20250210")
+    self.assertEqual(
+      covered, [("20250101", "20250120"), ("20250201", "20250210")]
+    )
+
+  def test_gaps(self):
+    """Test that gaps are the uncovered parts of the query"""
+    covered = [("20250105", "20250110"), ("20250115", "20250120")]
+    self.assertEqual(
+      _gaps(covered, "20250101", "20250125"),
+      [("20250101", "20250105"), ("20250110", "20250115"),
+       ("20250120", "20250125")],
+    )
+    self.assertEqual(_gaps(covered, "20250106", "20250109"), [])
+
+  def test_missing_merges_nearby_gaps(self):
+    """Test that gaps separated by a short cached stretch become one fetch"""
+    cache = SegmentCache(merge_gap_days=7)
+    key = SeriesKey("edits/aggregate", "en.wikipedia.org", None,
+                    "all-editor-types", "all-page-types", "daily")
+    cache.store(key, "20250110", "20250115", [])
+
+    self.assertEqual(
+      cache.missing(key, "20250101", "20250131"), [("20250101", "20250131")]
+    )
+
+    cache.store(key, "20250201", "20250301", [])
+    self.assertEqual(
+      cache.missing(key, "20250101", "20250331"),
+      [("20250101", "20250201"), ("20250301", "20250331")],
+    )
+
+
+class TestSegmentCacheRequests(unittest.TestCase):
+  def setUp(self):
+    enable_segment_cache(merge_gap_days=0)
+
+  def tearDown(self):
+    disable_segment_cache()
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_extension_fetches_only_missing_range(self, mock_get):
+    """Test that extending a cached range only fetches the new days"""
+    mock_get.side_effect = series_response
+
+    first = edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250301")
+    full = edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250401")
+
+    fetched = [_range(call.args[0]) for call in mock_get.call_args_list]
+    self.assertEqual(
+      fetched, [("20250101", "20250301"), ("20250301", "20250401")]
+    )
+    self.assertEqual(len(first), 59)
+    self.assertEqual(len(full), 90)
+    self.assertEqual(full[:59], first)
+    self.assertEqual(full[-1]["timestamp"], "2025-03-31T00:00:00.000Z")
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_extension_into_range_without_data(self, mock_get):
+    """Test that a 404 gap next to cached points counts as empty"""
+    def respond(url, **kwargs):
+      if _range(url)[0] >= "20240301":
+        return not_found_response(url)
+      return series_response(url)
+
+    mock_get.side_effect = respond
+
+    edits_per_page("en.wikipedia.org", "A", "daily", "20240101", "20240301")
+    extended = edits_per_page("en.wikipedia.org", "A", "daily",
+                              "20240101", "20240315")
+    again = edits_per_page("en.wikipedia.org", "A", "daily",
+                           "20240101", "20240315")
+
+    self.assertEqual(len(extended), 60)
+    self.assertEqual(again, extended)
+    self.assertEqual(mock_get.call_count, 2)
+    with self.assertRaises(requests.exceptions.RequestException) as ctx:
+      edits_per_page("en.wikipedia.org", "A", "daily", "20240401", "20240415")
+    self.assertIn("404", str(ctx.exception))
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_contained_range_served_from_cache(self, mock_get):
+    """Test that a sub-range of cached data makes no request"""
+    mock_get.side_effect = series_response
+
+    edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250301")
+    middle = edits_aggregate("en.wikipedia.org", "daily", "20250110", "20250120")
+
+    mock_get.assert_called_once()
+    self.assertEqual([p["edits"] for p in middle], list(range(10, 20)))
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_results_are_copies(self, mock_get):
+    """Test that modifying returned points does not change the cache"""
+    mock_get.side_effect = series_response
+
+    first = edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250110")
+    first[0]["edits"] = 999
+    second = edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250110")
+
+    mock_get.assert_called_once()
+    self.assertEqual(second[0]["edits"], 1)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_series_are_keyed_separately(self, mock_get):
+    """Test that different pages and editor types do not share points"""
+    mock_get.side_effect = series_response
+
+    edits_per_page("en.wikipedia.org", "A", "daily", "20250101", "20250110")
+    edits_per_page("en.wikipedia.org", "B", "daily", "20250101", "20250110")
+    edits_per_page("en.wikipedia.org", "A", "daily", "20250101", "20250110",
+                   editor_type="user")
+    edits_per_page("en.wikipedia.org", "A", "daily", "20250101", "20250110")
+
+    self.assertEqual(mock_get.call_count, 3)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_unaligned_monthly_range_bypasses_cache(self, mock_get):
+    """Test that monthly ranges not on month boundaries are fetched as-is"""
+    mock_get.side_effect = series_response
+
+    edits_aggregate("en.wikipedia.org", "monthly", "20250115", "20250315")
+    edits_aggregate("en.wikipedia.org", "monthly", "20250115", "20250315")
+
+    self.assertEqual(mock_get.call_count, 2)
+
+
+class TestRecentDays(unittest.TestCase):
+  def test_recent_days_not_covered(self):
+    """Test that days that may still be revised are not marked cached"""
+    cache = SegmentCache(merge_gap_days=0, recent_days=3)
+    key = SeriesKey("edits/aggregate", "en", None, "user", "content", "daily")
+    cache.store(key, "20250101", "20250201", [], today=date(2025, 1, 20))
+
+    self.assertEqual(cache.missing(key, "20250101", "20250201"),
+                     [("20250117", "20250201")])
+
+  def test_recent_month_not_covered(self):
+    """Test that a monthly series is only cached up to the last final month"""
+    cache = SegmentCache(recent_days=3)
+    key = SeriesKey("edits/aggregate", "en", None, "user", "content", "monthly")
+    cache.store(key, "20240101", "20250201", [], today=date(2025, 1, 2))
+
+    self.assertEqual(cache.missing(key, "20240101", "20250201"),
+                     [("20241201", "20250201")])
+
+  def test_refetch_replaces_points(self):
+    """Test that refetched days replace stored points, including dropped ones"""
+    cache = SegmentCache(recent_days=3)
+    key = SeriesKey("edits/aggregate", "en", None, "user", "content", "daily")
+    point = {"timestamp": "2025-01-19T00:00:00.000Z", "edits": 1}
+    cache.store(key, "20250118", "20250121", [point], today=date(2025, 1, 20))
+    cache.store(key, "20250118", "20250121", [], today=date(2025, 1, 20))
+
+    self.assertEqual(cache.points(key, "20250118", "20250121"), [])
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_recent_days_refetched(self, mock_get):
+    """Test that queries reaching into the last few days fetch them again"""
+    mock_get.side_effect = series_response
+    enable_segment_cache(merge_gap_days=0, recent_days=3)
+    today = datetime.now(timezone.utc).date()
+    start = (today - timedelta(days=20)).strftime("%Y%m%d")
+    end = today.strftime("%Y%m%d")
+    try:
+      edits_aggregate("en.wikipedia.org", "daily", start, end)
+      again = edits_aggregate("en.wikipedia.org", "daily", start, end)
+    finally:
+      disable_segment_cache()
+
+    recheck = (today - timedelta(days=3)).strftime("%Y%m%d")
+    self.assertEqual(_range(mock_get.call_args.args[0]), (recheck, end))
+    self.assertEqual(len(again), 20)
+
+
+class TestDerivedSeries(unittest.TestCase):
+  def setUp(self):
+    self.cache = enable_segment_cache(merge_gap_days=0)
+
+  def tearDown(self):
+    disable_segment_cache()
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_all_editor_types_summed_from_components(self, mock_get):
+    """Test that all-editor-types is derived without another request"""
+    mock_get.side_effect = series_response
+
+    for editor_type in EDITOR_TYPE_COMPONENTS:
+      edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250110",
+                      editor_type=editor_type)
+    total = edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250110")
+
+    self.assertEqual(mock_get.call_count, 4)
+    self.assertEqual([p["edits"] for p in total], [4 * d for d in range(1, 10)])
+    self.assertEqual(total[0]["timestamp"], "2025-01-01T00:00:00.000Z")
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_all_page_types_summed_from_components(self, mock_get):
+    """Test that content plus non-content gives all-page-types"""
+    mock_get.side_effect = series_response
+
+    for page_type in ("content", "non-content"):
+      edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250110",
+                      page_type=page_type)
+    total = edits_aggregate("en.wikipedia.org", "daily", "20250105", "20250110")
+
+    self.assertEqual(mock_get.call_count, 2)
+    self.assertEqual([p["edits"] for p in total], [10, 12, 14, 16, 18])
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_uncovered_components_are_fetched(self, mock_get):
+    """Test that only the range covered by every component is derived"""
+    mock_get.side_effect = series_response
+
+    for editor_type in EDITOR_TYPE_COMPONENTS:
+      edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250110",
+                      editor_type=editor_type)
+    edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250120",
+                    editor_type="user")
+    mock_get.reset_mock()
+
+    edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250110")
+    edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250120")
+
+    fetched = [_range(call.args[0]) for call in mock_get.call_args_list]
+    self.assertEqual(fetched, [("20250110", "20250120")])
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_edited_pages_not_derived(self, mock_get):
+    """Test that distinct edited-page counts are never summed"""
+    mock_get.side_effect = series_response
+
+    for editor_type in EDITOR_TYPE_COMPONENTS:
+      edited_pages("en.wikipedia.org", "daily", "20250101", "20250110",
+                   editor_type=editor_type)
+    edited_pages("en.wikipedia.org", "daily", "20250101", "20250110")
+
+    self.assertEqual(mock_get.call_count, 5)
+
+  def test_missing_timestamps_count_as_zero(self):
+    """Test summing components that skip some days"""
+    key = SeriesKey("edits/aggregate", "p", None, "all-editor-types",
+                    "all-page-types", "daily")
+    for editor_type in EDITOR_TYPE_COMPONENTS:
+      points = [{"timestamp": "2025-01-01T00:00:00.000Z", "edits": 1}]
+      if editor_type == "user":
+        points.append({"timestamp": "2025-01-02T00:00:00.000Z", "edits": 5})
+      self.cache.store(key._replace(editor_type=editor_type),
+                       "20250101", "20250103", points)
+
+    self.assertEqual(
+      self.cache.derive(key, "20250101", "20250103"),
+      [{"timestamp": "2025-01-01T00:00:00.000Z", "edits": 4},
+       {"timestamp": "2025-01-02T00:00:00.000Z", "edits": 5}],
+    )
+    self.assertIsNone(self.cache.derive(key, "20250101", "20250104"))
+
+
+class TestMonthlyRollup(unittest.TestCase):
+  def setUp(self):
+    enable_segment_cache(merge_gap_days=0)
+
+  def tearDown(self):
+    disable_segment_cache()
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_monthly_rolled_up_from_cached_days(self, mock_get):
+    """Test that monthly results come from cached daily points"""
+    mock_get.side_effect = series_response
+
+    edits_aggregate("en.wikipedia.org", "daily", "20250101", "20250301")
+    monthly = edits_aggregate("en.wikipedia.org", "monthly", "20250101", "20250301")
+
+    mock_get.assert_called_once()
+    self.assertEqual(monthly, [
+      {"timestamp": "2025-01-01T00:00:00.000Z", "edits": sum(range(1, 32))},
+      {"timestamp": "2025-02-01T00:00:00.000Z", "edits": sum(range(1, 29))},
+    ])
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_partial_daily_coverage_is_fetched(self, mock_get):
+    """Test that a gap the daily cache only partly covers is fetched"""
+    mock_get.side_effect = series_response
+
+    new_pages("en.wikipedia.org", "daily", "20250101", "20250201")
+    new_pages("en.wikipedia.org", "monthly", "20250101", "20250301")
+
+    fetched = [_range(call.args[0]) for call in mock_get.call_args_list]
+    self.assertEqual(fetched, [("20250101", "20250201"), ("20250101", "20250301")])
+
+
+if __name__ == "__main__":
+  unittest.main()
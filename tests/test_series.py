@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import patch
+
+from wikiedits.series import TimeSeries, rollup, to_epoch
+
+
+def _daily(start_month, end_month, value=1):
+  return [
+    {"timestamp": f"2024-{month:02d}-{day:02d}T00:00:00.000Z", "edits": value}
+    for month in range(start_month, end_month + 1)
+    for day in range(1, 29)
+  ]
+
+
+class TestTimeSeries(unittest.TestCase):
+  def test_from_results(self):
+    """Test that results are converted to int64 columns"""
+    series = TimeSeries.from_results(
+      [{"timestamp": "20250102", "edits": 5},
+       {"timestamp": "2025-01-01T00:00:00.000Z", "edits": 3}],
+      "edits",
+    )
+
+    self.assertEqual(series.timestamps.typecode, "q")
+    self.assertEqual(list(series.timestamps),
+                     [to_epoch("20250101"), to_epoch("20250102")])
+    self.assertEqual(list(series.values), [3, 5])
+    self.assertEqual(series.sum(), 8)
+
+  def test_empty_series(self):
+    """Test that an empty result list sums to zero"""
+    series = TimeSeries.from_results([], "edits")
+    self.assertEqual(len(series), 0)
+    self.assertEqual(series.sum(), 0)
+    self.assertEqual(len(series.resample("monthly")), 0)
+
+  def test_slicing_and_between(self):
+    """Test index slicing and date-range slicing"""
+    series = TimeSeries.from_results(_daily(1, 2), "edits")
+
+    self.assertEqual(len(series[:10]), 10)
+    self.assertEqual(series[0], (to_epoch("20240101"), 1))
+    february = series.between("20240201", "2024-03-01")
+    self.assertEqual(len(february), 28)
+    self.assertEqual(february[0][0], to_epoch("20240201"))
+
+  def test_resample(self):
+    """Test monthly, quarterly, yearly and weekly buckets"""
+    series = TimeSeries.from_results(_daily(1, 6), "edits")
+
+    monthly = series.resample("monthly")
+    self.assertEqual(list(monthly.values), [28] * 6)
+    self.assertEqual(monthly.to_results()[1],
+                     {"timestamp": "2024-02-01T00:00:00.000Z", "edits": 28})
+    self.assertEqual(list(series.resample("quarterly").values), [84, 84])
+    self.assertEqual(
+      series.resample("yearly").to_results(),
+      [{"timestamp": "2024-01-01T00:00:00.000Z", "edits": 168}],
+    )
+    weekly = series.resample("weekly")
+    # 2024-01-01 was a Monday
+    self.assertEqual(weekly[0], (to_epoch("20240101"), 7))
+    self.assertEqual(weekly.sum(), 168)
+
+  def test_resample_without_numpy(self):
+    """Test that the pure Python path gives the same buckets"""
+    series = TimeSeries.from_results(_daily(1, 6), "edits")
+    periods = ("weekly", "monthly", "quarterly", "yearly")
+    expected = {period: series.resample(period) for period in periods}
+
+    with patch("wikiedits.series.HAS_NUMPY", False):
+      for period in periods:
+        with self.subTest(period=period):
+          actual = series.resample(period)
+          self.assertEqual(list(actual.timestamps),
+                           list(expected[period].timestamps))
+          self.assertEqual(list(actual.values), list(expected[period].values))
+      self.assertEqual(series.sum(), 168)
+
+  def test_invalid_period(self):
+    """Test that an unknown period is rejected"""
+    with self.assertRaises(ValueError):
+      TimeSeries.from_results(_daily(1, 1), "edits").resample("hourly")
+
+  def test_window_sums(self):
+    """Test window totals with and without NumPy"""
+    series = TimeSeries.from_results(_daily(1, 2), "edits")
+    windows = [("20240101", "20240108"), ("20240225", "20240401"),
+               ("20231201", "20240102"), ("20240110", "20240110")]
+
+    self.assertEqual(series.window_sums(windows), [7, 4, 1, 0])
+    with patch("wikiedits.series.HAS_NUMPY", False):
+      self.assertEqual(series.window_sums(windows), [7, 4, 1, 0])
+
+  def test_rollup(self):
+    """Test that rollup returns API-shaped results per bucket"""
+    results = _daily(1, 3, value=2)
+    self.assertEqual(rollup(results, "monthly"), [
+      {"timestamp": "2024-01-01T00:00:00.000Z", "edits": 56},
+      {"timestamp": "2024-02-01T00:00:00.000Z", "edits": 56},
+      {"timestamp": "2024-03-01T00:00:00.000Z", "edits": 56},
+    ])
+    self.assertEqual(rollup(results, "quarterly"),
+                     [{"timestamp": "2024-01-01T00:00:00.000Z", "edits": 168}])
+    self.assertEqual(rollup([], "weekly"), [])
+    with self.assertRaises(ValueError):
+      rollup([], "hourly")
+
+  def test_length_mismatch(self):
+    """Test that columns must be the same length"""
+    with self.assertRaises(ValueError):
+      TimeSeries([0, 1], [1], "edits")
+
+
+if __name__ == "__main__":
+  unittest.main()
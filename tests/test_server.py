@@ -0,0 +1,169 @@
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from unittest.mock import Mock, patch
+
+import requests
+
+from wikiedits import cache, ratelimit
+from wikiedits.server import serve_in_thread, split_metrics_path
+
+UPSTREAM = "https://upstream.example/metrics"
+PAYLOAD = {"items": [{"results": [
+  {"timestamp": "2024-01-01T00:00:00.000Z", "edits": 5},
+  {"timestamp": "2024-01-02T00:00:00.000Z", "edits": 7},
+]}]}
+
+
+def _response(status=200, payload=PAYLOAD):
+  response = Mock()
+  response.status_code = status
+  response.headers = {}
+  response.text = "Not found"
+  response.json.return_value = payload
+  if status >= 400:
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+  else:
+    response.raise_for_status = Mock()
+  return response
+
+
+def _get(url):
+  try:
+    with urllib.request.urlopen(url) as response:
+      return response.status, json.loads(response.read())
+  except urllib.error.HTTPError as e:
+    return e.code, json.loads(e.read())
+
+
+class TestSplitMetricsPath(unittest.TestCase):
+  def test_split(self):
+    """Test that nested endpoints are matched before their prefixes"""
+    self.assertEqual(
+      split_metrics_path("edited-pages/top-by-edits/en/all/all/2024/01/01"),
+      ("edited-pages/top-by-edits", "en/all/all/2024/01/01"),
+    )
+    self.assertEqual(
+      split_metrics_path("bytes-difference/net/per-page/en/A/user/daily/1/2"),
+      ("bytes-difference/net/per-page", "en/A/user/daily/1/2"),
+    )
+    with self.assertRaises(KeyError):
+      split_metrics_path("pageviews/aggregate/en")
+
+
+class TestServer(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls):
+    cls.server, cls.base_url = serve_in_thread(upstream=UPSTREAM)
+    cls.root = cls.base_url[:-len("/metrics")]
+
+  @classmethod
+  def tearDownClass(cls):
+    cls.server.shutdown()
+    cls.server.server_close()
+
+  def tearDown(self):
+    cache.disable_cache()
+    ratelimit.configure()
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_proxy_uses_shared_cache(self, mock_get):
+    """Test that repeated proxied requests reach upstream once"""
+    cache.enable_cache(":memory:")
+    mock_get.return_value = _response()
+    path = (
+      "/edits/aggregate/en.wikipedia.org/all-editor-types/all-page-types/"
+      "daily/20200101/20200103"
+    )
+
+    first = _get(self.base_url + path)
+    second = _get(self.base_url + path)
+
+    self.assertEqual(first, (200, PAYLOAD))
+    self.assertEqual(second, (200, PAYLOAD))
+    mock_get.assert_called_once()
+    self.assertEqual(mock_get.call_args.args[0], UPSTREAM + path)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_concurrent_requests_coalesce(self, mock_get):
+    """Test that simultaneous identical requests share one upstream fetch"""
+    release = threading.Event()
+
+    def slow_get(url, **kwargs):
+      release.wait(5)
+      return _response()
+
+    mock_get.side_effect = slow_get
+    path = "/edits/per-page/en.wikipedia.org/A/all-editor-types/daily/20200101/20200103"
+    results = []
+    threads = [
+      threading.Thread(target=lambda: results.append(_get(self.base_url + path)))
+      for _ in range(5)
+    ]
+    for thread in threads:
+      thread.start()
+    release.wait(0.3)
+    release.set()
+    for thread in threads:
+      thread.join()
+
+    self.assertEqual(results, [(200, PAYLOAD)] * 5)
+    mock_get.assert_called_once()
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_upstream_status_is_passed_through(self, mock_get):
+    """Test that upstream HTTP errors keep their status"""
+    mock_get.return_value = _response(404)
+
+    status, body = _get(
+      self.base_url + "/edits/aggregate/nope/all-editor-types/all-page-types/"
+      "daily/20200101/20200103"
+    )
+
+    self.assertEqual(status, 404)
+    self.assertIn("HTTP error 404", body["detail"])
+
+  def test_unknown_paths(self):
+    """Test 404s for unknown routes and endpoints"""
+    self.assertEqual(_get(self.root + "/nope")[0], 404)
+    self.assertEqual(_get(self.base_url + "/pageviews/x")[0], 404)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_call_route(self, mock_get):
+    """Test running a library function over HTTP"""
+    mock_get.return_value = _response()
+
+    status, body = _get(
+      self.root + "/call/edits?start=20240101&end=20240103&page_title=A"
+    )
+    bad_status, bad_body = _get(self.root + "/call/nope")
+
+    self.assertEqual((status, body), (200, {"result": 12}))
+    self.assertTrue(mock_get.call_args.args[0].startswith(UPSTREAM + "/"))
+    self.assertEqual(bad_status, 400)
+    self.assertIn("Unknown function", bad_body["detail"])
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_call_route_uses_upstream_in_worker_threads(self, mock_get):
+    """Test that requests a call makes from worker threads go upstream too"""
+    mock_get.return_value = _response()
+
+    # Whole months plus partial edges: three segments fetched concurrently
+    status, _ = _get(self.root + "/call/edits?start=20240115&end=20240415")
+
+    self.assertEqual(status, 200)
+    self.assertEqual(mock_get.call_count, 3)
+    for call in mock_get.call_args_list:
+      self.assertTrue(call.args[0].startswith(UPSTREAM + "/"), call.args[0])
+
+  def test_stats_route(self):
+    """Test that stats report in-flight requests"""
+    status, body = _get(self.root + "/stats")
+    self.assertEqual(status, 200)
+    self.assertEqual(body["in_flight"], 0)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,132 @@
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from tests.helpers import daily_results, series_response
+from wikiedits.api import edits_per_page
+from wikiedits.sharding import configure_sharding, fetch_sharded, shard_range
+
+
+def _http_error(status):
+  response = Mock()
+  response.status_code = status
+  return requests.exceptions.RequestException(f"HTTP error {status}",
+                                              response=response)
+
+
+class TestSharding(unittest.TestCase):
+  def setUp(self):
+    configure_sharding(days=365, max_workers=4)
+    self.calls = []
+    self.lock = threading.Lock()
+
+  def tearDown(self):
+    configure_sharding()
+
+  def fetch(self, fail=None):
+    """Build a fetch that records its ranges and raises fail(start, end)"""
+    def fetch(start, end):
+      with self.lock:
+        self.calls.append((start, end))
+      error = fail(start, end) if fail else None
+      if error is not None:
+        raise error
+      return daily_results(start, end)
+    return fetch
+
+  def test_shard_range(self):
+    """Test splitting a range into fixed-size chunks"""
+    self.assertEqual(shard_range("20240101", "20240111", 4), [
+      ("20240101", "20240105"), ("20240105", "20240109"), ("20240109", "20240111"),
+    ])
+    self.assertEqual(shard_range("20240101", "20240101", 4), [])
+
+  def test_short_and_monthly_ranges_are_one_request(self):
+    """Test that ranges within one chunk, and monthly ranges, are not split"""
+    fetch_sharded(self.fetch(), "20240101", "20241231")
+    fetch_sharded(self.fetch(), "20150101", "20250101", "monthly")
+    self.assertEqual(self.calls, [
+      ("20240101", "20241231"), ("20150101", "20250101"),
+    ])
+
+  def test_long_range_concatenated_in_order(self):
+    """Test that chunk results are joined in date order"""
+    results = fetch_sharded(self.fetch(), "20200101", "20240301")
+
+    self.assertEqual(results, daily_results("20200101", "20240301"))
+    self.assertEqual(len(self.calls), 5)
+    self.assertEqual(sorted(self.calls), shard_range("20200101", "20240301", 365))
+
+  def test_disabled(self):
+    """Test that days=None sends every range as one request"""
+    configure_sharding(days=None)
+    fetch_sharded(self.fetch(), "20150101", "20250101")
+    self.assertEqual(self.calls, [("20150101", "20250101")])
+
+  def test_failed_chunk_split_in_half(self):
+    """Test that a failed chunk is retried as two halves"""
+    def fail(start, end):
+      if (start, end) == ("20201231", "20211231"):
+        return requests.exceptions.RequestException("Request timed out")
+      return None
+
+    results = fetch_sharded(self.fetch(fail), "20200101", "20230101")
+
+    self.assertEqual(results, daily_results("20200101", "20230101"))
+    self.assertIn(("20201231", "20210701"), self.calls)
+    self.assertIn(("20210701", "20211231"), self.calls)
+    self.assertEqual(self.calls.count(("20200101", "20201231")), 1)
+
+  def test_half_still_failing_raises(self):
+    """Test that a chunk is split only once"""
+    def fail(start, end):
+      if start <= "20210101" < end:
+        return _http_error(503)
+      return None
+
+    with self.assertRaises(requests.exceptions.RequestException):
+      fetch_sharded(self.fetch(fail), "20200101", "20230101")
+    self.assertEqual(len([c for c in self.calls if c[0] <= "20210101" < c[1]]), 2)
+
+  def test_client_error_not_retried(self):
+    """Test that client errors are raised without splitting the chunk"""
+    def fail(start, end):
+      return _http_error(400) if start == "20201231" else None
+
+    with self.assertRaises(requests.exceptions.RequestException):
+      fetch_sharded(self.fetch(fail), "20200101", "20230101")
+    self.assertEqual(len(self.calls), 4)
+
+  def test_not_found_chunks(self):
+    """Test that 404 chunks are empty unless the whole range is"""
+    def before_2021(start, end):
+      return _http_error(404) if end <= "20210101" else None
+
+    results = fetch_sharded(self.fetch(before_2021), "20200101", "20230101")
+    self.assertEqual(results, daily_results("20201231", "20230101"))
+
+    with self.assertRaises(requests.exceptions.RequestException):
+      fetch_sharded(self.fetch(lambda s, e: _http_error(404)), "20200101", "20230101")
+
+  def test_invalid_configuration(self):
+    """Test that chunk length and worker count must be positive"""
+    with self.assertRaises(ValueError):
+      configure_sharding(days=0)
+    with self.assertRaises(ValueError):
+      configure_sharding(max_workers=0)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_edits_per_page_sharded(self, mock_get):
+    """Test that a multi-year daily query is fetched as yearly requests"""
+    mock_get.side_effect = series_response
+
+    results = edits_per_page("en.wikipedia.org", "A", "daily", "20210101", "20240101")
+
+    self.assertEqual(results, daily_results("20210101", "20240101"))
+    self.assertEqual(mock_get.call_count, 3)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -5,7 +5,7 @@ from wikiedits.api import top_by_edits
 
 
 class TestTopByEdits(unittest.TestCase):
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_edits_basic(self, mock_get):
     """Test basic top by edits functionality"""
     mock_response = Mock()
@@ -54,7 +54,7 @@ class TestTopByEdits(unittest.TestCase):
     self.assertEqual(result[0]["edits"], 150)
     self.assertEqual(result[1]["edits"], 145)
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_edits_with_custom_parameters(self, mock_get):
     """Test top by edits with custom parameters"""
     mock_response = Mock()
@@ -79,7 +79,7 @@ class TestTopByEdits(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_edits_with_default_parameters(self, mock_get):
     """Test top by edits with default parameters"""
     mock_response = Mock()
@@ -103,7 +103,7 @@ class TestTopByEdits(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_edits_iso_date_format(self, mock_get):
     """Test top by edits with ISO date format"""
     mock_response = Mock()
@@ -127,7 +127,7 @@ class TestTopByEdits(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_edits_slash_date_format(self, mock_get):
     """Test top by edits with MM/DD/YYYY date format"""
     mock_response = Mock()
@@ -151,7 +151,7 @@ class TestTopByEdits(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_edits_text_date_format(self, mock_get):
     """Test top by edits with text date format"""
     mock_response = Mock()
@@ -176,7 +176,7 @@ class TestTopByEdits(unittest.TestCase):
     )
 
   @patch("wikiedits.api.split_date")
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_edits_date_splitting(self, mock_get, mock_split):
     """Test that date splitting is called correctly"""
     mock_response = Mock()
@@ -5,7 +5,7 @@ from wikiedits.api import top_by_net_diff
 
 
 class TestTopByNetDiff(unittest.TestCase):
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_net_diff_basic(self, mock_get):
     """Test basic top by net diff functionality"""
     mock_response = Mock()
@@ -48,7 +48,7 @@ class TestTopByNetDiff(unittest.TestCase):
     self.assertEqual(result[0]["net_bytes_diff"], 5000)
     self.assertEqual(result[1]["net_bytes_diff"], 4500)
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_net_diff_with_custom_parameters(self, mock_get):
     """Test most edited net with custom parameters"""
     mock_response = Mock()
@@ -67,7 +67,7 @@ class TestTopByNetDiff(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_net_diff_with_default_parameters(self, mock_get):
     """Test most edited net with default parameters"""
     mock_response = Mock()
@@ -88,7 +88,7 @@ class TestTopByNetDiff(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_net_diff_iso_date_format(self, mock_get):
     """Test most edited net with ISO date format"""
     mock_response = Mock()
@@ -106,7 +106,7 @@ class TestTopByNetDiff(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_net_diff_slash_date_format(self, mock_get):
     """Test most edited net with MM/DD/YYYY date format"""
     mock_response = Mock()
@@ -124,7 +124,7 @@ class TestTopByNetDiff(unittest.TestCase):
       timeout=30,
     )
 
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_net_diff_text_date_format(self, mock_get):
     """Test most edited net with text date format"""
     mock_response = Mock()
@@ -143,7 +143,7 @@ class TestTopByNetDiff(unittest.TestCase):
     )
 
   @patch("wikiedits.api.split_date")
-  @patch("wikiedits.api.requests.get")
+  @patch("wikiedits.transport.requests.Session.get")
   def test_top_by_net_diff_date_splitting(self, mock_get, mock_split):
     """Test that date splitting is called correctly"""
     mock_response = Mock()
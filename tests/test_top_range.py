@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from wikiedits.client import top_range
+
+DAILY = {
+  "20250101": [
+    {"page_title": "A", "edits": 50, "rank": 1},
+    {"page_title": "B", "edits": 40, "rank": 2},
+    {"page_title": "C", "edits": 5, "rank": 3},
+  ],
+  "20250102": [
+    {"page_title": "B", "edits": 30, "rank": 1},
+    {"page_title": "C", "edits": 20, "rank": 2},
+  ],
+  "20250103": [
+    {"page_title": "C", "edits": 60, "rank": 1},
+  ],
+}
+
+
+class TestTopRange(unittest.TestCase):
+  @patch("wikiedits.client.top_by_edits")
+  def test_merges_daily_lists(self, mock_top_by_edits):
+    """Test that daily values are summed per title and re-ranked"""
+    mock_top_by_edits.side_effect = lambda **kwargs: DAILY[kwargs["date"]]
+
+    result = top_range("20250101", "20250104", count=2,
+                       project="en.wikipedia.org")
+
+    self.assertEqual(result, [
+      {"page_title": "C", "edits": 85, "rank": 1},
+      {"page_title": "B", "edits": 70, "rank": 2},
+    ])
+    dates = sorted(c.kwargs["date"] for c in mock_top_by_edits.call_args_list)
+    self.assertEqual(dates, ["20250101", "20250102", "20250103"])
+
+  @patch("wikiedits.client.top_by_net_diff")
+  def test_net_diff_field(self, mock_top_by_net_diff):
+    """Test that net-diff totals use the net_bytes_diff field"""
+    mock_top_by_net_diff.return_value = [
+      {"page_title": "A", "net_bytes_diff": 100, "rank": 1},
+    ]
+
+    result = top_range("20250101", "20250103", by="net-diff")
+
+    self.assertEqual(result,
+                     [{"page_title": "A", "net_bytes_diff": 200, "rank": 1}])
+
+  @patch("wikiedits.client.top_by_edits")
+  def test_single_day(self, mock_top_by_edits):
+    """Test that equal start and end dates cover one day"""
+    mock_top_by_edits.side_effect = lambda **kwargs: DAILY[kwargs["date"]]
+
+    result = top_range("2025-01-01", "2025-01-01", count=1)
+
+    mock_top_by_edits.assert_called_once()
+    self.assertEqual(result, [{"page_title": "A", "edits": 50, "rank": 1}])
+
+  @patch("wikiedits.client.top_by_edits")
+  def test_failed_day_raises(self, mock_top_by_edits):
+    """Test that a failed daily fetch fails the whole range"""
+    mock_top_by_edits.side_effect = requests.exceptions.RequestException(
+      "HTTP error 500: error")
+
+    with self.assertRaises(requests.exceptions.RequestException):
+      top_range("20250101", "20250103")
+
+  def test_invalid_by(self):
+    """Test that an unknown metric is rejected"""
+    with self.assertRaises(ValueError):
+      top_range("20250101", "20250103", by="invalid-metric")
+
+
+if __name__ == "__main__":
+  unittest.main()
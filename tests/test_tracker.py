@@ -0,0 +1,160 @@
+import os
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+import requests
+
+from tests.helpers import daily_results, not_found_response, series_response
+from wikiedits.api import edits_per_page
+from wikiedits.segments import disable_segment_cache, enable_segment_cache
+from wikiedits.tracker import Tracker
+
+
+def _edits_until(last_edit):
+  """Build a Session.get fake for a page whose edits stop before last_edit"""
+  def respond(url, **kwargs):
+    start, end = url.split("/")[-2:]
+    if start >= last_edit:
+      return not_found_response(url)
+    return series_response(url.replace(f"/{end}", f"/{min(end, last_edit)}"))
+  return respond
+
+
+class TestTracker(unittest.TestCase):
+  def setUp(self):
+    self.tracker = Tracker(":memory:", recheck_days=3)
+    self.calls = []
+    self.bump = 0
+
+  def tearDown(self):
+    self.tracker.close()
+
+  def fetch(self, start, end):
+    self.calls.append((start, end))
+    return daily_results(start, end, lambda day: day.day + self.bump)
+
+  def test_second_run_fetches_new_days_and_recheck_window(self):
+    """Test that a later run only fetches days after the final point"""
+    first = self.tracker.update("s", self.fetch, "20250101", "20250301",
+                                today=date(2025, 3, 1))
+    self.assertEqual(len(first), 59)
+    self.assertEqual(self.tracker.state("s"),
+                     {"first_day": "20250101", "final_until": "20250226"})
+
+    self.bump = 100  # late corrections upstream
+    second = self.tracker.update("s", self.fetch, "20250101", "20250305",
+                                 today=date(2025, 3, 5))
+
+    self.assertEqual(self.calls, [("20250101", "20250301"),
+                                  ("20250226", "20250305")])
+    self.assertEqual(len(second), 63)
+    self.assertEqual(second[:56], first[:56])
+    self.assertEqual(second[56]["edits"], 126)
+    self.assertEqual(self.tracker.state("s")["final_until"], "20250302")
+
+  def test_earlier_start_and_contained_ranges(self):
+    """Test backfilling history and serving old ranges locally"""
+    self.tracker.update("s", self.fetch, "20250201", "20250301",
+                        today=date(2025, 6, 1))
+    self.tracker.update("s", self.fetch, "20250101", "20250301",
+                        today=date(2025, 6, 1))
+    window = self.tracker.update("s", self.fetch, "20250110", "20250120",
+                                 today=date(2025, 6, 1))
+
+    self.assertEqual(self.calls, [("20250201", "20250301"),
+                                  ("20250101", "20250201")])
+    self.assertEqual([p["edits"] for p in window], list(range(10, 20)))
+
+  def test_series_are_independent_and_forgettable(self):
+    """Test separate keys and forget()"""
+    self.tracker.update("a", self.fetch, "20250101", "20250105",
+                        today=date(2025, 6, 1))
+    self.tracker.update("b", self.fetch, "20250101", "20250105",
+                        today=date(2025, 6, 1))
+    self.tracker.forget("a")
+    self.tracker.update("a", self.fetch, "20250101", "20250105",
+                        today=date(2025, 6, 1))
+
+    self.assertEqual(len(self.calls), 3)
+    self.assertIsNotNone(self.tracker.state("b"))
+
+  def test_state_persists(self):
+    """Test that a new tracker on the same file resumes"""
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, "tracker.sqlite")
+      tracker = Tracker(path)
+      tracker.update("s", self.fetch, "20250101", "20250110",
+                     today=date(2025, 6, 1))
+      tracker.close()
+
+      tracker = Tracker(path)
+      points = tracker.update("s", self.fetch, "20250101", "20250110",
+                              today=date(2025, 6, 1))
+      tracker.close()
+
+    self.assertEqual(len(self.calls), 1)
+    self.assertEqual(len(points), 9)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_edits_per_page(self, mock_get):
+    """Test the edits_per_page convenience wrapper"""
+    mock_get.side_effect = series_response
+
+    results = self.tracker.edits_per_page("en.wikipedia.org", "A",
+                                          "20250101", "20250103")
+
+    self.assertEqual(len(results), 2)
+    self.assertIn("/edits/per-page/en.wikipedia.org/A/all-editor-types/daily/"
+                  "20250101/20250103", mock_get.call_args.args[0])
+    self.assertIsNotNone(
+      self.tracker.state("edits/per-page/en.wikipedia.org/A/all-editor-types/daily")
+    )
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_per_page_without_recent_edits(self, mock_get):
+    """Test that a recheck window without data (404) counts as empty"""
+    def fetch(start, end):
+      return edits_per_page("en.wikipedia.org", "A", "daily", start, end)
+
+    mock_get.side_effect = _edits_until("20240309")
+    self.tracker.update("A", fetch, "20240101", "20240310",
+                        today=date(2024, 3, 10))
+
+    # The edits of 7 and 8 March were reverted upstream
+    mock_get.side_effect = _edits_until("20240307")
+    results = self.tracker.update("A", fetch, "20240101", "20240315",
+                                  today=date(2024, 3, 15))
+
+    self.assertEqual(len(results), 66)
+    self.assertEqual(results[-1]["timestamp"], "2024-03-06T00:00:00.000Z")
+    self.assertEqual(self.tracker.state("A")["final_until"], "20240312")
+
+    mock_get.side_effect = not_found_response
+    with self.assertRaises(requests.exceptions.RequestException):
+      self.tracker.update("B", fetch, "20240101", "20240315",
+                          today=date(2024, 3, 15))
+    self.assertIsNone(self.tracker.state("B"))
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_recheck_window_with_segment_cache(self, mock_get):
+    """Test that the recheck window still reaches upstream when the segment
+    cache is enabled"""
+    mock_get.side_effect = series_response
+    today = datetime.now(timezone.utc).date()
+    start = (today - timedelta(days=10)).strftime("%Y%m%d")
+    recheck = (today - timedelta(days=3)).strftime("%Y%m%d")
+    enable_segment_cache()
+    try:
+      self.tracker.edits_aggregate("en.wikipedia.org", start)
+      self.tracker.edits_aggregate("en.wikipedia.org", start)
+    finally:
+      disable_segment_cache()
+
+    self.assertEqual(mock_get.call_count, 2)
+    self.assertEqual(mock_get.call_args.args[0].split("/")[-2], recheck)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from wikiedits import transport
+from wikiedits.api import _make_request
+from wikiedits.transport import HTTPTransport, configure, get_transport, set_transport
+
+
+class TestTransport(unittest.TestCase):
+  def tearDown(self):
+    set_transport(None)
+
+  def test_adapter_uses_configured_pool_size(self):
+    """Test that the session adapter is sized by pool_size"""
+    t = HTTPTransport(pool_size=4)
+
+    adapter = t.session.get_adapter("https://wikimedia.org")
+    self.assertEqual(adapter._pool_maxsize, 4)
+    self.assertEqual(adapter._pool_connections, 4)
+
+  def test_invalid_pool_size(self):
+    """Test that a pool size below one is rejected"""
+    with self.assertRaises(ValueError):
+      HTTPTransport(pool_size=0)
+
+  def test_get_transport_is_shared(self):
+    """Test that get_transport() returns the same instance on every call"""
+    self.assertIs(get_transport(), get_transport())
+
+  def test_configure_replaces_and_closes_transport(self):
+    """Test that configure() swaps in a new transport and closes the old one"""
+    old = get_transport()
+    with patch.object(old, "close") as mock_close:
+      configure(pool_size=2)
+
+    mock_close.assert_called_once()
+    self.assertIsNot(get_transport(), old)
+    self.assertEqual(get_transport().pool_size, 2)
+
+  @patch("wikiedits.transport.requests.Session.get")
+  def test_requests_reuse_session(self, mock_get):
+    """Test that consecutive API requests go through one session"""
+    mock_response = Mock()
+    mock_response.json.return_value = {}
+    mock_response.raise_for_status = Mock()
+    mock_get.return_value = mock_response
+
+    _make_request("endpoint", "a")
+    session = transport._transport.session
+    _make_request("endpoint", "b")
+
+    self.assertIs(transport._transport.session, session)
+    self.assertEqual(mock_get.call_count, 2)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -1,4 +1,15 @@
-from .api import (
+"""
+Python client for the Wikimedia edits and bytes-difference APIs.
+
+Public names are loaded lazily: `import wikiedits` is cheap, and the modules
+behind a name (with requests, dateutil and numpy) are imported the first
+time that name is used.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover - eager imports for type checkers only
+  from .api import (
     bytes_diff_abs_aggregate,
     bytes_diff_abs_per_page,
     bytes_diff_net_aggregate,
@@ -10,14 +21,58 @@ from .api import (
     top_by_abs_diff,
     top_by_edits,
     top_by_net_diff,
-)
-from .client import bytes, edits, pages, top
+  )
+  from .bulk import (
+    PageResult,
+    bytes_diff_abs_per_page_many,
+    bytes_diff_net_per_page_many,
+    edits_per_page_many,
+  )
+  from .client import bytes, edits, edits_windows, pages, top, top_range
+  from .records import TopEntry
+  from .series import TimeSeries, rollup
+
+# Public name -> submodule that defines it
+_LAZY_NAMES: Dict[str, str] = {
+  "edits": "client",
+  "edits_windows": "client",
+  "bytes": "client",
+  "pages": "client",
+  "top": "client",
+  "top_range": "client",
+  "edits_aggregate": "api",
+  "edits_per_page": "api",
+  "bytes_diff_net_aggregate": "api",
+  "bytes_diff_net_per_page": "api",
+  "bytes_diff_abs_aggregate": "api",
+  "bytes_diff_abs_per_page": "api",
+  "new_pages": "api",
+  "edited_pages": "api",
+  "top_by_net_diff": "api",
+  "top_by_abs_diff": "api",
+  "top_by_edits": "api",
+  "edits_per_page_many": "bulk",
+  "bytes_diff_net_per_page_many": "bulk",
+  "bytes_diff_abs_per_page_many": "bulk",
+  "PageResult": "bulk",
+  "TopEntry": "records",
+  "TimeSeries": "series",
+  "rollup": "series",
+}
+
+_SUBMODULES = frozenset({
+  "aio", "api", "bulk", "cache", "cassette", "cli", "client", "coalesce",
+  "concurrency", "date_utils", "decode", "index", "metrics", "planner", "ratelimit",
+  "records", "segments", "series", "server", "sharding", "tracker", "transport",
+})
 
 __all__ = [
   "edits",
+  "edits_windows",
   "bytes",
   "pages",
   "top",
+  "top_range",
   "edits_aggregate",
   "edits_per_page",
   "bytes_diff_net_aggregate",
@@ -29,4 +84,27 @@ __all__ = [
   "top_by_net_diff",
   "top_by_abs_diff",
   "top_by_edits",
+  "edits_per_page_many",
+  "bytes_diff_net_per_page_many",
+  "bytes_diff_abs_per_page_many",
+  "PageResult",
+  "TopEntry",
+  "TimeSeries",
+  "rollup",
 ]
+
+
+def __getattr__(name: str) -> Any:
+  if name in _LAZY_NAMES:
+    value = getattr(import_module(f".{_LAZY_NAMES[name]}", __name__), name)
+  elif name in _SUBMODULES:
+    value = import_module(f".{name}", __name__)
+  else:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+  # Cache on the package so later lookups skip __getattr__
+  globals()[name] = value
+  return value
+
+
+def __dir__() -> List[str]:
+  return sorted(set(globals()) | set(_LAZY_NAMES) | _SUBMODULES)
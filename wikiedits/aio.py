@@ -0,0 +1,824 @@
+"""
+Asyncio counterparts of the functions in wikiedits.api and wikiedits.client.
+
+Requires the optional aiohttp dependency: pip install wikiedits-api[aio]
+"""
+import asyncio
+import builtins
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
+
+import requests
+
+from .api import (
+    DEFAULT_HEADERS,
+    _build_per_page_args,
+    _build_standard_args,
+    _build_top_by_args,
+    get_base_url,
+)
+from .date_utils import split_date, validate_dates
+from .decode import decode
+from .metrics import RequestStats, has_observers, notify
+from .ratelimit import (
+    RETRY_STATUSES,
+    get_rate_limiter,
+    get_retry_policy,
+    parse_retry_after,
+)
+from .records import TOP_BY_FIELDS, TOP_FIELDS, TopEntry, compact_top
+
+try:
+  import aiohttp
+except ImportError:  # pragma: no cover - exercised only without aiohttp
+  aiohttp = None  # type: ignore[assignment]
+
+DEFAULT_CONCURRENCY = 100
+DEFAULT_POOL_SIZE = 100
+
+
+class AsyncTransport:
+  """
+  Shared aiohttp session with a concurrency limit.
+
+  The session is created lazily inside the running event loop. A semaphore
+  caps the number of requests in flight so a single loop can issue hundreds
+  of calls without overwhelming the API or the local connection pool.
+
+  Args:
+    concurrency: Maximum number of requests in flight at once
+    pool_size: Maximum number of open connections in the session pool
+  """
+
+  def __init__(
+    self,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    pool_size: int = DEFAULT_POOL_SIZE,
+  ):
+    if aiohttp is None:
+      raise ImportError(
+        "wikiedits.aio requires aiohttp. Install it with "
+        "'pip install wikiedits-api[aio]'"
+      )
+    if concurrency < 1:
+      raise ValueError(
+        f"Invalid concurrency: {concurrency}. Must be at least 1"
+      )
+
+    self.concurrency = concurrency
+    self.pool_size = pool_size
+    self._session: Optional["aiohttp.ClientSession"] = None
+    self._semaphore: Optional[asyncio.Semaphore] = None
+    self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+  def _ensure_session(self) -> Tuple["aiohttp.ClientSession", asyncio.Semaphore]:
+    loop = asyncio.get_running_loop()
+    if self._session is None or self._session.closed or self._loop is not loop:
+      # Sessions and semaphores are bound to the loop that created them
+      connector = aiohttp.TCPConnector(limit=self.pool_size)
+      self._session = aiohttp.ClientSession(connector=connector)
+      self._semaphore = asyncio.Semaphore(self.concurrency)
+      self._loop = loop
+    return self._session, cast(asyncio.Semaphore, self._semaphore)
+
+  async def get(
+    self, url: str, headers: Dict[str, str], timeout: float
+  ) -> Tuple[int, Mapping[str, str], builtins.bytes]:
+    """
+    Send a GET request and return the status code, headers and raw body.
+    """
+    session, semaphore = self._ensure_session()
+    async with semaphore:
+      async with session.get(
+        url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+      ) as response:
+        return response.status, response.headers, await response.read()
+
+  async def close(self) -> None:
+    """
+    Close the underlying session and its connections.
+    """
+    if self._session is not None and not self._session.closed:
+      await self._session.close()
+    self._session = None
+
+
+_transport: Optional[AsyncTransport] = None
+
+
+def get_transport() -> AsyncTransport:
+  """
+  Return the shared async transport, creating it on first use.
+  """
+  global _transport
+  if _transport is None:
+    _transport = AsyncTransport()
+  return _transport
+
+
+def configure(
+  concurrency: int = DEFAULT_CONCURRENCY, pool_size: int = DEFAULT_POOL_SIZE
+) -> None:
+  """
+  Replace the shared async transport with one using the given limits.
+
+  Call close() first if the current transport has already been used.
+
+  Args:
+    concurrency: Maximum number of requests in flight at once
+    pool_size: Maximum number of open connections in the session pool
+  """
+  global _transport
+  _transport = AsyncTransport(concurrency=concurrency, pool_size=pool_size)
+
+
+async def close() -> None:
+  """
+  Close the shared async transport.
+  """
+  global _transport
+  if _transport is not None:
+    await _transport.close()
+    _transport = None
+
+
+async def _fetch(
+  url: str, stats: Optional[RequestStats] = None
+) -> Dict[str, object]:
+  """
+  Fetch and decode a URL over the shared async transport, retrying
+  throttled responses like wikiedits.api does.
+
+  The async transport does not split header and body timings, so only
+  wait, decode, size and retries are recorded in stats.
+
+  Raises:
+    requests.exceptions.RequestException: For all request-related errors
+  """
+  limiter = get_rate_limiter()
+  policy = get_retry_policy()
+  attempt = 0
+
+  while True:
+    wait = limiter.reserve()
+    await asyncio.sleep(wait)
+    if stats is not None:
+      stats.wait += wait
+    try:
+      status, headers, body = await get_transport().get(
+        url, headers=DEFAULT_HEADERS, timeout=30
+      )
+    except asyncio.TimeoutError:
+      raise requests.exceptions.RequestException(
+        f"Request timed out for URL: {url}"
+      )
+    except aiohttp.ClientConnectionError:
+      raise requests.exceptions.RequestException(
+        f"Failed to connect to API: {url}"
+      )
+    except aiohttp.ClientError as e:
+      raise requests.exceptions.RequestException(f"Request failed: {str(e)}")
+
+    if stats is not None:
+      stats.status = status
+      stats.size = len(body)
+    if status in RETRY_STATUSES and attempt < policy.max_retries:
+      retry_after = parse_retry_after(headers.get("Retry-After"))
+      limiter.on_throttle(retry_after)
+      if retry_after is None:
+        delay = policy.delay(attempt)
+        await asyncio.sleep(delay)
+        if stats is not None:
+          stats.wait += delay
+      attempt += 1
+      if stats is not None:
+        stats.retries = attempt
+      continue
+    break
+
+  if status >= 400:
+    text = body.decode("utf-8", errors="replace")
+    raise requests.exceptions.RequestException(f"HTTP error {status}: {text}")
+  limiter.on_success()
+
+  decoding = time.perf_counter()
+  try:
+    data = cast(Dict[str, object], decode(body))
+  except ValueError:
+    raise requests.exceptions.RequestException(f"Invalid JSON response from: {url}")
+  if stats is not None:
+    stats.decode = time.perf_counter() - decoding
+  return data
+
+
+async def _make_request(
+  endpoint: str, args: str, api_base_url: Optional[str] = None
+) -> Dict[str, object]:
+  """
+  Make async HTTP request to Wikimedia API endpoint with error handling.
+
+  Registered observers (see wikiedits.metrics) receive a RequestEvent for
+  every call.
+
+  Args:
+    endpoint: API endpoint path (e.g. 'edits/aggregate')
+    args: Formatted URL path arguments
+    api_base_url: Base URL for the API (defaults to get_base_url())
+
+  Returns:
+    dict: JSON response from the API
+
+  Raises:
+    requests.exceptions.RequestException: For all request-related errors
+  """
+  url = "/".join([api_base_url or get_base_url(), endpoint, args])
+  if not has_observers():
+    return await _fetch(url)
+
+  started = time.perf_counter()
+  stats = RequestStats()
+  try:
+    data = await _fetch(url, stats)
+  except BaseException as e:
+    notify(stats.event(endpoint, url, started, error=e))
+    raise
+  notify(stats.event(endpoint, url, started))
+  return data
+
+
+def _results(response: Dict[str, object]) -> List[Dict[str, Any]]:
+  items = cast(List[Dict[str, Any]], response["items"])
+  return cast(List[Dict[str, Any]], items[0]["results"])
+
+
+async def _make_standard_request(
+  endpoint: str,
+  project: str,
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+) -> List[Dict[str, Any]]:
+  """
+  Make a standard API request for aggregate endpoints.
+  """
+  start, end = validate_dates(granularity, start, end)
+  args = _build_standard_args(
+    project, editor_type, page_type, granularity, start, end
+  )
+  return _results(await _make_request(endpoint, args))
+
+
+async def _make_per_page_request(
+  endpoint: str,
+  project: str,
+  page_title: str,
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+) -> List[Dict[str, Any]]:
+  """
+  Make a per-page API request for specific page endpoints.
+  """
+  start, end = validate_dates(granularity, start, end)
+  args = _build_per_page_args(
+    project, page_title, editor_type, granularity, start, end
+  )
+  return _results(await _make_request(endpoint, args))
+
+
+async def _make_top_by_request(
+  endpoint: str,
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]:
+  """
+  Make a top-by API request for daily top pages endpoints.
+  """
+  year, month, day = split_date(date)
+  args = _build_top_by_args(project, editor_type, page_type, year, month, day)
+  results = _results(await _make_request(endpoint, args))
+  top = cast(List[Dict[str, Any]], results[0]["top"])
+  if compact:
+    return compact_top(top, TOP_BY_FIELDS[endpoint])
+  return top
+
+
+async def edits_aggregate(
+  project: str,
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+) -> List[Dict[str, Any]]:
+  """
+  Get number of edits.
+  """
+  return await _make_standard_request(
+    "edits/aggregate", project, granularity, start, end, editor_type, page_type
+  )
+
+
+async def edits_per_page(
+  project: str,
+  page_title: str,
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+) -> List[Dict[str, Any]]:
+  """
+  Get number of edits to a page.
+  """
+  return await _make_per_page_request(
+    "edits/per-page", project, page_title, granularity, start, end, editor_type
+  )
+
+
+async def bytes_diff_net_aggregate(
+  project: str,
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+) -> List[Dict[str, Any]]:
+  """
+  Get net byte changes (additions minus deletions).
+  """
+  return await _make_standard_request(
+    "bytes-difference/net/aggregate",
+    project,
+    granularity,
+    start,
+    end,
+    editor_type,
+    page_type,
+  )
+
+
+async def bytes_diff_net_per_page(
+  project: str,
+  page_title: str,
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+) -> List[Dict[str, Any]]:
+  """
+  Get net byte changes (additions minus deletions) to a page.
+  """
+  return await _make_per_page_request(
+    "bytes-difference/net/per-page",
+    project,
+    page_title,
+    granularity,
+    start,
+    end,
+    editor_type,
+  )
+
+
+async def bytes_diff_abs_aggregate(
+  project: str,
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+) -> List[Dict[str, Any]]:
+  """
+  Get absolute byte changes (additions plus deletions).
+  """
+  return await _make_standard_request(
+    "bytes-difference/absolute/aggregate",
+    project,
+    granularity,
+    start,
+    end,
+    editor_type,
+    page_type,
+  )
+
+
+async def bytes_diff_abs_per_page(
+  project: str,
+  page_title: str,
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+) -> List[Dict[str, Any]]:
+  """
+  Get absolute byte changes (additions plus deletions) to a page.
+  """
+  return await _make_per_page_request(
+    "bytes-difference/absolute/per-page",
+    project,
+    page_title,
+    granularity,
+    start,
+    end,
+    editor_type,
+  )
+
+
+async def new_pages(
+  project: str,
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+) -> List[Dict[str, Any]]:
+  """
+  Get number of new pages.
+  """
+  return await _make_standard_request(
+    "edited-pages/new", project, granularity, start, end, editor_type, page_type
+  )
+
+
+async def edited_pages(
+  project: str,
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  activity_level: str = "all-activity-levels",
+) -> List[Dict[str, Any]]:
+  """
+  Get number of edited pages.
+  """
+  start, end = validate_dates(granularity, start, end)
+  args = (
+    f"{project}/{editor_type}/{page_type}/{activity_level}/"
+    f"{granularity}/{start}/{end}"
+  )
+  return _results(await _make_request("edited-pages/aggregate", args))
+
+
+@overload
+async def top_by_net_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: Literal[False] = False,
+) -> List[Dict[str, Any]]: ...
+
+
+@overload
+async def top_by_net_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  *,
+  compact: Literal[True],
+) -> List[TopEntry]: ...
+
+
+@overload
+async def top_by_net_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]: ...
+
+
+async def top_by_net_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]:
+  """
+  List most-edited pages by net byte change (additions minus deletions).
+
+  With compact=True, returns TopEntry records instead of dicts.
+  """
+  return await _make_top_by_request(
+    "edited-pages/top-by-net-bytes-difference",
+    project,
+    date,
+    editor_type,
+    page_type,
+    compact,
+  )
+
+
+@overload
+async def top_by_abs_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: Literal[False] = False,
+) -> List[Dict[str, Any]]: ...
+
+
+@overload
+async def top_by_abs_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  *,
+  compact: Literal[True],
+) -> List[TopEntry]: ...
+
+
+@overload
+async def top_by_abs_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]: ...
+
+
+async def top_by_abs_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]:
+  """
+  List most-edited pages by absolute byte change (additions plus deletions).
+
+  With compact=True, returns TopEntry records instead of dicts.
+  """
+  return await _make_top_by_request(
+    "edited-pages/top-by-absolute-bytes-difference",
+    project,
+    date,
+    editor_type,
+    page_type,
+    compact,
+  )
+
+
+@overload
+async def top_by_edits(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: Literal[False] = False,
+) -> List[Dict[str, Any]]: ...
+
+
+@overload
+async def top_by_edits(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  *,
+  compact: Literal[True],
+) -> List[TopEntry]: ...
+
+
+@overload
+async def top_by_edits(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]: ...
+
+
+async def top_by_edits(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]:
+  """
+  List most-edited pages by number of edits.
+
+  With compact=True, returns TopEntry records instead of dicts.
+  """
+  return await _make_top_by_request(
+    "edited-pages/top-by-edits", project, date, editor_type, page_type, compact
+  )
+
+
+async def edits(
+  start: str,
+  end: str,
+  project: str = "all-projects",
+  page_title: Optional[str] = None,
+  editor_type: str = "all-editor-types",
+) -> int:
+  """
+  Get summed edit counts for a project or specific page.
+
+  Async counterpart of wikiedits.client.edits().
+  """
+  response: List[Dict[str, Any]]
+
+  if page_title:
+    response = await edits_per_page(
+      project=project,
+      page_title=page_title,
+      granularity="daily",
+      start=start,
+      end=end,
+      editor_type=editor_type,
+    )
+  else:
+    response = await edits_aggregate(
+      project=project,
+      granularity="daily",
+      start=start,
+      end=end,
+      editor_type=editor_type,
+    )
+
+  return sum(cast(int, item["edits"]) for item in response)
+
+
+async def bytes(
+  start: str,
+  end: str,
+  diff_type: str = "absolute",
+  project: str = "all-projects",
+  page_title: Optional[str] = None,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types"
+) -> int:
+  """
+  Get summed byte difference counts for a project or specific page.
+
+  Async counterpart of wikiedits.client.bytes().
+  """
+  response: List[Dict[str, Any]]
+
+  if page_title:
+    per_page = (
+      bytes_diff_abs_per_page if diff_type == "absolute"
+      else bytes_diff_net_per_page
+    )
+    response = await per_page(
+      project=project,
+      page_title=page_title,
+      granularity="daily",
+      start=start,
+      end=end,
+      editor_type=editor_type,
+    )
+  else:
+    aggregate = (
+      bytes_diff_abs_aggregate if diff_type == "absolute"
+      else bytes_diff_net_aggregate
+    )
+    response = await aggregate(
+      project=project,
+      granularity="daily",
+      start=start,
+      end=end,
+      editor_type=editor_type,
+      page_type=page_type,
+    )
+
+  field_name = "abs_bytes_diff" if diff_type == "absolute" else "net_bytes_diff"
+  return sum(cast(int, item[field_name]) for item in response)
+
+
+async def pages(
+  start: str,
+  end: str,
+  change_type: str = "edited",
+  project: str = "all-projects",
+  editor_type: str = "all-editor-types",
+  activity_level: str = "all-activity-levels",
+  page_type: str = "all-page-types"
+) -> int:
+  """
+  Get summed page counts for a project.
+
+  Async counterpart of wikiedits.client.pages().
+  """
+  response: List[Dict[str, Any]]
+
+  if change_type == "new":
+    response = await new_pages(
+      project=project,
+      granularity="daily",
+      start=start,
+      end=end,
+      editor_type=editor_type,
+      page_type=page_type,
+    )
+    return sum(cast(int, item["new_pages"]) for item in response)
+  else:  # change_type == "edited"
+    response = await edited_pages(
+      project=project,
+      granularity="daily",
+      start=start,
+      end=end,
+      editor_type=editor_type,
+      page_type=page_type,
+      activity_level=activity_level,
+    )
+    return sum(cast(int, item["edited_pages"]) for item in response)
+
+
+@overload
+async def top(
+  date: str,
+  by: str = "edits",
+  count: int = 10,
+  project: str = "all-projects",
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: Literal[False] = False,
+) -> List[Dict[str, Any]]: ...
+
+
+@overload
+async def top(
+  date: str,
+  by: str = "edits",
+  count: int = 10,
+  project: str = "all-projects",
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  *,
+  compact: Literal[True],
+) -> List[TopEntry]: ...
+
+
+@overload
+async def top(
+  date: str,
+  by: str = "edits",
+  count: int = 10,
+  project: str = "all-projects",
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]: ...
+
+
+async def top(
+  date: str,
+  by: str = "edits",
+  count: int = 10,
+  project: str = "all-projects",
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]:
+  """
+  Get top pages for a project on a specific date.
+
+  Async counterpart of wikiedits.client.top().
+  """
+  if by == "edits":
+    top_by = top_by_edits
+  elif by == "net-diff":
+    top_by = top_by_net_diff
+  elif by == "absolute-diff":
+    top_by = top_by_abs_diff
+  else:
+    raise ValueError(f"Invalid 'by' parameter: {by}. Must be 'edits', "
+                     f"'net-diff', or 'absolute-diff'")
+
+  response = await top_by(
+    project=project,
+    date=date,
+    editor_type=editor_type,
+    page_type=page_type,
+  )
+  entries = response[:count]
+  if compact:
+    return compact_top(entries, TOP_FIELDS[by])
+  return entries
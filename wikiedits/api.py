@@ -1,8 +1,25 @@
-from typing import Any, Dict, List, cast
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Literal, Optional, Union, cast, overload
 
 import requests
 
+from .cache import get_cache
+from .coalesce import SingleFlight
 from .date_utils import split_date, validate_dates
+from .decode import decode, get_decoder
+from .metrics import RequestEvent, RequestStats, has_observers, notify
+from .ratelimit import (
+    RETRY_STATUSES,
+    get_rate_limiter,
+    get_retry_policy,
+    parse_retry_after,
+)
+from .records import TOP_BY_FIELDS, TopEntry, compact_top
+from .segments import SeriesKey, get_segment_cache
+from .sharding import fetch_sharded
+from .transport import get_transport, is_rate_limited
 
 __version__ = "0.1.0"
 
@@ -13,17 +30,153 @@ DEFAULT_HEADERS = {
   "Accept": "application/json",
 }
 
+_base_url = BASE_URL
+
+# Per-context override of _base_url, set by use_base_url()
+_base_url_override: ContextVar[Optional[str]] = ContextVar(
+  "wikiedits_base_url", default=None
+)
+
+
+def get_base_url() -> str:
+  """
+  Return the base URL used by requests that don't pass api_base_url.
+  """
+  return _base_url_override.get() or _base_url
+
+
+def set_base_url(url: str = BASE_URL) -> None:
+  """
+  Point all API functions at a different base URL, such as a local mirror
+  or stub server. Call with no arguments to restore the Wikimedia API.
+  """
+  global _base_url
+  _base_url = url.rstrip("/")
+
+
+@contextmanager
+def use_base_url(url: str) -> Iterator[None]:
+  """
+  Send requests made in this context (including by worker threads the
+  library starts from it) to url, without changing the base URL of other
+  threads.
+  """
+  token = _base_url_override.set(url.rstrip("/"))
+  try:
+    yield
+  finally:
+    _base_url_override.reset(token)
+
+
+_in_flight: SingleFlight[Dict[str, object]] = SingleFlight()
+
+
+def _decode_response(response: requests.Response) -> Dict[str, object]:
+  """
+  Decode a response body with the active decoder (see wikiedits.decode).
+  """
+  if get_decoder() == "json":
+    # The stdlib path goes through requests, which also detects the charset
+    return cast(Dict[str, object], response.json())
+  return cast(Dict[str, object], decode(response.content))
+
+
+def _fetch(url: str, stats: Optional[RequestStats] = None) -> Dict[str, object]:
+  """
+  Fetch and decode a URL over the shared transport.
+
+  Every attempt waits for the shared rate limiter, unless the transport
+  never reaches the network (such as a cassette replay). Throttled or
+  temporarily unavailable responses are retried with jittered exponential
+  backoff, honoring any Retry-After header.
+
+  Args:
+    url: Full request URL
+    stats: Filled in with timings, status and size when given
+
+  Raises:
+    requests.exceptions.RequestException: For all request-related errors
+  """
+  limiter = get_rate_limiter()
+  policy = get_retry_policy()
+  transport = get_transport()
+  limited = is_rate_limited(transport)
+  attempt = 0
+
+  while True:
+    if limited and stats is None:
+      limiter.acquire()
+    elif limited and stats is not None:
+      waited = time.perf_counter()
+      limiter.acquire()
+      stats.wait += time.perf_counter() - waited
+    try:
+      # Make GET request over the shared pooled session with a 30 second timeout
+      sent = time.perf_counter()
+      response = transport.get(url, headers=DEFAULT_HEADERS, timeout=30)
+      if stats is not None:
+        stats.record_response(response, time.perf_counter() - sent)
+      if response.status_code in RETRY_STATUSES and attempt < policy.max_retries:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        # Retry-After pauses every caller through the limiter; otherwise back
+        # off individually with jitter
+        limiter.on_throttle(retry_after)
+        if retry_after is None:
+          delay = policy.delay(attempt)
+          time.sleep(delay)
+          if stats is not None:
+            stats.wait += delay
+        attempt += 1
+        if stats is not None:
+          stats.retries = attempt
+        continue
+      response.raise_for_status()  # Raise exception for HTTP error status codes
+      limiter.on_success()
+      if stats is None:
+        return _decode_response(response)
+      decoding = time.perf_counter()
+      data = _decode_response(response)
+      stats.decode = time.perf_counter() - decoding
+      return data
+    except requests.exceptions.Timeout:
+      raise requests.exceptions.RequestException(
+        f"Request timed out for URL: {url}"
+      )
+    except requests.exceptions.ConnectionError:
+      raise requests.exceptions.RequestException(
+        f"Failed to connect to API: {url}"
+      )
+    except requests.exceptions.HTTPError:
+      raise requests.exceptions.RequestException(
+        f"HTTP error {response.status_code}: {response.text}", response=response
+      )
+    except requests.exceptions.JSONDecodeError:
+      raise requests.exceptions.RequestException(
+        f"Invalid JSON response from: {url}"
+      )
+    except requests.exceptions.RequestException as e:
+      raise requests.exceptions.RequestException(f"Request failed: {str(e)}")
+    except ValueError:
+      # Raised by the orjson and msgspec decoders
+      raise requests.exceptions.RequestException(
+        f"Invalid JSON response from: {url}"
+      )
+
 
 def _make_request(
-  endpoint: str, args: str, api_base_url: str = BASE_URL
+  endpoint: str, args: str, api_base_url: Optional[str] = None
 ) -> Dict[str, object]:
   """
   Make HTTP request to Wikimedia API endpoint with error handling.
 
+  Responses are served from the response cache when it is enabled, and
+  concurrent requests for the same URL share a single fetch. Registered
+  observers (see wikiedits.metrics) receive a RequestEvent for every call.
+
   Args:
     endpoint: API endpoint path (e.g. 'edits/aggregate')
     args: Formatted URL path arguments
-    api_base_url: Base URL for the API (defaults to Wikimedia REST API)
+    api_base_url: Base URL for the API (defaults to get_base_url())
 
   Returns:
     dict: JSON response from the API
@@ -32,25 +185,42 @@ def _make_request(
     requests.exceptions.RequestException: For all request-related errors
   """
   # Construct full URL by joining base URL, endpoint, and arguments
-  url = "/".join([api_base_url, endpoint, args])
+  url = "/".join([api_base_url or get_base_url(), endpoint, args])
+  observed = has_observers()
+  started = time.perf_counter() if observed else 0.0
+
+  cache = get_cache()
+  if cache is not None:
+    cached = cache.get(url)
+    if cached is not None:
+      if observed:
+        notify(RequestEvent(
+          endpoint, url, total=time.perf_counter() - started, cache_hit=True
+        ))
+      return cached
+
+  stats = RequestStats() if observed else None
+  led = False
+
+  def load() -> Dict[str, object]:
+    nonlocal led
+    led = True
+    data = _fetch(url, stats)
+    if cache is not None:
+      cache.set(url, data, cache.ttl_for(args))
+    return data
+
+  if stats is None:
+    # Concurrent requests for the same URL share one in-flight fetch
+    return _in_flight.do(url, load)
 
   try:
-    # Make GET request with default headers and 30 second timeout
-    response = requests.get(url, headers=DEFAULT_HEADERS, timeout=30)
-    response.raise_for_status()  # Raise exception for HTTP error status codes
-    return cast(Dict[str, object], response.json())
-  except requests.exceptions.Timeout:
-    raise requests.exceptions.RequestException(f"Request timed out for URL: {url}")
-  except requests.exceptions.ConnectionError:
-    raise requests.exceptions.RequestException(f"Failed to connect to API: {url}")
-  except requests.exceptions.HTTPError:
-    raise requests.exceptions.RequestException(
-      f"HTTP error {response.status_code}: {response.text}"
-    )
-  except requests.exceptions.JSONDecodeError:
-    raise requests.exceptions.RequestException(f"Invalid JSON response from: {url}")
-  except requests.exceptions.RequestException as e:
-    raise requests.exceptions.RequestException(f"Request failed: {str(e)}")
+    data = _in_flight.do(url, load)
+  except BaseException as e:
+    notify(stats.event(endpoint, url, started, coalesced=not led, error=e))
+    raise
+  notify(stats.event(endpoint, url, started, coalesced=not led))
+  return data
 
 
 def _build_standard_args(
@@ -101,15 +271,27 @@ def _make_standard_request(
 ) -> List[Dict[str, object]]:
   """
   Make a standard API request for aggregate endpoints.
+
+  Long daily ranges are fetched as concurrent chunks (see wikiedits.sharding).
   """
   start, end = validate_dates(granularity, start, end)
-  args = _build_standard_args(
-    project, editor_type, page_type, granularity, start, end
-  )
-  response = _make_request(endpoint, args)
-  items = cast(List[Dict[str, Any]], response["items"])
-  results = cast(List[Dict[str, object]], items[0]["results"])
-  return results
+
+  def request(start: str, end: str) -> List[Dict[str, Any]]:
+    args = _build_standard_args(
+      project, editor_type, page_type, granularity, start, end
+    )
+    response = _make_request(endpoint, args)
+    items = cast(List[Dict[str, Any]], response["items"])
+    return cast(List[Dict[str, Any]], items[0]["results"])
+
+  def fetch(start: str, end: str) -> List[Dict[str, Any]]:
+    return fetch_sharded(request, start, end, granularity)
+
+  segments = get_segment_cache()
+  if segments is None:
+    return fetch(start, end)
+  key = SeriesKey(endpoint, project, None, editor_type, page_type, granularity)
+  return segments.query(key, start, end, fetch)
 
 
 def _make_per_page_request(
@@ -123,15 +305,27 @@ def _make_per_page_request(
 ) -> List[Dict[str, Any]]:
   """
   Make a per-page API request for specific page endpoints.
+
+  Long daily ranges are fetched as concurrent chunks (see wikiedits.sharding).
   """
   start, end = validate_dates(granularity, start, end)
-  args = _build_per_page_args(
-    project, page_title, editor_type, granularity, start, end
-  )
-  response = _make_request(endpoint, args)
-  items = cast(List[Dict[str, Any]], response["items"])
-  results = cast(List[Dict[str, Any]], items[0]["results"])
-  return results
+
+  def request(start: str, end: str) -> List[Dict[str, Any]]:
+    args = _build_per_page_args(
+      project, page_title, editor_type, granularity, start, end
+    )
+    response = _make_request(endpoint, args)
+    items = cast(List[Dict[str, Any]], response["items"])
+    return cast(List[Dict[str, Any]], items[0]["results"])
+
+  def fetch(start: str, end: str) -> List[Dict[str, Any]]:
+    return fetch_sharded(request, start, end, granularity)
+
+  segments = get_segment_cache()
+  if segments is None:
+    return fetch(start, end)
+  key = SeriesKey(endpoint, project, page_title, editor_type, None, granularity)
+  return segments.query(key, start, end, fetch)
 
 
 def _make_top_by_request(
@@ -140,9 +334,13 @@ def _make_top_by_request(
   date: str,
   editor_type: str = "all-editor-types",
   page_type: str = "all-page-types",
-) -> List[Dict[str, object]]:
+  compact: bool = False,
+) -> Union[List[Dict[str, object]], List[TopEntry]]:
   """
   Make a top-by API request for daily top pages endpoints.
+
+  With compact=True, entries are returned as TopEntry records with
+  interned titles instead of dicts.
   """
   year, month, day = split_date(date)
   args = _build_top_by_args(project, editor_type, page_type, year, month, day)
@@ -150,6 +348,8 @@ def _make_top_by_request(
   items = cast(List[Dict[str, Any]], response["items"])
   results = cast(List[Dict[str, Any]], items[0]["results"])
   top = cast(List[Dict[str, object]], results[0]["top"])
+  if compact:
+    return compact_top(top, TOP_BY_FIELDS[endpoint])
   return top
 
 
@@ -312,14 +512,48 @@ def edited_pages(
   return results
 
 
+@overload
 def top_by_net_diff(
   project: str,
   date: str,
   editor_type: str = "all-editor-types",
   page_type: str = "all-page-types",
-) -> List[Dict[str, Any]]:
+  compact: Literal[False] = False,
+) -> List[Dict[str, Any]]: ...
+
+
+@overload
+def top_by_net_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  *,
+  compact: Literal[True],
+) -> List[TopEntry]: ...
+
+
+@overload
+def top_by_net_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]: ...
+
+
+def top_by_net_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]:
   """
   List most-edited pages by net byte change (additions minus deletions).
+
+  With compact=True, returns TopEntry records instead of dicts.
   """
   return _make_top_by_request(
     "edited-pages/top-by-net-bytes-difference",
@@ -327,17 +561,52 @@ def top_by_net_diff(
     date,
     editor_type,
     page_type,
+    compact,
   )
 
 
+@overload
 def top_by_abs_diff(
   project: str,
   date: str,
   editor_type: str = "all-editor-types",
   page_type: str = "all-page-types",
-) -> List[Dict[str, Any]]:
+  compact: Literal[False] = False,
+) -> List[Dict[str, Any]]: ...
+
+
+@overload
+def top_by_abs_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  *,
+  compact: Literal[True],
+) -> List[TopEntry]: ...
+
+
+@overload
+def top_by_abs_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]: ...
+
+
+def top_by_abs_diff(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]:
   """
   List most-edited pages by absolute byte change (additions plus deletions).
+
+  With compact=True, returns TopEntry records instead of dicts.
   """
   return _make_top_by_request(
     "edited-pages/top-by-absolute-bytes-difference",
@@ -345,18 +614,53 @@ def top_by_abs_diff(
     date,
     editor_type,
     page_type,
+    compact,
   )
 
 
+@overload
 def top_by_edits(
   project: str,
   date: str,
   editor_type: str = "all-editor-types",
   page_type: str = "all-page-types",
-) -> List[Dict[str, Any]]:
+  compact: Literal[False] = False,
+) -> List[Dict[str, Any]]: ...
+
+
+@overload
+def top_by_edits(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  *,
+  compact: Literal[True],
+) -> List[TopEntry]: ...
+
+
+@overload
+def top_by_edits(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]: ...
+
+
+def top_by_edits(
+  project: str,
+  date: str,
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]:
   """
   List most-edited pages by number of edits.
+
+  With compact=True, returns TopEntry records instead of dicts.
   """
   return _make_top_by_request(
-    "edited-pages/top-by-edits", project, date, editor_type, page_type
+    "edited-pages/top-by-edits", project, date, editor_type, page_type, compact
   )
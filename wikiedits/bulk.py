@@ -0,0 +1,114 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from .api import bytes_diff_abs_per_page, bytes_diff_net_per_page, edits_per_page
+from .concurrency import imap_unordered
+from .transport import DEFAULT_POOL_SIZE
+
+DEFAULT_MAX_WORKERS = DEFAULT_POOL_SIZE
+
+
+class PageResult(NamedTuple):
+  """
+  Outcome of one page in a bulk request.
+
+  Exactly one of results and error is set.
+  """
+
+  page_title: str
+  results: Optional[List[Dict[str, Any]]]
+  error: Optional[BaseException]
+
+
+def _fetch_many(
+  fetch: Callable[..., List[Dict[str, Any]]],
+  project: str,
+  page_titles: Iterable[str],
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str,
+  max_workers: int,
+) -> Iterator[PageResult]:
+  """
+  Run a per-page function over many titles on a bounded thread pool.
+
+  Titles are consumed lazily, so memory stays flat for arbitrarily long
+  inputs. Results are yielded in completion order.
+  """
+
+  def fetch_one(title: str) -> List[Dict[str, Any]]:
+    return fetch(
+      project=project,
+      page_title=title,
+      granularity=granularity,
+      start=start,
+      end=end,
+      editor_type=editor_type,
+    )
+
+  for title, results, error in imap_unordered(fetch_one, page_titles, max_workers):
+    yield PageResult(title, results, error)
+
+
+def edits_per_page_many(
+  project: str,
+  page_titles: Iterable[str],
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+  max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[PageResult]:
+  """
+  Get number of edits to many pages concurrently.
+
+  Yields a PageResult per title as soon as its request finishes. A failed
+  title is reported through PageResult.error without stopping the batch.
+  """
+  return _fetch_many(
+    edits_per_page, project, page_titles, granularity, start, end,
+    editor_type, max_workers,
+  )
+
+
+def bytes_diff_net_per_page_many(
+  project: str,
+  page_titles: Iterable[str],
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+  max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[PageResult]:
+  """
+  Get net byte changes (additions minus deletions) to many pages concurrently.
+
+  Yields a PageResult per title as soon as its request finishes. A failed
+  title is reported through PageResult.error without stopping the batch.
+  """
+  return _fetch_many(
+    bytes_diff_net_per_page, project, page_titles, granularity, start, end,
+    editor_type, max_workers,
+  )
+
+
+def bytes_diff_abs_per_page_many(
+  project: str,
+  page_titles: Iterable[str],
+  granularity: str,
+  start: str,
+  end: str,
+  editor_type: str = "all-editor-types",
+  max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[PageResult]:
+  """
+  Get absolute byte changes (additions plus deletions) to many pages
+  concurrently.
+
+  Yields a PageResult per title as soon as its request finishes. A failed
+  title is reported through PageResult.error without stopping the batch.
+  """
+  return _fetch_many(
+    bytes_diff_abs_per_page, project, page_titles, granularity, start, end,
+    editor_type, max_workers,
+  )
@@ -0,0 +1,187 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from .decode import decode
+
+DEFAULT_CACHE_PATH = os.path.join(
+  os.path.expanduser("~"), ".cache", "wikiedits", "responses.sqlite"
+)
+DEFAULT_RECENT_DAYS = 3
+DEFAULT_RECENT_TTL = 3600.0
+
+
+def _end_date(args: str) -> Optional[date]:
+  """
+  Find the last date covered by a request from its URL path arguments.
+
+  Standard and per-page arguments end in a YYYYMMDD end date; top-by
+  arguments end in YYYY/MM/DD.
+  """
+  parts = args.split("/")
+  try:
+    if len(parts[-1]) == 8 and parts[-1].isdigit():
+      return datetime.strptime(parts[-1], "%Y%m%d").date()
+    if len(parts) >= 3 and all(p.isdigit() for p in parts[-3:]):
+      return date(int(parts[-3]), int(parts[-2]), int(parts[-1]))
+  except ValueError:
+    pass
+  return None
+
+
+class ResponseCache:
+  """
+  SQLite-backed cache of decoded API responses, keyed by request URL.
+
+  Historical analytics data never changes, so responses for ranges that end
+  more than recent_days ago are kept forever. Ranges that reach into the
+  last few days may still be revised upstream and expire after recent_ttl
+  seconds.
+
+  Args:
+    path: SQLite database file, or ":memory:" for a per-process cache
+    recent_days: Ranges ending within this many days of today are "recent"
+    recent_ttl: Lifetime in seconds of cached responses for recent ranges
+  """
+
+  def __init__(
+    self,
+    path: str = DEFAULT_CACHE_PATH,
+    recent_days: int = DEFAULT_RECENT_DAYS,
+    recent_ttl: float = DEFAULT_RECENT_TTL,
+  ):
+    if path != ":memory:":
+      os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    self.path = path
+    self.recent_days = recent_days
+    self.recent_ttl = recent_ttl
+    self._lock = threading.Lock()
+    self._conn = sqlite3.connect(path, check_same_thread=False)
+    with self._lock, self._conn:
+      self._conn.execute("PRAGMA journal_mode=WAL")
+      self._conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        " url TEXT PRIMARY KEY,"
+        " body TEXT NOT NULL,"
+        " expires_at REAL)"
+      )
+
+  def ttl_for(self, args: str, today: Optional[date] = None) -> Optional[float]:
+    """
+    Return the cache lifetime in seconds for a request, or None for forever.
+
+    Args:
+      args: Formatted URL path arguments of the request
+      today: Reference date (defaults to the current UTC date)
+    """
+    end = _end_date(args)
+    if end is None:
+      return self.recent_ttl
+
+    if today is None:
+      today = datetime.now(timezone.utc).date()
+    if end < today - timedelta(days=self.recent_days):
+      return None
+    return self.recent_ttl
+
+  def get(self, url: str) -> Optional[Dict[str, object]]:
+    """
+    Return the cached response for url, or None if missing or expired.
+    """
+    with self._lock:
+      row = self._conn.execute(
+        "SELECT body, expires_at FROM responses WHERE url = ?", (url,)
+      ).fetchone()
+    if row is None:
+      return None
+
+    body, expires_at = row
+    if expires_at is not None and expires_at <= time.time():
+      return None
+    return decode(body)  # type: ignore[no-any-return]
+
+  def set(
+    self, url: str, response: Dict[str, object], ttl: Optional[float]
+  ) -> None:
+    """
+    Store a response for url. A ttl of None caches it forever.
+    """
+    expires_at = None if ttl is None else time.time() + ttl
+    body = json.dumps(response, separators=(",", ":"))
+    with self._lock, self._conn:
+      self._conn.execute(
+        "INSERT OR REPLACE INTO responses (url, body, expires_at) VALUES (?, ?, ?)",
+        (url, body, expires_at),
+      )
+
+  def purge_expired(self) -> int:
+    """
+    Delete expired entries and return how many were removed.
+    """
+    with self._lock, self._conn:
+      cursor = self._conn.execute(
+        "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+        (time.time(),),
+      )
+    return cursor.rowcount
+
+  def clear(self) -> None:
+    """
+    Delete all cached responses.
+    """
+    with self._lock, self._conn:
+      self._conn.execute("DELETE FROM responses")
+
+  def close(self) -> None:
+    """
+    Close the database connection.
+    """
+    with self._lock:
+      self._conn.close()
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_cache() -> Optional[ResponseCache]:
+  """
+  Return the active response cache, or None if caching is disabled.
+  """
+  return _cache
+
+
+def enable_cache(
+  path: str = DEFAULT_CACHE_PATH,
+  recent_days: int = DEFAULT_RECENT_DAYS,
+  recent_ttl: float = DEFAULT_RECENT_TTL,
+) -> ResponseCache:
+  """
+  Turn on the persistent response cache for all API calls.
+
+  Args:
+    path: SQLite database file, or ":memory:" for a per-process cache
+    recent_days: Ranges ending within this many days of today are "recent"
+    recent_ttl: Lifetime in seconds of cached responses for recent ranges
+
+  Returns:
+    The new active ResponseCache.
+  """
+  global _cache
+  disable_cache()
+  _cache = ResponseCache(path, recent_days=recent_days, recent_ttl=recent_ttl)
+  return _cache
+
+
+def disable_cache() -> None:
+  """
+  Turn off the response cache and close its database.
+  """
+  global _cache
+  if _cache is not None:
+    _cache.close()
+    _cache = None
@@ -0,0 +1,225 @@
+"""
+Record and replay transports for deterministic offline runs.
+
+A cassette is an SQLite file with one row per URL, indexed by URL, holding
+the status, a few headers, the zlib-compressed body and the original
+response time. Lookups are B-tree seeks, so replay stays fast with
+millions of recorded requests.
+
+  from wikiedits import transport
+  from wikiedits.cassette import RecordingTransport, ReplayTransport
+
+  transport.set_transport(RecordingTransport("traffic.cassette"))
+  ...  # run the workload against the live API
+  transport.set_transport(ReplayTransport("traffic.cassette", latency=0.05))
+  ...  # rerun it offline
+
+Replays bypass the shared rate limiter, which only protects the live API.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import timedelta
+from typing import Dict, NamedTuple, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .ratelimit import RETRY_STATUSES
+from .transport import HTTPTransport, Transport
+
+# Response headers worth keeping; everything else is connection detail
+RECORDED_HEADERS = ("Content-Type", "Retry-After")
+
+
+class Interaction(NamedTuple):
+  """
+  One recorded response.
+  """
+
+  url: str
+  status: int
+  headers: Dict[str, str]
+  body: bytes
+  elapsed: float
+
+
+class Cassette:
+  """
+  Indexed store of recorded responses, keyed by URL.
+
+  Args:
+    path: SQLite file to create or open
+  """
+
+  def __init__(self, path: str):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    self.path = path
+    self._lock = threading.Lock()
+    self._conn = sqlite3.connect(path, check_same_thread=False)
+    with self._lock, self._conn:
+      self._conn.execute("PRAGMA journal_mode=WAL")
+      self._conn.execute("PRAGMA synchronous=NORMAL")
+      self._conn.execute(
+        "CREATE TABLE IF NOT EXISTS interactions ("
+        " url TEXT PRIMARY KEY,"
+        " status INTEGER NOT NULL,"
+        " headers TEXT NOT NULL,"
+        " body BLOB NOT NULL,"
+        " elapsed REAL NOT NULL"
+        ") WITHOUT ROWID"
+      )
+
+  def __len__(self) -> int:
+    with self._lock:
+      row = self._conn.execute("SELECT COUNT(*) FROM interactions").fetchone()
+    return int(row[0])
+
+  def put(self, interaction: Interaction) -> None:
+    """
+    Store an interaction, replacing any earlier one for the same URL.
+    """
+    with self._lock, self._conn:
+      self._conn.execute(
+        "INSERT OR REPLACE INTO interactions (url, status, headers, body, elapsed)"
+        " VALUES (?, ?, ?, ?, ?)",
+        (
+          interaction.url,
+          interaction.status,
+          json.dumps(interaction.headers, separators=(",", ":")),
+          zlib.compress(interaction.body),
+          interaction.elapsed,
+        ),
+      )
+
+  def get(self, url: str) -> Optional[Interaction]:
+    """
+    Return the interaction recorded for url, or None.
+    """
+    with self._lock:
+      row = self._conn.execute(
+        "SELECT status, headers, body, elapsed FROM interactions WHERE url = ?",
+        (url,),
+      ).fetchone()
+    if row is None:
+      return None
+    status, headers, body, elapsed = row
+    return Interaction(url, status, json.loads(headers), zlib.decompress(body), elapsed)
+
+  def close(self) -> None:
+    """
+    Close the database connection.
+    """
+    with self._lock:
+      self._conn.close()
+
+
+def _to_response(interaction: Interaction) -> requests.Response:
+  response = requests.Response()
+  response.url = interaction.url
+  response.status_code = interaction.status
+  response.headers = CaseInsensitiveDict(interaction.headers)
+  response._content = interaction.body
+  response.encoding = "utf-8"
+  response.elapsed = timedelta(seconds=interaction.elapsed)
+  return response
+
+
+class RecordingTransport:
+  """
+  Transport that forwards requests to another transport and records each
+  final response in a cassette.
+
+  Throttling and temporary failures (429, 502, 503, 504) are not recorded,
+  so a replay sees the response the caller eventually got.
+
+  Args:
+    path: Cassette file to write
+    inner: Transport that performs the requests (defaults to a new
+      HTTPTransport)
+  """
+
+  def __init__(self, path: str, inner: Optional[Transport] = None):
+    self.cassette = Cassette(path)
+    self.inner = inner if inner is not None else HTTPTransport()
+
+  def get(
+    self, url: str, headers: Dict[str, str], timeout: float
+  ) -> requests.Response:
+    """
+    Send the request through the inner transport and record the response.
+    """
+    response = self.inner.get(url, headers=headers, timeout=timeout)
+    if response.status_code not in RETRY_STATUSES:
+      recorded = {
+        name: response.headers[name]
+        for name in RECORDED_HEADERS
+        if name in response.headers
+      }
+      self.cassette.put(Interaction(
+        url, response.status_code, recorded, response.content,
+        response.elapsed.total_seconds(),
+      ))
+    return response
+
+  def close(self) -> None:
+    """
+    Close the inner transport and the cassette.
+    """
+    self.inner.close()
+    self.cassette.close()
+
+
+class ReplayTransport:
+  """
+  Transport that serves responses from a cassette without any network I/O.
+
+  Replayed requests skip the shared rate limiter (rate_limited is False),
+  so a replay runs as fast as the library allows; use latency to simulate
+  the network instead.
+
+  Args:
+    path: Cassette file to read
+    latency: Seconds to wait before returning each response
+    recorded_latency: Also wait for each response's originally recorded
+      response time
+  """
+
+  rate_limited = False
+
+  def __init__(
+    self, path: str, latency: float = 0.0, recorded_latency: bool = False
+  ):
+    if not os.path.exists(path):
+      raise FileNotFoundError(f"Cassette not found: {path}")
+    self.cassette = Cassette(path)
+    self.latency = latency
+    self.recorded_latency = recorded_latency
+
+  def get(
+    self, url: str, headers: Dict[str, str], timeout: float
+  ) -> requests.Response:
+    """
+    Return the recorded response for url.
+
+    Raises:
+      requests.exceptions.ConnectionError: If url was never recorded
+    """
+    interaction = self.cassette.get(url)
+    if interaction is None:
+      raise requests.exceptions.ConnectionError(f"No recorded response for {url}")
+    delay = self.latency + (interaction.elapsed if self.recorded_latency else 0.0)
+    if delay > 0:
+      time.sleep(delay)
+    return _to_response(interaction)
+
+  def close(self) -> None:
+    """
+    Close the cassette.
+    """
+    self.cassette.close()
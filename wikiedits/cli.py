@@ -0,0 +1,199 @@
+"""
+Command-line interface: run a manifest of queries and stream NDJSON results.
+
+Each manifest row names a function and its arguments. In CSV, the columns
+are 'function' plus any parameter names, and empty cells are left out. In
+JSONL, each line is an object such as
+{"function": "edits", "start": "20240101", "end": "20240201"}.
+
+Every completed query is written to stdout as one JSON line, in completion
+order: {"line": N, "query": {...}, "result": ...} on success or
+{"line": N, "query": {...}, "error": "..."} on failure.
+"""
+import argparse
+import csv
+import inspect
+import json
+import sys
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+from . import ratelimit, transport
+from .bulk import DEFAULT_MAX_WORKERS
+from .concurrency import imap_unordered
+
+# Functions a manifest row can call, looked up on the wikiedits package
+FUNCTIONS = frozenset({
+  "edits", "bytes", "pages", "top", "top_range",
+  "edits_aggregate", "edits_per_page",
+  "bytes_diff_net_aggregate", "bytes_diff_net_per_page",
+  "bytes_diff_abs_aggregate", "bytes_diff_abs_per_page",
+  "new_pages", "edited_pages",
+  "top_by_net_diff", "top_by_abs_diff", "top_by_edits",
+})
+
+_BOOLEANS = {
+  "true": True, "1": True, "yes": True,
+  "false": False, "0": False, "no": False,
+}
+
+Query = Union[Dict[str, Any], ValueError]
+
+
+def read_manifest(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Query]]:
+  """
+  Lazily yield (line number, query) pairs from a CSV or JSONL manifest.
+
+  Rows that cannot be parsed are yielded as a ValueError in place of the
+  query, so one bad row doesn't stop the run.
+
+  Args:
+    stream: Open manifest file
+    fmt: 'csv' or 'jsonl'
+  """
+  if fmt == "csv":
+    reader = csv.DictReader(stream)
+    for row in reader:
+      query = {k: v for k, v in row.items() if k and v not in (None, "")}
+      yield reader.line_num, query
+    return
+
+  for line_no, line in enumerate(stream, start=1):
+    if not line.strip():
+      continue
+    try:
+      query = json.loads(line)
+    except ValueError as e:
+      yield line_no, ValueError(f"Invalid JSON: {e}")
+      continue
+    if not isinstance(query, dict):
+      yield line_no, ValueError("Each JSONL line must be an object")
+      continue
+    yield line_no, query
+
+
+def _convert(fn: Any, arguments: Dict[str, Any]) -> Dict[str, Any]:
+  """
+  Convert string manifest values to the int and bool parameters a function
+  expects.
+
+  Raises:
+    ValueError: If an argument is unknown or its value cannot be converted
+  """
+  parameters = inspect.signature(fn).parameters
+  converted = {}
+  for name, value in arguments.items():
+    if name not in parameters:
+      raise ValueError(f"Unexpected argument: {name}")
+    annotation = parameters[name].annotation
+    if annotation is int and isinstance(value, str):
+      value = int(value)
+    elif annotation is bool and isinstance(value, str):
+      if value.lower() not in _BOOLEANS:
+        raise ValueError(
+          f"Invalid value for {name}: {value!r}. Expected true or false"
+        )
+      value = _BOOLEANS[value.lower()]
+    converted[name] = value
+  return converted
+
+
+def run_query(query: Query) -> Any:
+  """
+  Run one manifest query and return its result.
+
+  Raises:
+    ValueError: If the query names an unknown function or bad arguments
+  """
+  if isinstance(query, ValueError):
+    raise query
+  arguments = dict(query)
+  name = arguments.pop("function", None)
+  if name not in FUNCTIONS:
+    raise ValueError(
+      f"Unknown function: {name}. Expected one of {', '.join(sorted(FUNCTIONS))}"
+    )
+
+  import wikiedits
+
+  fn = getattr(wikiedits, name)
+  return fn(**_convert(fn, arguments))
+
+
+def _format(path: str, fmt: Optional[str]) -> str:
+  if fmt:
+    return fmt
+  return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+  parser = argparse.ArgumentParser(
+    prog="wikiedits",
+    description="Run a manifest of Wikimedia edit queries and stream NDJSON "
+    "results to stdout.",
+  )
+  parser.add_argument("manifest", help="CSV or JSONL manifest, or - for stdin")
+  parser.add_argument("--format", choices=("csv", "jsonl"),
+                      help="manifest format (default: from the file extension, "
+                      "jsonl for stdin)")
+  parser.add_argument("--parallel", type=int, default=DEFAULT_MAX_WORKERS,
+                      help="queries run concurrently (default: %(default)s)")
+  parser.add_argument("--rate", type=float,
+                      help="maximum requests per second (default: adaptive)")
+  parser.add_argument("--cache", metavar="PATH",
+                      help="enable the response cache at this SQLite path")
+  return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+  """
+  Entry point of the wikiedits command.
+
+  Returns:
+    Exit status: 0 if every query succeeded, 1 otherwise.
+  """
+  options = _parse_args(argv)
+  if options.parallel < 1:
+    print("wikiedits: --parallel must be at least 1", file=sys.stderr)
+    return 2
+
+  transport.configure(pool_size=max(options.parallel, transport.DEFAULT_POOL_SIZE))
+  if options.rate is not None:
+    ratelimit.configure(
+      rate=options.rate, min_rate=min(options.rate, ratelimit.DEFAULT_MIN_RATE),
+      max_rate=options.rate,
+    )
+  if options.cache:
+    from .cache import enable_cache
+
+    enable_cache(options.cache)
+
+  fmt = _format(options.manifest, options.format)
+  stream = (
+    sys.stdin if options.manifest == "-"
+    else open(options.manifest, newline="", encoding="utf-8")
+  )
+  failed = False
+  try:
+    results = imap_unordered(
+      lambda item: run_query(item[1]), read_manifest(stream, fmt), options.parallel
+    )
+    for (line_no, query), result, error in results:
+      record: Dict[str, Any] = {
+        "line": line_no,
+        "query": query if isinstance(query, dict) else None,
+      }
+      if error is None:
+        record["result"] = result
+      else:
+        failed = True
+        record["error"] = str(error)
+      sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+      sys.stdout.flush()
+  finally:
+    if stream is not sys.stdin:
+      stream.close()
+  return 1 if failed else 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
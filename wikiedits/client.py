@@ -1,4 +1,17 @@
-from typing import Any, Dict, List, Optional, cast
+import heapq
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
 
 from .api import (
     bytes_diff_abs_aggregate,
@@ -13,6 +26,37 @@ from .api import (
     top_by_edits,
     top_by_net_diff,
 )
+from .bulk import DEFAULT_MAX_WORKERS
+from .concurrency import imap_unordered
+from .date_utils import validate_dates
+from .planner import planned_total
+from .records import TOP_FIELDS, TopEntry, compact_top
+from .segments import SeriesKey, get_segment_cache
+from .series import TimeSeries
+
+
+def _cached_total(
+  endpoint: str,
+  start: str,
+  end: str,
+  project: str,
+  page_title: Optional[str],
+  editor_type: str,
+  page_type: str,
+) -> Optional[int]:
+  """
+  Answer a total from the segment cache's prefix-sum index when the daily
+  series already covers [start, end), or return None.
+  """
+  segments = get_segment_cache()
+  if segments is None:
+    return None
+  start, end = validate_dates("daily", start, end)
+  if page_title:
+    key = SeriesKey(endpoint, project, page_title, editor_type, None, "daily")
+  else:
+    key = SeriesKey(endpoint, project, None, editor_type, page_type, "daily")
+  return segments.total(key, start, end)
 
 
 def edits(
@@ -26,7 +70,9 @@ def edits(
   Get summed edit counts for a project or specific page.
 
   Routes to either edits_aggregate() or edits_per_page() based on whether
-  page_title is provided. Then sums results.
+  page_title is provided. Then sums results. Whole months in long ranges
+  are fetched with monthly granularity. With the segment cache enabled,
+  ranges whose daily data is cached are answered from a prefix-sum index.
 
   Args:
     start: Start date
@@ -39,7 +85,65 @@ def edits(
     Integer sum of edit counts.
   """
 
-  response: List[Dict[str, Any]]
+  def fetch(granularity: str, start: str, end: str) -> List[Dict[str, Any]]:
+    if page_title:
+      return edits_per_page(
+        project=project,
+        page_title=page_title,
+        granularity=granularity,
+        start=start,
+        end=end,
+        editor_type=editor_type,
+      )
+    return edits_aggregate(
+      project=project,
+      granularity=granularity,
+      start=start,
+      end=end,
+      editor_type=editor_type,
+    )
+
+  endpoint = "edits/per-page" if page_title else "edits/aggregate"
+  total = _cached_total(
+    endpoint, start, end, project, page_title, editor_type, "all-page-types"
+  )
+  if total is not None:
+    return total
+  return planned_total(fetch, start, end, "edits")
+
+
+def edits_windows(
+  windows: Sequence[Tuple[str, str]],
+  project: str = "all-projects",
+  page_title: Optional[str] = None,
+  editor_type: str = "all-editor-types",
+) -> List[int]:
+  """
+  Get summed edit counts for many date windows from one fetch.
+
+  Fetches daily data for the range enclosing every window once, then
+  answers all windows from one cumulative sum. Each total equals
+  edits(start, end, ...) for that window. An enclosing range longer than
+  the shard length (a year by default, see wikiedits.sharding) is fetched
+  as several concurrent requests.
+
+  Args:
+    windows: (start, end) pairs, each interpreted like edits() start and end
+    project: Domain and subdomain of Wikimedia project.
+    page_title: Optional page title. If provided, gets per-page stats
+    editor_type: Editor type filter
+
+  Returns:
+    List of integer edit counts, one per window, in the order given.
+
+  Raises:
+    ValueError: If any window is invalid
+  """
+  normalized = [validate_dates("daily", start, end) for start, end in windows]
+  if not normalized:
+    return []
+  start = min(s for s, _ in normalized)
+  end = max(e for _, e in normalized)
 
   if page_title:
     response = edits_per_page(
@@ -58,8 +162,7 @@ def edits(
       end=end,
       editor_type=editor_type,
     )
-
-  return sum(cast(int, item["edits"]) for item in response)
+  return TimeSeries.from_results(response, "edits").window_sums(normalized)
 
 
 def bytes(
@@ -75,7 +178,9 @@ def bytes(
   Get summed byte difference counts for a project or specific page.
 
   Routes to appropriate bytes_diff_*_* function based on page_title and diff_type.
-  Then sums results.
+  Then sums results. Whole months in long ranges are fetched with monthly
+  granularity. With the segment cache enabled, ranges whose daily data is
+  cached are answered from a prefix-sum index.
 
   Args:
     start: Start date
@@ -90,50 +195,59 @@ def bytes(
     Integer sum of byte difference counts.
   """
 
-  response: List[Dict[str, Any]]
+  def fetch(granularity: str, start: str, end: str) -> List[Dict[str, Any]]:
+    if page_title:
+      if diff_type == "absolute":
+        return bytes_diff_abs_per_page(
+          project=project,
+          page_title=page_title,
+          granularity=granularity,
+          start=start,
+          end=end,
+          editor_type=editor_type,
+        )
+      else:  # diff_type == "net"
+        return bytes_diff_net_per_page(
+          project=project,
+          page_title=page_title,
+          granularity=granularity,
+          start=start,
+          end=end,
+          editor_type=editor_type,
+        )
+    else:
+      if diff_type == "absolute":
+        return bytes_diff_abs_aggregate(
+          project=project,
+          granularity=granularity,
+          start=start,
+          end=end,
+          editor_type=editor_type,
+          page_type=page_type,
+        )
+      else:  # diff_type == "net"
+        return bytes_diff_net_aggregate(
+          project=project,
+          granularity=granularity,
+          start=start,
+          end=end,
+          editor_type=editor_type,
+          page_type=page_type,
+        )
 
-  if page_title:
-    if diff_type == "absolute":
-      response = bytes_diff_abs_per_page(
-        project=project,
-        page_title=page_title,
-        granularity="daily",
-        start=start,
-        end=end,
-        editor_type=editor_type,
-      )
-    else:  # diff_type == "net"
-      response = bytes_diff_net_per_page(
-        project=project,
-        page_title=page_title,
-        granularity="daily",
-        start=start,
-        end=end,
-        editor_type=editor_type,
-      )
-  else:
-    if diff_type == "absolute":
-      response = bytes_diff_abs_aggregate(
-        project=project,
-        granularity="daily",
-        start=start,
-        end=end,
-        editor_type=editor_type,
-        page_type=page_type,
-      )
-    else:  # diff_type == "net"
-      response = bytes_diff_net_aggregate(
-        project=project,
-        granularity="daily",
-        start=start,
-        end=end,
-        editor_type=editor_type,
-        page_type=page_type,
-      )
+  endpoint = "bytes-difference/{}/{}".format(
+    "absolute" if diff_type == "absolute" else "net",
+    "per-page" if page_title else "aggregate",
+  )
+  total = _cached_total(
+    endpoint, start, end, project, page_title, editor_type, page_type
+  )
+  if total is not None:
+    return total
 
   # Sum the appropriate field based on diff_type
   field_name = "abs_bytes_diff" if diff_type == "absolute" else "net_bytes_diff"
-  return sum(cast(int, item[field_name]) for item in response)
+  return planned_total(fetch, start, end, field_name)
 
 
 def pages(
@@ -149,7 +263,9 @@ def pages(
   Get summed page counts for a project.
 
   Routes to either new_pages() or edited_pages() based on change_type.
-  Then sums results.
+  Then sums results. For new pages, whole months in long ranges are fetched
+  with monthly granularity, and ranges whose daily data is in the segment
+  cache are answered from a prefix-sum index.
 
   Args:
     start: Start date
@@ -163,19 +279,27 @@ def pages(
     Integer sum of page counts.
   """
 
-  response: List[Dict[str, Any]]
-
   if change_type == "new":
-    response = new_pages(
-      project=project,
-      granularity="daily",
-      start=start,
-      end=end,
-      editor_type=editor_type,
-      page_type=page_type,
+
+    def fetch(granularity: str, start: str, end: str) -> List[Dict[str, Any]]:
+      return new_pages(
+        project=project,
+        granularity=granularity,
+        start=start,
+        end=end,
+        editor_type=editor_type,
+        page_type=page_type,
+      )
+
+    total = _cached_total(
+      "edited-pages/new", start, end, project, None, editor_type, page_type
     )
-    return sum(cast(int, item["new_pages"]) for item in response)
+    if total is not None:
+      return total
+    return planned_total(fetch, start, end, "new_pages")
   else:  # change_type == "edited"
+    # Monthly edited-page counts are distinct pages per month, not the sum
+    # of daily counts, so this always sums daily data
     response = edited_pages(
       project=project,
       granularity="daily",
@@ -188,14 +312,52 @@ def pages(
     return sum(cast(int, item["edited_pages"]) for item in response)
 
 
+@overload
 def top(
   date: str,
   by: str = "edits",
   count: int = 10,
   project: str = "all-projects",
   editor_type: str = "all-editor-types",
-  page_type: str = "all-page-types"
-) -> List[Dict[str, Any]]:
+  page_type: str = "all-page-types",
+  compact: Literal[False] = False,
+) -> List[Dict[str, Any]]: ...
+
+
+@overload
+def top(
+  date: str,
+  by: str = "edits",
+  count: int = 10,
+  project: str = "all-projects",
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  *,
+  compact: Literal[True],
+) -> List[TopEntry]: ...
+
+
+@overload
+def top(
+  date: str,
+  by: str = "edits",
+  count: int = 10,
+  project: str = "all-projects",
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]: ...
+
+
+def top(
+  date: str,
+  by: str = "edits",
+  count: int = 10,
+  project: str = "all-projects",
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  compact: bool = False,
+) -> Union[List[Dict[str, Any]], List[TopEntry]]:
   """
   Get top pages for a project on a specific date.
 
@@ -209,9 +371,11 @@ def top(
     project: Domain and subdomain of Wikimedia project
     editor_type: Editor type filter
     page_type: Page type filter
+    compact: Return TopEntry records with interned titles instead of dicts,
+      for holding many daily lists in memory
 
   Returns:
-    List of dictionaries containing top pages data.
+    List of dictionaries (or TopEntry records) containing top pages data.
   """
 
   if by == "edits":
@@ -239,4 +403,75 @@ def top(
     raise ValueError(f"Invalid 'by' parameter: {by}. Must be 'edits', "
                      f"'net-diff', or 'absolute-diff'")
 
-  return response[:count]
+  entries = response[:count]
+  if compact:
+    return compact_top(entries, TOP_FIELDS[by])
+  return entries
+
+
+def top_range(
+  start: str,
+  end: str,
+  by: str = "edits",
+  count: int = 10,
+  project: str = "all-projects",
+  editor_type: str = "all-editor-types",
+  page_type: str = "all-page-types",
+  max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[Dict[str, Any]]:
+  """
+  Get top pages for a project over a range of days.
+
+  Fetches the daily top list for every day between start and end
+  concurrently and adds up each page's daily values as the lists arrive.
+  Each daily list covers only that day's top 100 pages, so a page's total
+  counts only the days it made the daily list.
+
+  Args:
+    start: Start date
+    end: End date
+    by: Metric to sort by - "edits", "net-diff", or "absolute-diff"
+    count: Number of results to return
+    project: Domain and subdomain of Wikimedia project
+    editor_type: Editor type filter
+    page_type: Page type filter
+    max_workers: Maximum number of daily lists fetched at once
+
+  Returns:
+    List of dictionaries with page_title, the summed metric, and rank.
+  """
+  if by not in TOP_FIELDS:
+    raise ValueError(f"Invalid 'by' parameter: {by}. Must be 'edits', "
+                     f"'net-diff', or 'absolute-diff'")
+  field_name = TOP_FIELDS[by]
+
+  first, last = validate_dates("daily", start, end)
+  first_day = datetime.strptime(first, "%Y%m%d")
+  days = (
+    (first_day + timedelta(days=i)).strftime("%Y%m%d")
+    for i in range((datetime.strptime(last, "%Y%m%d") - first_day).days)
+  )
+
+  def fetch(date: str) -> List[Dict[str, Any]]:
+    return top(
+      date,
+      by=by,
+      count=100,
+      project=project,
+      editor_type=editor_type,
+      page_type=page_type,
+    )
+
+  totals: Dict[str, int] = {}
+  for _, daily, error in imap_unordered(fetch, days, max_workers):
+    if error is not None:
+      raise error
+    for entry in cast(List[Dict[str, Any]], daily):
+      title = entry["page_title"]
+      totals[title] = totals.get(title, 0) + cast(int, entry[field_name])
+
+  leaders = heapq.nlargest(count, totals.items(), key=lambda item: item[1])
+  return [
+    {"page_title": title, field_name: total, "rank": rank}
+    for rank, (title, total) in enumerate(leaders, start=1)
+  ]
@@ -0,0 +1,61 @@
+import threading
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+  def __init__(self) -> None:
+    self.done = threading.Event()
+    self.result: Optional[T] = None
+    self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+  """
+  Coalesces concurrent calls that share a key into a single execution.
+
+  The first caller for a key runs the function; callers arriving while it
+  is in flight wait and receive the same result (or exception). Nothing is
+  remembered once the call completes, so later calls run again.
+
+  Callers share the returned object, so it must not be mutated.
+  """
+
+  def __init__(self) -> None:
+    self._calls: Dict[str, _Call[T]] = {}
+    self._lock = threading.Lock()
+
+  def do(self, key: str, fn: Callable[[], T]) -> T:
+    """
+    Run fn, or wait for the in-flight call with the same key.
+    """
+    with self._lock:
+      call = self._calls.get(key)
+      leader = call is None
+      if call is None:
+        call = self._calls[key] = _Call()
+
+    if not leader:
+      call.done.wait()
+      if call.error is not None:
+        raise call.error
+      return call.result  # type: ignore[return-value]
+
+    try:
+      call.result = fn()
+      return call.result
+    except BaseException as e:
+      call.error = e
+      raise
+    finally:
+      with self._lock:
+        del self._calls[key]
+      call.done.set()
+
+  def in_flight(self) -> int:
+    """
+    Return the number of keys currently being fetched.
+    """
+    with self._lock:
+      return len(self._calls)
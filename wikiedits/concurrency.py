@@ -0,0 +1,69 @@
+import contextvars
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def submit_in_context(
+  executor: Executor, fn: Callable[..., R], *args: Any
+) -> "Future[R]":
+  """
+  Submit fn(*args) to run in a copy of the caller's context, so context
+  settings such as api.use_base_url() apply in the worker thread too.
+  """
+  return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+def imap_unordered(
+  fn: Callable[[T], R],
+  items: Iterable[T],
+  max_workers: int,
+) -> Iterator[Tuple[T, Optional[R], Optional[BaseException]]]:
+  """
+  Apply fn to items on a bounded thread pool, yielding in completion order.
+
+  Items are consumed lazily and at most 2 * max_workers calls are queued
+  at once, so memory stays flat for arbitrarily long inputs. Each result is
+  released as soon as it has been yielded.
+
+  Yields:
+    tuple: (item, result, error), where exactly one of result and error
+      is set
+  """
+  if max_workers < 1:
+    raise ValueError(f"Invalid max_workers: {max_workers}. Must be at least 1")
+
+  iterator = iter(items)
+  pending: Dict["Future[R]", T] = {}
+  exhausted = False
+
+  def submit_next(executor: ThreadPoolExecutor) -> None:
+    nonlocal exhausted
+    for item in iterator:
+      pending[submit_in_context(executor, fn, item)] = item
+      return
+    exhausted = True
+
+  with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    while not exhausted and len(pending) < 2 * max_workers:
+      submit_next(executor)
+
+    while pending:
+      done, _ = wait(pending, return_when=FIRST_COMPLETED)
+      for future in done:
+        item = pending.pop(future)
+        error = future.exception()
+        if error is None:
+          yield item, future.result(), None
+        else:
+          yield item, None, error
+        if not exhausted:
+          submit_next(executor)
@@ -1,13 +1,48 @@
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Tuple
 
-from dateutil.parser import parse as date_parse
-from dateutil.relativedelta import relativedelta
+# Strict patterns for the formats almost every caller uses
+_COMPACT_DATE = re.compile(r"(\d{4})(\d{2})(\d{2})")
+_ISO_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
 
 
+def parse_date(date_string: str) -> datetime:
+  """
+  Parse a date string, trying strict YYYYMMDD and YYYY-MM-DD first.
+
+  Only free-form strings fall back to dateutil's general parser, which is
+  imported on first use.
+
+  Raises:
+    ValueError: If the string is not a valid date
+  """
+  match = _COMPACT_DATE.fullmatch(date_string) or _ISO_DATE.fullmatch(date_string)
+  if match:
+    year, month, day = match.groups()
+    return datetime(int(year), int(month), int(day))
+
+  from dateutil.parser import parse as date_parse
+
+  return date_parse(date_string)
+
+
+def add_months(day: datetime, months: int) -> datetime:
+  """
+  Return the first of the month that is months after day's month.
+  """
+  index = day.year * 12 + day.month - 1 + months
+  return datetime(index // 12, index % 12 + 1, 1)
+
+
+@lru_cache(maxsize=4096)
 def validate_dates(granularity: str, start: str, end: str) -> Tuple[str, str]:
   """
   Validate and normalize start and end dates based on granularity.
 
+  Results are memoized, so repeated ranges are normalized only once.
+
   Args:
     granularity: "daily" or "monthly"
     start: Start date in any parseable format
@@ -20,8 +55,8 @@ def validate_dates(granularity: str, start: str, end: str) -> Tuple[str, str]:
     ValueError: If end date is before start date or invalid granularity
   """
   # Validate and parse the dates
-  start_parsed = date_parse(start)
-  end_parsed = date_parse(end)
+  start_parsed = parse_date(start)
+  end_parsed = parse_date(end)
 
   # Check if end is before start
   if end_parsed < start_parsed:
@@ -31,12 +66,12 @@ def validate_dates(granularity: str, start: str, end: str) -> Tuple[str, str]:
   if start_parsed == end_parsed:
     if granularity == "daily":
       # Add one day to end date
-      end_parsed = start_parsed + relativedelta(days=1)
+      end_parsed = start_parsed + timedelta(days=1)
       return (start_parsed.strftime("%Y%m%d"), end_parsed.strftime("%Y%m%d"))
     elif granularity == "monthly":
       # Set start to beginning of month, end to first day of next month
       start_parsed = start_parsed.replace(day=1)
-      end_parsed = start_parsed + relativedelta(months=1)
+      end_parsed = add_months(start_parsed, 1)
       return (start_parsed.strftime("%Y%m%d"), end_parsed.strftime("%Y%m%d"))
     else:
       raise ValueError(
@@ -46,6 +81,7 @@ def validate_dates(granularity: str, start: str, end: str) -> Tuple[str, str]:
   return (start_parsed.strftime("%Y%m%d"), end_parsed.strftime("%Y%m%d"))
 
 
+@lru_cache(maxsize=4096)
 def split_date(date_string: str) -> Tuple[str, str, str]:
   """
   Split date string into year, month, day tuple.
@@ -62,7 +98,7 @@ def split_date(date_string: str) -> Tuple[str, str, str]:
       return (date_string[:4], date_string[4:6], date_string[6:8])
 
     # otherwise, parse and return formatted components
-    parsed_date = date_parse(date_string)
+    parsed_date = parse_date(date_string)
     return (
       parsed_date.strftime("%Y"),
       parsed_date.strftime("%m"),
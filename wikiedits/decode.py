@@ -0,0 +1,92 @@
+import importlib
+import json
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, Optional, Union
+
+Decoder = Callable[[Union[bytes, str]], Any]
+
+
+def _orjson() -> Decoder:
+  return importlib.import_module("orjson").loads  # type: ignore[no-any-return]
+
+
+def _msgspec() -> Decoder:
+  msgspec = importlib.import_module("msgspec")
+  return msgspec.json.Decoder().decode  # type: ignore[no-any-return]
+
+
+def _json() -> Decoder:
+  return json.loads
+
+
+# Fastest first; "json" (the stdlib) is always available. Importing orjson
+# or msgspec takes tens of milliseconds, so a decoder is only imported when
+# it is selected or first used.
+_LOADERS: Dict[str, Callable[[], Decoder]] = {
+  "orjson": _orjson,
+  "msgspec": _msgspec,
+  "json": _json,
+}
+
+# Names of the installed decoders, fastest first
+DECODERS = tuple(
+  name for name in _LOADERS if name == "json" or find_spec(name) is not None
+)
+
+_name = DECODERS[0]
+_decoder: Optional[Decoder] = None
+
+
+def _load(name: str) -> Decoder:
+  try:
+    return _LOADERS[name]()
+  except ImportError as e:
+    raise ValueError(f"Decoder not available: {name}. {e}") from e
+
+
+def get_decoder() -> str:
+  """
+  Return the name of the active JSON decoder: 'orjson', 'msgspec' or 'json'.
+  """
+  return _name
+
+
+def set_decoder(name: Optional[str] = None) -> None:
+  """
+  Choose the JSON decoder used for API responses.
+
+  Args:
+    name: 'orjson', 'msgspec' or 'json', or None to pick the fastest
+      installed one (orjson, then msgspec, then the standard library),
+      imported when the first response is decoded
+
+  Raises:
+    ValueError: If the decoder is unknown or not installed
+  """
+  global _name, _decoder
+  if name is None:
+    _name, _decoder = DECODERS[0], None
+    return
+  if name not in DECODERS:
+    raise ValueError(
+      f"Decoder not available: {name}. Installed: {', '.join(DECODERS)}"
+    )
+  _decoder = _load(name)
+  _name = name
+
+
+def decode(body: Union[bytes, str]) -> Any:
+  """
+  Decode a JSON document with the active decoder.
+
+  All decoders return plain dicts and lists, so results look the same
+  whichever one is installed.
+
+  Raises:
+    ValueError: If body is not valid JSON
+  """
+  global _decoder
+  decoder = _decoder
+  if decoder is None:
+    decoder = _decoder = _load(_name)
+  return decoder(body)
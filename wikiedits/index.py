@@ -0,0 +1,114 @@
+from array import array
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+def _ordinal(day: str) -> int:
+  return date(int(day[:4]), int(day[4:6]), int(day[6:8])).toordinal()
+
+
+def day_range(start: str, end: str) -> Iterator[str]:
+  """
+  Yield every day in [start, end) as YYYYMMDD.
+  """
+  day = date.fromordinal(_ordinal(start))
+  for _ in range(_ordinal(end) - day.toordinal()):
+    yield day.strftime("%Y%m%d")
+    day += timedelta(days=1)
+
+
+class PrefixSumIndex:
+  """
+  Cumulative sums over a contiguous run of days, for constant-time totals
+  of any window inside it.
+
+  sums[i] holds the total of the first i days, so the total of a window is
+  the difference of two entries. New days are appended in order without
+  touching earlier entries.
+
+  Args:
+    start: First day covered, in YYYYMMDD format
+    field: Name of the summed result field (e.g. 'edits')
+  """
+
+  __slots__ = ("start", "field", "_origin", "_sums")
+
+  def __init__(self, start: str, field: str):
+    self.start = start
+    self.field = field
+    self._origin = _ordinal(start)
+    self._sums = array("q", [0])
+
+  @classmethod
+  def from_results(
+    cls, results: List[Dict[str, Any]], field: str, start: str, end: str
+  ) -> "PrefixSumIndex":
+    """
+    Build an index for [start, end) from a daily results list. Days without
+    a result count as zero.
+
+    Args:
+      results: Daily results list as returned by the API
+      field: Value field to sum
+      start: First day in YYYYMMDD format (inclusive)
+      end: Last day in YYYYMMDD format (exclusive)
+    """
+    index = cls(start, field)
+    index.extend_results(results, end)
+    return index
+
+  @property
+  def end(self) -> str:
+    """
+    Day after the last indexed day, in YYYYMMDD format.
+    """
+    return date.fromordinal(self._origin + len(self._sums) - 1).strftime("%Y%m%d")
+
+  def __len__(self) -> int:
+    return len(self._sums) - 1
+
+  def extend(self, values: Iterable[int]) -> None:
+    """
+    Append one value per day, starting at end.
+    """
+    running = self._sums[-1]
+    for value in values:
+      running += value
+      self._sums.append(running)
+
+  def extend_results(self, results: List[Dict[str, Any]], end: str) -> None:
+    """
+    Append the days from the current end up to end from a daily results
+    list. Results outside that range are ignored and missing days count as
+    zero.
+    """
+    by_day = {
+      str(r["timestamp"]).replace("-", "")[:8]: int(r[self.field]) for r in results
+    }
+    self.extend(by_day.get(day, 0) for day in day_range(self.end, end))
+
+  def covers(self, start: str, end: str) -> bool:
+    """
+    Return True if [start, end) lies inside the indexed days.
+    """
+    return self.start <= start <= end <= self.end
+
+  def total(self, start: str, end: str) -> int:
+    """
+    Return the sum of field over [start, end) with two lookups.
+
+    Args:
+      start: Start date in YYYYMMDD format (inclusive)
+      end: End date in YYYYMMDD format (exclusive)
+
+    Raises:
+      ValueError: If the window is not inside the indexed days
+    """
+    if not self.covers(start, end):
+      raise ValueError(
+        f"Window {start}-{end} is outside the indexed days {self.start}-{self.end}"
+      )
+    return (
+      self._sums[_ordinal(end) - self._origin]
+      - self._sums[_ordinal(start) - self._origin]
+    )
@@ -0,0 +1,354 @@
+import threading
+import time
+from bisect import bisect_left
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (
+  0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# Timing phases recorded by MetricsAggregator, in request order
+PHASES = ("wait", "ttfb", "download", "decode", "total")
+
+
+class RequestEvent(NamedTuple):
+  """
+  Description of one API call, passed to every registered observer.
+
+  Timings are wall-clock seconds. A phase is None when the transport cannot
+  measure it: requests does not expose connection setup separately, so
+  connect is always None and ttfb (taken from Response.elapsed) includes
+  the connect time whenever a new connection had to be opened.
+
+  Attributes:
+    endpoint: API endpoint path (e.g. 'edits/aggregate')
+    url: Full request URL
+    status: Final HTTP status code, or None if no response was received
+    total: Time spent in the call, including rate limiting and retries
+    wait: Time spent blocked by the rate limiter and retry backoff
+    connect: Connection setup time (None with the bundled transports)
+    ttfb: Time from sending the final attempt to its response headers
+    download: Time spent reading the final response body
+    decode: Time spent decoding the JSON body
+    size: Response body size in bytes
+    retries: Number of retried attempts
+    cache_hit: Whether the response came from the response cache
+    coalesced: Whether the call waited on another caller's identical fetch
+    error: Exception raised by the call, if it failed
+  """
+
+  endpoint: str
+  url: str
+  status: Optional[int] = None
+  total: float = 0.0
+  wait: float = 0.0
+  connect: Optional[float] = None
+  ttfb: Optional[float] = None
+  download: Optional[float] = None
+  decode: Optional[float] = None
+  size: Optional[int] = None
+  retries: int = 0
+  cache_hit: bool = False
+  coalesced: bool = False
+  error: Optional[BaseException] = None
+
+
+class RequestStats:
+  """
+  Mutable per-call measurements filled in by the fetch loop.
+  """
+
+  __slots__ = ("status", "wait", "ttfb", "download", "decode", "size", "retries")
+
+  def __init__(self) -> None:
+    self.status: Optional[int] = None
+    self.wait = 0.0
+    self.ttfb: Optional[float] = None
+    self.download: Optional[float] = None
+    self.decode: Optional[float] = None
+    self.size: Optional[int] = None
+    self.retries = 0
+
+  def record_response(self, response: Any, seconds: float) -> None:
+    """
+    Record status, size and header/body timings of a requests response that
+    took seconds to arrive.
+    """
+    self.status = response.status_code
+    elapsed = getattr(response, "elapsed", None)
+    if isinstance(elapsed, timedelta):
+      # Response.elapsed stops once headers are parsed; the rest is the body
+      self.ttfb = elapsed.total_seconds()
+      self.download = max(0.0, seconds - self.ttfb)
+    content = getattr(response, "content", None)
+    if isinstance(content, bytes):
+      self.size = len(content)
+
+  def event(
+    self,
+    endpoint: str,
+    url: str,
+    started: float,
+    coalesced: bool = False,
+    error: Optional[BaseException] = None,
+  ) -> RequestEvent:
+    """
+    Build the event for a call that began at perf_counter() time started.
+    """
+    return RequestEvent(
+      endpoint=endpoint,
+      url=url,
+      status=self.status,
+      total=time.perf_counter() - started,
+      wait=self.wait,
+      ttfb=self.ttfb,
+      download=self.download,
+      decode=self.decode,
+      size=self.size,
+      retries=self.retries,
+      coalesced=coalesced,
+      error=error,
+    )
+
+
+Observer = Callable[[RequestEvent], None]
+
+_observers: Tuple[Observer, ...] = ()
+_observers_lock = threading.Lock()
+
+
+def add_observer(observer: Observer) -> None:
+  """
+  Register a callable that receives a RequestEvent after every API call.
+
+  Observers run synchronously on the calling thread, so they should be
+  fast and must not raise.
+  """
+  global _observers
+  with _observers_lock:
+    _observers = _observers + (observer,)
+
+
+def remove_observer(observer: Observer) -> None:
+  """
+  Unregister an observer added with add_observer().
+
+  Raises:
+    ValueError: If the observer is not registered
+  """
+  global _observers
+  with _observers_lock:
+    if observer not in _observers:
+      raise ValueError(f"Observer is not registered: {observer!r}")
+    observers = list(_observers)
+    observers.remove(observer)
+    _observers = tuple(observers)
+
+
+def has_observers() -> bool:
+  """
+  Return True if any observer is registered.
+  """
+  return bool(_observers)
+
+
+def notify(event: RequestEvent) -> None:
+  """
+  Pass event to every registered observer.
+  """
+  for observer in _observers:
+    observer(event)
+
+
+class Histogram:
+  """
+  Fixed-bucket histogram of durations in seconds.
+
+  Args:
+    buckets: Ascending bucket upper bounds; larger values land in a final
+      overflow bucket
+  """
+
+  __slots__ = ("buckets", "counts", "count", "sum")
+
+  def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+    self.buckets = tuple(buckets)
+    self.counts = [0] * (len(self.buckets) + 1)
+    self.count = 0
+    self.sum = 0.0
+
+  def observe(self, value: float) -> None:
+    """
+    Add one value.
+    """
+    self.counts[bisect_left(self.buckets, value)] += 1
+    self.count += 1
+    self.sum += value
+
+  def quantile(self, q: float) -> Optional[float]:
+    """
+    Estimate the q-quantile (0 <= q <= 1) by interpolating inside the bucket
+    that contains it. Returns None if nothing was observed.
+    """
+    if not self.count:
+      return None
+    rank = q * self.count
+    seen = 0
+    for index, bucket_count in enumerate(self.counts):
+      if bucket_count and seen + bucket_count >= rank:
+        low = self.buckets[index - 1] if index else 0.0
+        if index == len(self.buckets):
+          return low  # overflow bucket has no upper bound
+        high = self.buckets[index]
+        return low + (high - low) * (rank - seen) / bucket_count
+      seen += bucket_count
+    return self.buckets[-1]
+
+  def to_dict(self) -> Dict[str, Any]:
+    """
+    Return counts per bucket upper bound ('+Inf' for the overflow bucket).
+    """
+    bounds: List[str] = [str(b) for b in self.buckets] + ["+Inf"]
+    return {
+      "count": self.count,
+      "sum": self.sum,
+      "buckets": dict(zip(bounds, self.counts)),
+      "p50": self.quantile(0.5),
+      "p99": self.quantile(0.99),
+    }
+
+
+class EndpointMetrics:
+  """
+  Counters and latency histograms for one endpoint.
+  """
+
+  def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+    self.requests = 0
+    self.errors = 0
+    self.cache_hits = 0
+    self.coalesced = 0
+    self.retries = 0
+    self.bytes = 0
+    self.statuses: Dict[int, int] = {}
+    self.latency = {phase: Histogram(buckets) for phase in PHASES}
+
+  def record(self, event: RequestEvent) -> None:
+    self.requests += 1
+    self.retries += event.retries
+    if event.error is not None:
+      self.errors += 1
+    if event.status is not None:
+      self.statuses[event.status] = self.statuses.get(event.status, 0) + 1
+    if event.cache_hit:
+      self.cache_hits += 1
+      return
+    if event.coalesced:
+      self.coalesced += 1
+      return
+    # Only calls that went to the network feed the latency histograms
+    self.bytes += event.size or 0
+    for phase in PHASES:
+      value = getattr(event, phase)
+      if value is not None:
+        self.latency[phase].observe(value)
+
+  def to_dict(self) -> Dict[str, Any]:
+    return {
+      "requests": self.requests,
+      "errors": self.errors,
+      "cache_hits": self.cache_hits,
+      "coalesced": self.coalesced,
+      "retries": self.retries,
+      "bytes": self.bytes,
+      "statuses": dict(self.statuses),
+      "latency": {phase: h.to_dict() for phase, h in self.latency.items()},
+    }
+
+
+class MetricsAggregator:
+  """
+  In-process observer that keeps per-endpoint counters and latency
+  histograms.
+
+  Register it with add_observer(), or use enable_metrics() for a shared
+  instance. Cache hits and coalesced calls are counted but kept out of the
+  latency histograms, which describe network fetches only.
+
+  Args:
+    buckets: Histogram bucket upper bounds in seconds
+  """
+
+  def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+    self.buckets = tuple(buckets)
+    self._endpoints: Dict[str, EndpointMetrics] = {}
+    self._lock = threading.Lock()
+
+  def __call__(self, event: RequestEvent) -> None:
+    with self._lock:
+      metrics = self._endpoints.get(event.endpoint)
+      if metrics is None:
+        metrics = self._endpoints[event.endpoint] = EndpointMetrics(self.buckets)
+      metrics.record(event)
+
+  def endpoint(self, endpoint: str) -> Optional[EndpointMetrics]:
+    """
+    Return the metrics for endpoint, or None if it has not been called.
+    """
+    with self._lock:
+      return self._endpoints.get(endpoint)
+
+  def snapshot(self) -> Dict[str, Dict[str, Any]]:
+    """
+    Return a JSON-serializable copy of all metrics, keyed by endpoint.
+    """
+    with self._lock:
+      return {name: m.to_dict() for name, m in sorted(self._endpoints.items())}
+
+  def reset(self) -> None:
+    """
+    Discard everything recorded so far.
+    """
+    with self._lock:
+      self._endpoints.clear()
+
+
+_metrics: Optional[MetricsAggregator] = None
+
+
+def get_metrics() -> Optional[MetricsAggregator]:
+  """
+  Return the shared aggregator, or None if metrics are disabled.
+  """
+  return _metrics
+
+
+def enable_metrics(
+  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+) -> MetricsAggregator:
+  """
+  Start collecting per-endpoint metrics for all API calls.
+
+  Args:
+    buckets: Histogram bucket upper bounds in seconds
+
+  Returns:
+    The new shared MetricsAggregator.
+  """
+  global _metrics
+  disable_metrics()
+  _metrics = MetricsAggregator(buckets)
+  add_observer(_metrics)
+  return _metrics
+
+
+def disable_metrics() -> None:
+  """
+  Stop collecting metrics and unregister the shared aggregator.
+  """
+  global _metrics
+  if _metrics is not None:
+    remove_observer(_metrics)
+    _metrics = None
@@ -0,0 +1,95 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, cast
+
+from .concurrency import submit_in_context
+from .date_utils import add_months, validate_dates
+from .sharding import capture, merge_outcomes
+
+
+class Segment(NamedTuple):
+  """
+  One request in a query plan: [start, end) at the given granularity.
+  """
+
+  granularity: str
+  start: str
+  end: str
+
+
+def plan_range(start: str, end: str) -> List[Segment]:
+  """
+  Split a daily range into whole months plus partial edge periods.
+
+  Whole calendar months inside the range are covered by one monthly
+  request; the days before the first and after the last whole month are
+  fetched daily. A range without a whole month is returned unchanged as a
+  single daily segment.
+
+  Args:
+    start: Start date in any parseable format
+    end: End date in any parseable format
+
+  Returns:
+    list: Segments that together cover exactly the same days
+  """
+  first, last = validate_dates("daily", start, end)
+  first_day = datetime.strptime(first, "%Y%m%d")
+  last_day = datetime.strptime(last, "%Y%m%d")
+
+  month_start = first_day.replace(day=1)
+  if month_start < first_day:
+    month_start = add_months(month_start, 1)
+  month_end = last_day.replace(day=1)
+
+  if month_start >= month_end:
+    return [Segment("daily", start, end)]
+
+  head = month_start.strftime("%Y%m%d")
+  tail = month_end.strftime("%Y%m%d")
+  segments = [Segment("monthly", head, tail)]
+  if first < head:
+    segments.insert(0, Segment("daily", first, head))
+  if tail < last:
+    segments.append(Segment("daily", tail, last))
+  return segments
+
+
+def _sum(results: List[Dict[str, Any]], field: str) -> int:
+  return sum(cast(int, item[field]) for item in results)
+
+
+def planned_total(
+  fetch: Callable[[str, str, str], List[Dict[str, Any]]],
+  start: str,
+  end: str,
+  field: str,
+) -> int:
+  """
+  Sum field over [start, end), using monthly requests for whole months.
+
+  Only valid for additive metrics, where a month's value equals the sum of
+  its days (edits, byte differences, new pages).
+
+  A segment the API answers with 404 (no data, e.g. before a page existed)
+  counts as zero, unless every segment does, as in
+  sharding.merge_outcomes().
+
+  Args:
+    fetch: Callable taking (granularity, start, end) and returning results
+    start: Start date in any parseable format
+    end: End date in any parseable format
+    field: Result field to sum
+
+  Returns:
+    Integer sum of field across the whole range.
+  """
+  segments = plan_range(start, end)
+  if len(segments) == 1:
+    return _sum(fetch(*segments[0]), field)
+
+  with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+    futures = [
+      submit_in_context(executor, capture, fetch, *segment) for segment in segments
+    ]
+    return _sum(merge_outcomes([f.result() for f in futures]), field)
@@ -0,0 +1,218 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+DEFAULT_RATE = 50.0
+DEFAULT_BURST = 10
+DEFAULT_MIN_RATE = 1.0
+DEFAULT_MAX_RATE = 200.0
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_CAP = 30.0
+DEFAULT_THROTTLE_COOLDOWN = 1.0
+
+# Status codes that mean "slow down and try again"
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class RateLimiter:
+  """
+  Thread-safe adaptive token bucket shared by all requests.
+
+  The rate follows additive-increase/multiplicative-decrease: every
+  successful response nudges it up by increase (to at most max_rate), and
+  a throttling response halves it (to at least min_rate). Requests already
+  in flight when the server starts throttling all come back throttled, so
+  further throttles within cooldown seconds of a decrease don't halve the
+  rate again. Bulk jobs therefore settle near the fastest rate the server
+  accepts.
+
+  Args:
+    rate: Initial requests per second
+    burst: Maximum number of requests allowed back-to-back
+    min_rate: Lowest rate the limiter backs off to
+    max_rate: Highest rate the limiter ramps up to
+    increase: Requests per second added after each success
+    cooldown: Seconds after a decrease during which throttles don't
+      decrease the rate again
+  """
+
+  def __init__(
+    self,
+    rate: float = DEFAULT_RATE,
+    burst: int = DEFAULT_BURST,
+    min_rate: float = DEFAULT_MIN_RATE,
+    max_rate: float = DEFAULT_MAX_RATE,
+    increase: float = 0.1,
+    cooldown: float = DEFAULT_THROTTLE_COOLDOWN,
+  ):
+    if rate <= 0 or burst < 1:
+      raise ValueError(
+        f"Invalid rate limit: rate={rate}, burst={burst}. Rate must be "
+        f"positive and burst at least 1"
+      )
+
+    self.rate = rate
+    self.burst = burst
+    self.min_rate = min(min_rate, rate)
+    self.max_rate = max(max_rate, rate)
+    self.increase = increase
+    self.cooldown = cooldown
+    self._cooldown_until = float("-inf")
+    self._tokens = float(burst)
+    self._updated = time.monotonic()
+    self._lock = threading.Lock()
+
+  def _refill(self, now: float) -> None:
+    if now > self._updated:
+      self._tokens = min(
+        self.burst, self._tokens + (now - self._updated) * self.rate
+      )
+      self._updated = now
+
+  def reserve(self) -> float:
+    """
+    Take a token and return how many seconds to wait before using it.
+    """
+    with self._lock:
+      now = time.monotonic()
+      self._refill(now)
+      self._tokens -= 1
+      # _updated is in the future while the limiter is paused
+      wait = self._updated - now
+      if self._tokens < 0:
+        wait += -self._tokens / self.rate
+      return max(0.0, wait)
+
+  def acquire(self) -> None:
+    """
+    Block until a request may be sent.
+    """
+    wait = self.reserve()
+    if wait > 0:
+      time.sleep(wait)
+
+  def on_success(self) -> None:
+    """
+    Record a successful response and ramp the rate up.
+    """
+    with self._lock:
+      self.rate = min(self.max_rate, self.rate + self.increase)
+
+  def on_throttle(self, pause: Optional[float] = None) -> None:
+    """
+    Record a throttling response, halve the rate unless it was halved
+    within the cooldown, and optionally pause all callers for pause seconds.
+    """
+    with self._lock:
+      now = time.monotonic()
+      self._refill(now)
+      if now >= self._cooldown_until:
+        self.rate = max(self.min_rate, self.rate / 2)
+        # Responses to requests sent before the pause are part of this burst
+        self._cooldown_until = now + max(self.cooldown, pause or 0.0)
+      if pause:
+        self._updated = max(self._updated, now + pause)
+        self._tokens = min(self._tokens, 0.0)
+
+
+class RetryPolicy:
+  """
+  Retry schedule for throttled or temporarily unavailable responses.
+
+  Args:
+    max_retries: Retries after the first attempt before giving up
+    backoff_base: Backoff ceiling in seconds for the first retry
+    backoff_cap: Largest backoff ceiling in seconds
+  """
+
+  def __init__(
+    self,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_base: float = DEFAULT_BACKOFF_BASE,
+    backoff_cap: float = DEFAULT_BACKOFF_CAP,
+  ):
+    self.max_retries = max_retries
+    self.backoff_base = backoff_base
+    self.backoff_cap = backoff_cap
+
+  def delay(self, attempt: int) -> float:
+    """
+    Return seconds to wait before retry number attempt (starting at 0),
+    using exponential backoff with full jitter.
+    """
+    ceiling = min(self.backoff_cap, self.backoff_base * 2 ** attempt)
+    return random.uniform(0, ceiling)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+  """
+  Parse a Retry-After header given in seconds or as an HTTP date.
+
+  Returns:
+    Seconds to wait, or None if the header is missing or invalid.
+  """
+  if not value:
+    return None
+  try:
+    return max(0.0, float(value))
+  except ValueError:
+    pass
+  try:
+    retry_at = parsedate_to_datetime(value)
+  except (TypeError, ValueError):
+    return None
+  if retry_at.tzinfo is None:
+    retry_at = retry_at.replace(tzinfo=timezone.utc)
+  return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_limiter = RateLimiter()
+_retry_policy = RetryPolicy()
+
+
+def get_rate_limiter() -> RateLimiter:
+  """
+  Return the rate limiter shared by all requests.
+  """
+  return _limiter
+
+
+def get_retry_policy() -> RetryPolicy:
+  """
+  Return the retry policy shared by all requests.
+  """
+  return _retry_policy
+
+
+def configure(
+  rate: float = DEFAULT_RATE,
+  burst: int = DEFAULT_BURST,
+  min_rate: float = DEFAULT_MIN_RATE,
+  max_rate: float = DEFAULT_MAX_RATE,
+  max_retries: int = DEFAULT_MAX_RETRIES,
+  backoff_base: float = DEFAULT_BACKOFF_BASE,
+  backoff_cap: float = DEFAULT_BACKOFF_CAP,
+) -> None:
+  """
+  Replace the shared rate limiter and retry policy.
+
+  Args:
+    rate: Initial requests per second
+    burst: Maximum number of requests allowed back-to-back
+    min_rate: Lowest rate the limiter backs off to
+    max_rate: Highest rate the limiter ramps up to
+    max_retries: Retries after the first attempt before giving up
+    backoff_base: Backoff ceiling in seconds for the first retry
+    backoff_cap: Largest backoff ceiling in seconds
+  """
+  global _limiter, _retry_policy
+  _limiter = RateLimiter(
+    rate=rate, burst=burst, min_rate=min_rate, max_rate=max_rate
+  )
+  _retry_policy = RetryPolicy(
+    max_retries=max_retries, backoff_base=backoff_base, backoff_cap=backoff_cap
+  )
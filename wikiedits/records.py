@@ -0,0 +1,71 @@
+"""
+Compact records for top-by results.
+
+A top-by list decoded from JSON holds one dict per page plus its own copy
+of every title. TopEntry is a tuple (no per-instance dict), and its titles
+are interned, so a page that tops the list on many days keeps a single
+title string however many leaderboards are held in memory.
+"""
+import sys
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+# Metric reported for each 'by' option of top()
+TOP_FIELDS = {
+  "edits": "edits",
+  "net-diff": "net_bytes_diff",
+  "absolute-diff": "abs_bytes_diff",
+}
+
+# Metric reported by each top-by endpoint
+TOP_BY_FIELDS = {
+  "edited-pages/top-by-edits": "edits",
+  "edited-pages/top-by-net-bytes-difference": "net_bytes_diff",
+  "edited-pages/top-by-absolute-bytes-difference": "abs_bytes_diff",
+}
+
+
+class TopEntry(NamedTuple):
+  """
+  One ranked page of a top-by list.
+
+  value holds the endpoint's metric: edits, net_bytes_diff or
+  abs_bytes_diff. project is only set in lists that span projects.
+  """
+
+  page_title: str
+  value: int
+  rank: int
+  project: Optional[str] = None
+
+  def as_dict(self, field: str) -> Dict[str, Any]:
+    """
+    Return the entry in the API's dict form, with value under field.
+    """
+    entry: Dict[str, Any] = {}
+    if self.project is not None:
+      entry["project"] = self.project
+    entry["page_title"] = self.page_title
+    entry[field] = self.value
+    entry["rank"] = self.rank
+    return entry
+
+
+def compact_top(top: Iterable[Dict[str, Any]], field: str) -> List[TopEntry]:
+  """
+  Convert a top-by list of dicts to TopEntry records with interned titles.
+
+  Args:
+    top: Entries as returned by the API
+    field: Metric key of the entries ('edits', 'net_bytes_diff' or
+      'abs_bytes_diff')
+  """
+  intern = sys.intern
+  return [
+    TopEntry(
+      intern(entry["page_title"]),
+      entry[field],
+      entry["rank"],
+      intern(entry["project"]) if "project" in entry else None,
+    )
+    for entry in top
+  ]
@@ -0,0 +1,428 @@
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .cache import DEFAULT_RECENT_DAYS
+from .index import PrefixSumIndex, day_range
+from .sharding import Outcome, capture, merge_outcomes
+
+DEFAULT_MERGE_GAP_DAYS = 31
+
+# Editor and page types that partition the all-editor-types and
+# all-page-types series
+EDITOR_TYPE_COMPONENTS = ("anonymous", "group-bot", "name-bot", "user")
+PAGE_TYPE_COMPONENTS = ("content", "non-content")
+
+# Endpoints whose all-types series is the per-timestamp sum of its components.
+# Edited-page counts are distinct pages, so a page edited by both a user and
+# a bot would be counted twice.
+ADDITIVE_ENDPOINTS = frozenset({
+  "edits/aggregate",
+  "edits/per-page",
+  "bytes-difference/net/aggregate",
+  "bytes-difference/net/per-page",
+  "bytes-difference/absolute/aggregate",
+  "bytes-difference/absolute/per-page",
+  "edited-pages/new",
+})
+
+Results = List[Dict[str, Any]]
+Interval = Tuple[str, str]
+
+
+class SeriesKey(NamedTuple):
+  """
+  Identifies one cached time series.
+
+  page_title is None for aggregate endpoints and page_type is None for
+  per-page endpoints.
+  """
+
+  endpoint: str
+  project: str
+  page_title: Optional[str]
+  editor_type: str
+  page_type: Optional[str]
+  granularity: str
+
+
+def timestamp_day(timestamp: str) -> str:
+  """
+  Convert an API timestamp ('2024-12-03T00:00:00.000Z' or '20241203') to
+  YYYYMMDD.
+  """
+  return timestamp.replace("-", "")[:8]
+
+
+def _days_between(start: str, end: str) -> int:
+  return (
+    datetime.strptime(end, "%Y%m%d") - datetime.strptime(start, "%Y%m%d")
+  ).days
+
+
+def _is_month_start(day: str) -> bool:
+  return day.endswith("01")
+
+
+def _add_interval(covered: List[Interval], start: str, end: str) -> List[Interval]:
+  """
+  Insert [start, end) into a sorted list of disjoint intervals, merging
+  any that overlap or touch.
+  """
+  merged: List[Interval] = []
+  for s, e in sorted(covered + [(start, end)]):
+    if merged and s <= merged[-1][1]:
+      merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+    else:
+      merged.append((s, e))
+  return merged
+
+
+def _gaps(covered: List[Interval], start: str, end: str) -> List[Interval]:
+  """
+  Return the parts of [start, end) not covered by any interval.
+  """
+  gaps: List[Interval] = []
+  cursor = start
+  for s, e in covered:
+    if e <= cursor:
+      continue
+    if s >= end:
+      break
+    if s > cursor:
+      gaps.append((cursor, s))
+    cursor = max(cursor, e)
+  if cursor < end:
+    gaps.append((cursor, end))
+  return gaps
+
+
+def _sum_points(series_points: List[Results]) -> Results:
+  """
+  Sum several results lists per timestamp. A timestamp missing from one
+  list counts as zero there.
+  """
+  totals: Dict[str, Dict[str, Any]] = {}
+  for points in series_points:
+    for point in points:
+      total = totals.setdefault(point["timestamp"], {"timestamp": point["timestamp"]})
+      for field, value in point.items():
+        if field != "timestamp":
+          total[field] = total.get(field, 0) + value
+  return [totals[ts] for ts in sorted(totals)]
+
+
+def _merge_gaps(gaps: List[Interval], merge_gap_days: int) -> List[Interval]:
+  """
+  Join gaps separated by at most merge_gap_days of cached data, trading a
+  few re-fetched days for fewer requests.
+  """
+  merged: List[Interval] = []
+  for s, e in gaps:
+    if merged and _days_between(merged[-1][1], s) <= merge_gap_days:
+      merged[-1] = (merged[-1][0], e)
+    else:
+      merged.append((s, e))
+  return merged
+
+
+class _Series:
+  def __init__(self) -> None:
+    self.points: Dict[str, Dict[str, Any]] = {}
+    self.covered: List[Interval] = []
+    # Prefix sums over one covered interval of a daily series, built lazily
+    self.index: Optional[PrefixSumIndex] = None
+
+
+class SegmentCache:
+  """
+  In-memory cache that stores each series as individual timestamped points.
+
+  A query for [start, end) only fetches the sub-ranges that are not already
+  cached, then stitches the full results list back together from stored
+  points. Adjacent gaps separated by at most merge_gap_days of cached data
+  are fetched in one request.
+
+  For additive endpoints, missing data is computed locally when possible
+  instead of fetched: an all-editor-types or all-page-types gap whose
+  component series (e.g. user, anonymous, group-bot and name-bot) are all
+  cached is summed per timestamp, and a monthly gap whose daily series is
+  cached is rolled up into months.
+
+  Days within recent_days of today may still be revised upstream, so they
+  are never marked as cached and every query that reaches them fetches
+  them again, as the response cache does for recent ranges.
+
+  Args:
+    merge_gap_days: Largest cached stretch worth re-fetching to save a request
+    recent_days: Days before today that are always fetched again
+  """
+
+  def __init__(
+    self,
+    merge_gap_days: int = DEFAULT_MERGE_GAP_DAYS,
+    recent_days: int = DEFAULT_RECENT_DAYS,
+  ):
+    self.merge_gap_days = merge_gap_days
+    self.recent_days = recent_days
+    self._series: Dict[SeriesKey, _Series] = {}
+    self._lock = threading.Lock()
+
+  def _cacheable(self, key: SeriesKey, start: str, end: str) -> bool:
+    if key.granularity == "daily":
+      return True
+    # Monthly buckets only line up when the range is month-aligned
+    return (
+      key.granularity == "monthly"
+      and _is_month_start(start)
+      and _is_month_start(end)
+    )
+
+  def missing(self, key: SeriesKey, start: str, end: str) -> List[Interval]:
+    """
+    Return the sub-ranges of [start, end) that would be fetched for key.
+    """
+    with self._lock:
+      series = self._series.get(key)
+      covered = list(series.covered) if series is not None else []
+    gaps = _gaps(covered, start, end)
+    if key.granularity == "daily":
+      gaps = _merge_gaps(gaps, self.merge_gap_days)
+    return gaps
+
+  def _final_until(self, key: SeriesKey, today: Optional[date]) -> str:
+    """
+    Return the exclusive YYYYMMDD end of the days of key that are final.
+    """
+    if today is None:
+      today = datetime.now(timezone.utc).date()
+    final_until = today - timedelta(days=self.recent_days)
+    if key.granularity == "monthly":
+      final_until = final_until.replace(day=1)
+    return final_until.strftime("%Y%m%d")
+
+  def store(
+    self,
+    key: SeriesKey,
+    start: str,
+    end: str,
+    results: Results,
+    today: Optional[date] = None,
+  ) -> None:
+    """
+    Record the results of a fetch covering [start, end).
+
+    Points replace any stored for the same range. Only days before
+    today - recent_days are marked as cached.
+
+    Args:
+      key: Series the results belong to
+      start: Start date in YYYYMMDD format (inclusive)
+      end: End date in YYYYMMDD format (exclusive)
+      results: Fetched results
+      today: Reference date (defaults to the current UTC date)
+    """
+    covered_end = min(end, self._final_until(key, today))
+    with self._lock:
+      series = self._series.setdefault(key, _Series())
+      if series.index is not None and start < series.index.end:
+        series.index = None  # indexed days may be overwritten
+      for day in [d for d in series.points if start <= d < end]:
+        del series.points[day]
+      for point in results:
+        day = timestamp_day(str(point["timestamp"]))
+        if start <= day < end:
+          series.points[day] = dict(point)
+      if start < covered_end:
+        series.covered = _add_interval(series.covered, start, covered_end)
+
+  def derive(self, key: SeriesKey, start: str, end: str) -> Optional[Results]:
+    """
+    Compute an all-types series for [start, end) from cached components.
+
+    Returns:
+      The summed results, or None if key is not derivable or a component
+      does not cover the whole range.
+    """
+    if key.endpoint not in ADDITIVE_ENDPOINTS:
+      return None
+    candidates = []
+    if key.editor_type == "all-editor-types":
+      candidates.append([key._replace(editor_type=t) for t in EDITOR_TYPE_COMPONENTS])
+    if key.page_type == "all-page-types":
+      candidates.append([key._replace(page_type=t) for t in PAGE_TYPE_COMPONENTS])
+
+    for components in candidates:
+      with self._lock:
+        complete = all(
+          c in self._series and not _gaps(self._series[c].covered, start, end)
+          for c in components
+        )
+      if complete:
+        return _sum_points([self.points(c, start, end) for c in components])
+    return None
+
+  def rollup(self, key: SeriesKey, start: str, end: str) -> Optional[Results]:
+    """
+    Compute a monthly series for month-aligned [start, end) from the cached
+    daily series with the same key.
+
+    Returns:
+      Monthly results, or None if key is not monthly and additive or the
+      daily series does not cover the whole range.
+    """
+    if key.granularity != "monthly" or key.endpoint not in ADDITIVE_ENDPOINTS:
+      return None
+    daily = key._replace(granularity="daily")
+    with self._lock:
+      series = self._series.get(daily)
+      if series is None or _gaps(series.covered, start, end):
+        return None
+    # Imported here so plain API calls don't load the columnar series module
+    from .series import rollup
+
+    return rollup(self.points(daily, start, end), "monthly")
+
+  def total(self, key: SeriesKey, start: str, end: str) -> Optional[int]:
+    """
+    Return the sum of a cached daily series over [start, end) in constant
+    time, or None if the range is not fully cached.
+
+    A prefix-sum index is built over the covered interval on first use and
+    extended incrementally as later days are stored.
+
+    Args:
+      key: Daily series being summed
+      start: Start date in YYYYMMDD format (inclusive)
+      end: End date in YYYYMMDD format (exclusive)
+    """
+    if key.granularity != "daily":
+      return None
+    with self._lock:
+      series = self._series.get(key)
+      if series is None:
+        return None
+      interval = next(
+        ((s, e) for s, e in series.covered if s <= start and end <= e), None
+      )
+      if interval is None:
+        return None
+      if not series.points:
+        return 0
+
+      index = series.index
+      if index is None or index.start != interval[0]:
+        field = next(k for k in next(iter(series.points.values())) if k != "timestamp")
+        index = series.index = PrefixSumIndex(interval[0], field)
+      if index.end < interval[1]:
+        index.extend(
+          int(series.points[day][index.field]) if day in series.points else 0
+          for day in day_range(index.end, interval[1])
+        )
+      return index.total(start, end)
+
+  def points(self, key: SeriesKey, start: str, end: str) -> Results:
+    """
+    Return copies of the cached points in [start, end) in timestamp order,
+    so callers can modify them without changing the cache.
+    """
+    with self._lock:
+      series = self._series.get(key)
+      if series is None:
+        return []
+      days = sorted(d for d in series.points if start <= d < end)
+      return [dict(series.points[d]) for d in days]
+
+  def query(
+    self,
+    key: SeriesKey,
+    start: str,
+    end: str,
+    fetch: Callable[[str, str], Results],
+  ) -> Results:
+    """
+    Return results for [start, end), fetching only uncached sub-ranges.
+
+    Args:
+      key: Series being queried
+      start: Start date in YYYYMMDD format (inclusive)
+      end: End date in YYYYMMDD format (exclusive)
+      fetch: Callable that requests (start, end) from the API
+
+    Returns:
+      list: The full results list, as the API would have returned it
+
+    Raises:
+      requests.exceptions.RequestException: If a gap fails, or if every gap
+        got 404 and the cache holds no points for [start, end) either
+    """
+    if not self._cacheable(key, start, end):
+      return fetch(start, end)
+
+    gaps = self.missing(key, start, end)
+    outcomes: List[Outcome] = []
+    for gap_start, gap_end in gaps:
+      results = self.derive(key, gap_start, gap_end)
+      if results is None:
+        results = self.rollup(key, gap_start, gap_end)
+      if results is None:
+        outcomes.append(capture(fetch, gap_start, gap_end))
+      else:
+        outcomes.append((results, None))
+
+    # A gap without data (404) counts as empty, as a chunk of a sharded
+    # range does, unless no other part of [start, end) has any points
+    cached = [
+      point for point in self.points(key, start, end)
+      if not any(s <= timestamp_day(point["timestamp"]) < e for s, e in gaps)
+    ]
+    merge_outcomes([(cached, None)] + outcomes)
+    for (gap_start, gap_end), (results, _) in zip(gaps, outcomes):
+      self.store(key, gap_start, gap_end, results or [])
+    return self.points(key, start, end)
+
+  def clear(self) -> None:
+    """
+    Drop all cached series.
+    """
+    with self._lock:
+      self._series.clear()
+
+
+_segment_cache: Optional[SegmentCache] = None
+
+
+def get_segment_cache() -> Optional[SegmentCache]:
+  """
+  Return the active segment cache, or None if it is disabled.
+  """
+  return _segment_cache
+
+
+def enable_segment_cache(
+  merge_gap_days: int = DEFAULT_MERGE_GAP_DAYS,
+  recent_days: int = DEFAULT_RECENT_DAYS,
+) -> SegmentCache:
+  """
+  Turn on the in-memory segment cache for standard and per-page requests.
+
+  Args:
+    merge_gap_days: Largest cached stretch worth re-fetching to save a request
+    recent_days: Days before today that are always fetched again
+
+  Returns:
+    The new active SegmentCache.
+  """
+  global _segment_cache
+  _segment_cache = SegmentCache(
+    merge_gap_days=merge_gap_days, recent_days=recent_days
+  )
+  return _segment_cache
+
+
+def disable_segment_cache() -> None:
+  """
+  Turn off the segment cache and drop its contents.
+  """
+  global _segment_cache
+  _segment_cache = None
@@ -0,0 +1,266 @@
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+try:
+  import numpy as np
+  HAS_NUMPY = True
+except ImportError:  # pragma: no cover - exercised only without numpy
+  HAS_NUMPY = False
+
+SECONDS_PER_DAY = 86400
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+PERIODS = ("weekly", "monthly", "quarterly", "yearly")
+
+
+def to_epoch(timestamp: str) -> int:
+  """
+  Convert an API timestamp ('2024-12-03T00:00:00.000Z' or '20241203') to
+  epoch seconds at midnight UTC.
+  """
+  day = timestamp.replace("-", "")[:8]
+  ordinal = date(int(day[:4]), int(day[4:6]), int(day[6:8])).toordinal()
+  return (ordinal - _EPOCH_ORDINAL) * SECONDS_PER_DAY
+
+
+def from_epoch(seconds: int) -> date:
+  """
+  Convert epoch seconds to a UTC date.
+  """
+  return date.fromordinal(_EPOCH_ORDINAL + seconds // SECONDS_PER_DAY)
+
+
+def _bucket_start(day: date, period: str) -> date:
+  if period == "weekly":
+    return date.fromordinal(day.toordinal() - day.weekday())
+  if period == "monthly":
+    return day.replace(day=1)
+  if period == "quarterly":
+    return date(day.year, day.month - (day.month - 1) % 3, 1)
+  if period == "yearly":
+    return date(day.year, 1, 1)
+  raise ValueError(
+    f"Invalid period: {period}. Expected one of {', '.join(PERIODS)}"
+  )
+
+
+def _as_array(values: Any) -> "array[int]":
+  if isinstance(values, array):
+    return values
+  if HAS_NUMPY and isinstance(values, np.ndarray):
+    result = array("q")
+    result.frombytes(values.astype(np.int64).tobytes())
+    return result
+  return array("q", values)
+
+
+class TimeSeries:
+  """
+  Columnar time series: int64 epoch-second timestamps and int64 values.
+
+  Holds the same data as a list of result dicts in two compact arrays.
+  Aggregations use NumPy when it is installed and fall back to plain
+  Python otherwise.
+
+  Args:
+    timestamps: Epoch seconds at midnight UTC, in ascending order
+    values: One value per timestamp
+    field: Name of the result field the values came from (e.g. 'edits')
+  """
+
+  __slots__ = ("timestamps", "values", "field")
+
+  def __init__(
+    self,
+    timestamps: Sequence[int],
+    values: Sequence[int],
+    field: str,
+  ):
+    if len(timestamps) != len(values):
+      raise ValueError(
+        f"Length mismatch: {len(timestamps)} timestamps, {len(values)} values"
+      )
+    self.timestamps = _as_array(timestamps)
+    self.values = _as_array(values)
+    self.field = field
+
+  @classmethod
+  def from_results(
+    cls, results: List[Dict[str, Any]], field: str
+  ) -> "TimeSeries":
+    """
+    Build a series from an API results list.
+
+    Args:
+      results: List of result dicts, each with a 'timestamp'
+      field: Value field to extract, e.g. 'edits' or 'net_bytes_diff'
+    """
+    timestamps = array("q", (to_epoch(str(r["timestamp"])) for r in results))
+    values = array("q", (int(r[field]) for r in results))
+    if any(a > b for a, b in zip(timestamps, timestamps[1:])):
+      order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+      timestamps = array("q", (timestamps[i] for i in order))
+      values = array("q", (values[i] for i in order))
+    return cls(timestamps, values, field)
+
+  def __len__(self) -> int:
+    return len(self.timestamps)
+
+  def __iter__(self) -> Iterator[Tuple[int, int]]:
+    return zip(self.timestamps, self.values)
+
+  @overload
+  def __getitem__(self, index: int) -> Tuple[int, int]: ...
+
+  @overload
+  def __getitem__(self, index: slice) -> "TimeSeries": ...
+
+  def __getitem__(
+    self, index: Union[int, slice]
+  ) -> Union[Tuple[int, int], "TimeSeries"]:
+    if isinstance(index, slice):
+      return TimeSeries(self.timestamps[index], self.values[index], self.field)
+    return self.timestamps[index], self.values[index]
+
+  def __repr__(self) -> str:
+    return f"TimeSeries(field={self.field!r}, points={len(self)})"
+
+  def between(self, start: str, end: str) -> "TimeSeries":
+    """
+    Return the points with start <= timestamp < end.
+
+    Args:
+      start: Start date in YYYYMMDD or ISO format (inclusive)
+      end: End date in YYYYMMDD or ISO format (exclusive)
+    """
+    lo = bisect_left(self.timestamps, to_epoch(start))
+    hi = bisect_left(self.timestamps, to_epoch(end))
+    return self[lo:hi]
+
+  def sum(self) -> int:
+    """
+    Return the sum of all values.
+    """
+    if HAS_NUMPY and len(self.values):
+      return int(np.frombuffer(self.values, dtype=np.int64).sum())
+    return sum(self.values)
+
+  def window_sums(self, windows: Sequence[Tuple[str, str]]) -> List[int]:
+    """
+    Sum values over many [start, end) windows at once.
+
+    Builds one cumulative sum and answers each window with two binary
+    searches, vectorized with NumPy when it is installed.
+
+    Args:
+      windows: (start, end) pairs in YYYYMMDD or ISO format, end exclusive
+
+    Returns:
+      list: One total per window, in the order given
+    """
+    starts = [to_epoch(start) for start, _ in windows]
+    ends = [to_epoch(end) for _, end in windows]
+    if HAS_NUMPY:
+      timestamps = np.frombuffer(self.timestamps, dtype=np.int64)
+      cumulative = np.concatenate(
+        ([0], np.cumsum(np.frombuffer(self.values, dtype=np.int64)))
+      )
+      lo = np.searchsorted(timestamps, starts, side="left")
+      hi = np.searchsorted(timestamps, ends, side="left")
+      return [int(total) for total in cumulative[hi] - cumulative[lo]]
+
+    sums = [0]
+    for value in self.values:
+      sums.append(sums[-1] + value)
+    return [
+      sums[bisect_left(self.timestamps, end)]
+      - sums[bisect_left(self.timestamps, start)]
+      for start, end in zip(starts, ends)
+    ]
+
+  def resample(self, period: str) -> "TimeSeries":
+    """
+    Sum values into weekly, monthly, quarterly or yearly buckets.
+
+    Weeks start on Monday. Each bucket is labeled with its first day.
+    """
+    _bucket_start(date(1970, 1, 1), period)  # validate period
+    if not len(self):
+      return TimeSeries([], [], self.field)
+    if HAS_NUMPY:
+      return self._resample_numpy(period)
+
+    buckets: Dict[int, int] = {}
+    for ts, value in self:
+      start = _bucket_start(from_epoch(ts), period)
+      key = (start.toordinal() - _EPOCH_ORDINAL) * SECONDS_PER_DAY
+      buckets[key] = buckets.get(key, 0) + value
+    return TimeSeries(list(buckets), list(buckets.values()), self.field)
+
+  def _resample_numpy(self, period: str) -> "TimeSeries":
+    days = np.frombuffer(self.timestamps, dtype=np.int64) // SECONDS_PER_DAY
+    if period == "weekly":
+      # 1970-01-01 was a Thursday; shift so buckets start on Monday
+      bucket_days = days - (days + 3) % 7
+    else:
+      months = days.astype("datetime64[D]").astype("datetime64[M]")
+      if period == "quarterly":
+        month_index = months.astype(np.int64)
+        months = (month_index - month_index % 3).astype("datetime64[M]")
+      elif period == "yearly":
+        months = months.astype("datetime64[Y]").astype("datetime64[M]")
+      bucket_days = months.astype("datetime64[D]").astype(np.int64)
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket_days)) + 1))
+    values = np.frombuffer(self.values, dtype=np.int64)
+    sums = np.add.reduceat(values, starts)
+    timestamps = bucket_days[starts] * SECONDS_PER_DAY
+    return TimeSeries(_as_array(timestamps), _as_array(sums), self.field)
+
+  def to_results(
+    self, timestamp_format: Optional[str] = None
+  ) -> List[Dict[str, Any]]:
+    """
+    Convert back to a list of result dicts like the API returns.
+
+    Args:
+      timestamp_format: strftime format for timestamps (defaults to the
+        API's '%Y-%m-%dT%H:%M:%S.000Z')
+    """
+    fmt = timestamp_format or "%Y-%m-%dT%H:%M:%S.000Z"
+    return [
+      {
+        "timestamp": datetime.fromtimestamp(ts, timezone.utc).strftime(fmt),
+        self.field: value,
+      }
+      for ts, value in self
+    ]
+
+
+def rollup(
+  results: List[Dict[str, Any]], period: str, field: Optional[str] = None
+) -> List[Dict[str, Any]]:
+  """
+  Sum a daily results list into weekly, monthly, quarterly or yearly buckets.
+
+  The output has the same shape as the API's results for that granularity:
+  one dict per bucket, timestamped at midnight UTC on the bucket's first day.
+  Only use this for additive metrics; distinct edited-page counts do not
+  roll up.
+
+  Args:
+    results: Daily results list as returned by the API
+    period: 'weekly', 'monthly', 'quarterly' or 'yearly'
+    field: Value field to sum (defaults to the first non-timestamp field)
+
+  Returns:
+    list: One result dict per bucket, in timestamp order
+  """
+  if not results:
+    _bucket_start(date(1970, 1, 1), period)  # validate period
+    return []
+  if field is None:
+    field = next(k for k in results[0] if k != "timestamp")
+  return TimeSeries.from_results(results, field).resample(period).to_results()
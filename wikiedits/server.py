@@ -0,0 +1,217 @@
+"""
+Shared caching HTTP service for many worker processes.
+
+One server holds the response cache, rate limiter, connection pool and
+in-flight request coalescing, and every worker on the host (or cluster)
+goes through it. Three routes are exposed:
+
+  GET /metrics/<endpoint>/<args>   Same paths and JSON as the Wikimedia
+                                   metrics API, so workers only need
+                                   api.set_base_url("http://host:port/metrics")
+  GET /call/<function>?name=value  Runs a wikiedits function (as in the
+                                   wikiedits command) and returns
+                                   {"result": ...}
+  GET /stats                       Per-endpoint metrics of upstream calls
+
+Run with: python -m wikiedits.server [--host H] [--port P] [--cache PATH]
+"""
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import requests
+
+from . import ratelimit, transport
+from .api import _in_flight, _make_request, get_base_url, use_base_url
+from .cli import run_query
+from .metrics import enable_metrics, get_metrics
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Upstream endpoints, longest first so nested paths match before prefixes
+ENDPOINTS = (
+  "bytes-difference/absolute/aggregate",
+  "bytes-difference/absolute/per-page",
+  "bytes-difference/net/aggregate",
+  "bytes-difference/net/per-page",
+  "edited-pages/top-by-absolute-bytes-difference",
+  "edited-pages/top-by-net-bytes-difference",
+  "edited-pages/top-by-edits",
+  "edited-pages/aggregate",
+  "edited-pages/new",
+  "edits/aggregate",
+  "edits/per-page",
+)
+
+
+def split_metrics_path(path: str) -> Tuple[str, str]:
+  """
+  Split '<endpoint>/<args>' into the endpoint and its URL path arguments.
+
+  Raises:
+    KeyError: If the path does not start with a known endpoint
+  """
+  for endpoint in ENDPOINTS:
+    if path.startswith(endpoint + "/"):
+      return endpoint, path[len(endpoint) + 1:]
+  raise KeyError(path)
+
+
+class WikieditsHandler(BaseHTTPRequestHandler):
+  protocol_version = "HTTP/1.1"
+  disable_nagle_algorithm = True
+
+  def do_GET(self) -> None:
+    parts = urlsplit(self.path)
+    path = parts.path.strip("/")
+    if path.startswith("metrics/"):
+      self._proxy(path[len("metrics/"):])
+    elif path.startswith("call/"):
+      self._call(unquote(path[len("call/"):]), parts.query)
+    elif path == "stats":
+      metrics = get_metrics()
+      self._send(200, {
+        "in_flight": _in_flight.in_flight(),
+        "endpoints": metrics.snapshot() if metrics is not None else {},
+      })
+    else:
+      self._send(404, {"detail": f"Not found: {parts.path}"})
+
+  def _proxy(self, path: str) -> None:
+    try:
+      endpoint, args = split_metrics_path(path)
+    except KeyError:
+      self._send(404, {"detail": f"Unknown endpoint: {path}"})
+      return
+    upstream = getattr(self.server, "upstream", None)
+    try:
+      # Shared cache, coalescing, rate limiter and pool all apply here
+      self._send(200, _make_request(endpoint, args, api_base_url=upstream))
+    except requests.exceptions.RequestException as e:
+      self._send_upstream_error(e)
+
+  def _call(self, name: str, query: str) -> None:
+    arguments = dict(parse_qsl(query, keep_blank_values=False))
+    arguments["function"] = name
+    upstream = getattr(self.server, "upstream", None) or get_base_url()
+    try:
+      with use_base_url(upstream):
+        result = run_query(arguments)
+    except (TypeError, ValueError) as e:
+      self._send(400, {"detail": str(e)})
+    except requests.exceptions.RequestException as e:
+      self._send_upstream_error(e)
+    else:
+      self._send(200, {"result": result})
+
+  def _send_upstream_error(self, error: requests.exceptions.RequestException) -> None:
+    response = error.response
+    if response is not None and isinstance(response.status_code, int):
+      # Pass upstream HTTP errors through so workers see the real status
+      self._send(response.status_code, {"detail": str(error)})
+    else:
+      self._send(502, {"detail": str(error)})
+
+  def _send(self, status: int, payload: Any) -> None:
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    self.send_response(status)
+    self.send_header("Content-Type", "application/json")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, format: str, *args: object) -> None:
+    pass
+
+
+def make_server(
+  host: str = DEFAULT_HOST,
+  port: int = DEFAULT_PORT,
+  upstream: Optional[str] = None,
+) -> ThreadingHTTPServer:
+  """
+  Create (but do not start) a server bound to host and port.
+
+  Args:
+    host: Interface to listen on
+    port: Port to listen on, or 0 to pick a free one
+    upstream: Metrics API base URL to proxy to (defaults to the current
+      get_base_url(), captured now so that pointing this process at the
+      server later cannot make it proxy to itself)
+  """
+  server = ThreadingHTTPServer((host, port), WikieditsHandler)
+  server.daemon_threads = True
+  server.upstream = upstream or get_base_url()  # type: ignore[attr-defined]
+  return server
+
+
+def serve_in_thread(
+  host: str = DEFAULT_HOST, port: int = 0, upstream: Optional[str] = None
+) -> Tuple[ThreadingHTTPServer, str]:
+  """
+  Start a server in a background thread.
+
+  Returns:
+    tuple: (server, base_url) where base_url can be passed to set_base_url()
+  """
+  server = make_server(host, port, upstream)
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  return server, f"http://{host}:{server.server_address[1]}/metrics"
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+  parser = argparse.ArgumentParser(
+    prog="wikiedits-server",
+    description="Serve the Wikimedia metrics API and wikiedits functions "
+    "through one shared cache, rate limiter and connection pool.",
+  )
+  parser.add_argument("--host", default=DEFAULT_HOST)
+  parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+  parser.add_argument("--upstream",
+                      help="metrics API base URL (default: the Wikimedia API)")
+  parser.add_argument("--cache", metavar="PATH",
+                      help="response cache SQLite path (default: no cache)")
+  parser.add_argument("--rate", type=float,
+                      help="maximum upstream requests per second "
+                      "(default: adaptive)")
+  parser.add_argument("--pool-size", type=int, default=64,
+                      help="upstream connections kept open (default: %(default)s)")
+  return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+  """
+  Entry point of the wikiedits-server command.
+  """
+  options = _parse_args(argv)
+  transport.configure(pool_size=options.pool_size)
+  if options.rate is not None:
+    ratelimit.configure(
+      rate=options.rate, min_rate=min(options.rate, ratelimit.DEFAULT_MIN_RATE),
+      max_rate=options.rate,
+    )
+  if options.cache:
+    from .cache import enable_cache
+
+    enable_cache(options.cache)
+  enable_metrics()
+
+  server = make_server(options.host, options.port, options.upstream)
+  port = server.server_address[1]
+  print(f"Serving on http://{options.host}:{port}/metrics", flush=True)
+  try:
+    server.serve_forever()
+  except KeyboardInterrupt:
+    pass
+  finally:
+    server.server_close()
+  return 0
+
+
+if __name__ == "__main__":
+  raise SystemExit(main())
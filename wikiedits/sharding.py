@@ -0,0 +1,193 @@
+"""
+Concurrent range sharding for long daily queries.
+
+A multi-year daily request is one slow response that fails as a unit.
+fetch_sharded() splits it into fixed-size chunks (a year by default),
+fetches them on a small thread pool and concatenates the results, so a
+failed chunk costs only its own days.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from .concurrency import submit_in_context
+
+DEFAULT_SHARD_DAYS = 365
+DEFAULT_SHARD_WORKERS = 8
+
+Results = List[Dict[str, Any]]
+Fetch = Callable[[str, str], Results]
+
+_shard_days: Optional[int] = DEFAULT_SHARD_DAYS
+_shard_workers = DEFAULT_SHARD_WORKERS
+
+
+def get_shard_days() -> Optional[int]:
+  """
+  Return the length of the chunks long daily ranges are split into, or
+  None if sharding is disabled.
+  """
+  return _shard_days
+
+
+def configure_sharding(
+  days: Optional[int] = DEFAULT_SHARD_DAYS,
+  max_workers: int = DEFAULT_SHARD_WORKERS,
+) -> None:
+  """
+  Configure how long daily ranges are split into concurrent requests.
+
+  Args:
+    days: Days per chunk, or None to always send a range as one request
+    max_workers: Maximum number of chunks of one range fetched at once
+
+  Raises:
+    ValueError: If days or max_workers is less than 1
+  """
+  global _shard_days, _shard_workers
+  if days is not None and days < 1:
+    raise ValueError(f"Invalid shard days: {days}. Must be at least 1")
+  if max_workers < 1:
+    raise ValueError(f"Invalid max_workers: {max_workers}. Must be at least 1")
+  _shard_days = days
+  _shard_workers = max_workers
+
+
+def shard_range(start: str, end: str, days: int) -> List[Tuple[str, str]]:
+  """
+  Split [start, end) into consecutive chunks of at most days days.
+
+  Args:
+    start: Start date in YYYYMMDD format (inclusive)
+    end: End date in YYYYMMDD format (exclusive)
+    days: Maximum chunk length
+  """
+  day = datetime.strptime(start, "%Y%m%d")
+  stop = datetime.strptime(end, "%Y%m%d")
+  step = timedelta(days=days)
+  chunks = []
+  while day < stop:
+    chunk_end = min(day + step, stop)
+    chunks.append((day.strftime("%Y%m%d"), chunk_end.strftime("%Y%m%d")))
+    day = chunk_end
+  return chunks
+
+
+def _days_between(start: str, end: str) -> int:
+  return (datetime.strptime(end, "%Y%m%d") - datetime.strptime(start, "%Y%m%d")).days
+
+
+def _status(error: BaseException) -> Optional[int]:
+  response = getattr(error, "response", None)
+  status = getattr(response, "status_code", None)
+  return status if isinstance(status, int) else None
+
+
+def _retryable(error: BaseException) -> bool:
+  """
+  Whether a smaller request might succeed: timeouts, connection errors and
+  server errors, but not client errors such as an unknown page.
+  """
+  if not isinstance(error, requests.exceptions.RequestException):
+    return False
+  status = _status(error)
+  return status is None or status >= 500
+
+
+Outcome = Tuple[Optional[Results], Optional[BaseException]]
+
+
+def merge_outcomes(outcomes: List[Outcome]) -> Results:
+  """
+  Concatenate the results of requests for parts of one range, in order.
+
+  The API answers 404 for a range without any data, so a part that got
+  404 while others returned data (for example, before a page was created)
+  counts as empty. If every part got 404, the first such error is raised,
+  as it would have been for one request over the whole range. Any other
+  error is raised as is.
+  """
+  not_found: Optional[BaseException] = None
+  results: Results = []
+  for chunk_results, error in outcomes:
+    if error is None:
+      results.extend(chunk_results or [])
+    elif _status(error) == 404:
+      not_found = not_found or error
+    else:
+      raise error
+  if not_found is not None and not results:
+    raise not_found
+  return results
+
+
+def capture(fetch: Callable[..., Results], *args: Any) -> Outcome:
+  """
+  Call fetch(*args) and return (results, None), or (None, error) if it
+  raised a RequestException.
+  """
+  try:
+    return fetch(*args), None
+  except requests.exceptions.RequestException as e:
+    return None, e
+
+
+def _fetch_chunk(fetch: Fetch, start: str, end: str) -> Results:
+  """
+  Fetch one chunk. If it fails with a retryable error, fetch its two
+  halves instead, so a chunk that is too slow for the server can still
+  complete without refetching the rest of the range.
+  """
+  try:
+    return fetch(start, end)
+  except requests.exceptions.RequestException as e:
+    length = _days_between(start, end)
+    if length < 2 or not _retryable(e):
+      raise
+  middle = (
+    datetime.strptime(start, "%Y%m%d") + timedelta(days=length // 2)
+  ).strftime("%Y%m%d")
+  return merge_outcomes([capture(fetch, start, middle), capture(fetch, middle, end)])
+
+
+def fetch_sharded(
+  fetch: Fetch, start: str, end: str, granularity: str = "daily"
+) -> Results:
+  """
+  Fetch a range, split into concurrent chunks when it is a long daily one.
+
+  Monthly ranges, and daily ranges up to the configured chunk length, are
+  fetched with one request. Longer daily ranges are split into chunks that
+  are fetched in parallel, and their results are concatenated in date
+  order. A chunk that fails with a timeout, connection error or server
+  error is retried once as two halves, and the other chunks are kept.
+  Chunks without any data (404) count as empty unless the whole range has
+  none.
+
+  Args:
+    fetch: Callable that requests daily results for (start, end)
+    start: Start date in YYYYMMDD format (inclusive)
+    end: End date in YYYYMMDD format (exclusive)
+    granularity: 'daily' or 'monthly'
+
+  Returns:
+    list: The results, as one request for the whole range would return them
+
+  Raises:
+    requests.exceptions.RequestException: If a chunk still fails
+  """
+  days = _shard_days
+  if granularity != "daily" or days is None:
+    return fetch(start, end)
+  if _days_between(start, end) <= days:
+    return fetch(start, end)
+
+  chunks = shard_range(start, end, days)
+  with ThreadPoolExecutor(max_workers=min(_shard_workers, len(chunks))) as executor:
+    futures = [
+      submit_in_context(executor, capture, _fetch_chunk, fetch, chunk_start, chunk_end)
+      for chunk_start, chunk_end in chunks
+    ]
+    return merge_outcomes([future.result() for future in futures])
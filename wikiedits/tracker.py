@@ -0,0 +1,229 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from .api import edits_aggregate, edits_per_page
+from .date_utils import validate_dates
+from .segments import timestamp_day
+from .sharding import capture, merge_outcomes
+
+DEFAULT_TRACKER_PATH = os.path.join(
+  os.path.expanduser("~"), ".cache", "wikiedits", "tracker.sqlite"
+)
+DEFAULT_RECHECK_DAYS = 3
+
+Results = List[Dict[str, Any]]
+
+
+class Tracker:
+  """
+  Persistent "since last run" updater for daily series.
+
+  Each tracked series remembers which days it holds and the day through
+  which its data is final. An update fetches only the days after that
+  point, so the trailing recheck_days window is fetched again on every run
+  to pick up late corrections. Older days are served from the local store.
+
+  Args:
+    path: SQLite database file, or ":memory:" for a per-process tracker
+    recheck_days: Days before today that may still be revised upstream
+  """
+
+  def __init__(
+    self,
+    path: str = DEFAULT_TRACKER_PATH,
+    recheck_days: int = DEFAULT_RECHECK_DAYS,
+  ):
+    if recheck_days < 0:
+      raise ValueError(f"Invalid recheck_days: {recheck_days}. Must be >= 0")
+    if path != ":memory:":
+      os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    self.path = path
+    self.recheck_days = recheck_days
+    self._lock = threading.Lock()
+    self._conn = sqlite3.connect(path, check_same_thread=False)
+    with self._lock, self._conn:
+      self._conn.execute("PRAGMA journal_mode=WAL")
+      self._conn.execute(
+        "CREATE TABLE IF NOT EXISTS series ("
+        " key TEXT PRIMARY KEY,"
+        " first_day TEXT NOT NULL,"
+        " final_until TEXT NOT NULL)"
+      )
+      self._conn.execute(
+        "CREATE TABLE IF NOT EXISTS points ("
+        " key TEXT NOT NULL,"
+        " day TEXT NOT NULL,"
+        " point TEXT NOT NULL,"
+        " PRIMARY KEY (key, day))"
+      )
+
+  def state(self, key: str) -> Optional[Dict[str, str]]:
+    """
+    Return {'first_day', 'final_until'} for a tracked series, or None.
+
+    final_until is the exclusive YYYYMMDD end of the data known to be final.
+    """
+    with self._lock:
+      row = self._conn.execute(
+        "SELECT first_day, final_until FROM series WHERE key = ?", (key,)
+      ).fetchone()
+    if row is None:
+      return None
+    return {"first_day": row[0], "final_until": row[1]}
+
+  def update(
+    self,
+    key: str,
+    fetch: Callable[[str, str], Results],
+    start: str,
+    end: Optional[str] = None,
+    today: Optional[date] = None,
+  ) -> Results:
+    """
+    Bring a daily series up to date and return its points in [start, end).
+
+    Only days after the series' final point are fetched (plus any days
+    before its first stored day when start moves earlier).
+
+    Args:
+      key: Unique name of the series
+      fetch: Callable that requests daily results for (start, end)
+      start: Start date in any parseable format (inclusive)
+      end: End date (exclusive, defaults to today)
+      today: Reference date (defaults to the current UTC date)
+
+    Returns:
+      list: The merged daily results, in timestamp order
+
+    Raises:
+      requests.exceptions.RequestException: If a fetch fails, or if every
+        fetch got 404 and no points are stored for [start, end) either
+    """
+    if today is None:
+      today = datetime.now(timezone.utc).date()
+    start, end = validate_dates(
+      "daily", start, end or today.strftime("%Y%m%d")
+    )
+    final_limit = (today - timedelta(days=self.recheck_days)).strftime("%Y%m%d")
+
+    state = self.state(key)
+    if state is None:
+      first_day, final_until = start, start
+    else:
+      first_day, final_until = state["first_day"], state["final_until"]
+
+    ranges = []
+    if start < first_day:
+      ranges.append((start, first_day))
+      first_day = start
+    if final_until < end:
+      ranges.append((max(final_until, first_day), end))
+
+    outcomes = [capture(fetch, *fetch_range) for fetch_range in ranges]
+    # A range without data (404), such as a page with no recent edits,
+    # counts as empty unless nothing in [start, end) has points
+    stored = [
+      point for point in self.points(key, start, end)
+      if not any(s <= timestamp_day(point["timestamp"]) < e for s, e in ranges)
+    ]
+    merge_outcomes([(stored, None)] + outcomes)
+    for (fetch_start, fetch_end), (results, _) in zip(ranges, outcomes):
+      # An empty range still replaces stored points that were dropped upstream
+      self._store(key, fetch_start, fetch_end, results or [])
+    if ranges:
+      final_until = max(final_until, min(end, final_limit))
+      with self._lock, self._conn:
+        self._conn.execute(
+          "INSERT OR REPLACE INTO series (key, first_day, final_until) "
+          "VALUES (?, ?, ?)",
+          (key, first_day, final_until),
+        )
+    return self.points(key, start, end)
+
+  def _store(self, key: str, start: str, end: str, results: Results) -> None:
+    rows = []
+    for point in results:
+      day = timestamp_day(str(point["timestamp"]))
+      if start <= day < end:
+        rows.append((key, day, json.dumps(point, separators=(",", ":"))))
+    with self._lock, self._conn:
+      # Replace the whole range so points dropped upstream disappear too
+      self._conn.execute(
+        "DELETE FROM points WHERE key = ? AND day >= ? AND day < ?",
+        (key, start, end),
+      )
+      self._conn.executemany(
+        "INSERT INTO points (key, day, point) VALUES (?, ?, ?)", rows
+      )
+
+  def points(self, key: str, start: str, end: str) -> Results:
+    """
+    Return the stored points of a series in [start, end), in timestamp order.
+    """
+    with self._lock:
+      rows = self._conn.execute(
+        "SELECT point FROM points WHERE key = ? AND day >= ? AND day < ? "
+        "ORDER BY day",
+        (key, start, end),
+      ).fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+  def forget(self, key: str) -> None:
+    """
+    Drop a tracked series so the next update fetches it in full.
+    """
+    with self._lock, self._conn:
+      self._conn.execute("DELETE FROM series WHERE key = ?", (key,))
+      self._conn.execute("DELETE FROM points WHERE key = ?", (key,))
+
+  def edits_aggregate(
+    self,
+    project: str,
+    start: str,
+    end: Optional[str] = None,
+    editor_type: str = "all-editor-types",
+    page_type: str = "all-page-types",
+  ) -> Results:
+    """
+    Incrementally updated daily edits_aggregate() results.
+    """
+    key = f"edits/aggregate/{project}/{editor_type}/{page_type}/daily"
+
+    def fetch(start: str, end: str) -> Results:
+      return edits_aggregate(
+        project, "daily", start, end, editor_type=editor_type, page_type=page_type
+      )
+
+    return self.update(key, fetch, start, end)
+
+  def edits_per_page(
+    self,
+    project: str,
+    page_title: str,
+    start: str,
+    end: Optional[str] = None,
+    editor_type: str = "all-editor-types",
+  ) -> Results:
+    """
+    Incrementally updated daily edits_per_page() results.
+    """
+    key = f"edits/per-page/{project}/{page_title}/{editor_type}/daily"
+
+    def fetch(start: str, end: str) -> Results:
+      return edits_per_page(
+        project, page_title, "daily", start, end, editor_type=editor_type
+      )
+
+    return self.update(key, fetch, start, end)
+
+  def close(self) -> None:
+    """
+    Close the database connection.
+    """
+    with self._lock:
+      self._conn.close()
@@ -0,0 +1,125 @@
+import threading
+from typing import Dict, Optional, Protocol
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+
+
+class Transport(Protocol):
+  """
+  Interface every transport implements. The API functions only call get(),
+  so any object with these two methods can replace the HTTP transport (see
+  set_transport()), e.g. the record and replay transports in
+  wikiedits.cassette.
+
+  A transport that never touches the network can also set a
+  rate_limited = False attribute, so requests skip the shared rate
+  limiter (see is_rate_limited()).
+  """
+
+  def get(
+    self, url: str, headers: Dict[str, str], timeout: float
+  ) -> requests.Response:
+    """
+    Send a GET request and return the response.
+    """
+    ...
+
+  def close(self) -> None:
+    """
+    Release any resources held by the transport.
+    """
+    ...
+
+
+def is_rate_limited(transport: Transport) -> bool:
+  """
+  Return whether requests over transport wait for the shared rate limiter.
+  Transports without a rate_limited attribute are.
+  """
+  return bool(getattr(transport, "rate_limited", True))
+
+
+class HTTPTransport:
+  """
+  Pooled, keep-alive HTTP transport backed by a requests.Session.
+
+  A single transport is shared by every API call, so repeated requests to
+  the same host reuse open connections instead of paying a new TCP and TLS
+  handshake each time.
+
+  Args:
+    pool_size: Maximum number of connections kept open per host
+    pool_block: Whether to block when the pool is exhausted instead of
+      opening extra, non-reused connections
+  """
+
+  def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, pool_block: bool = False):
+    if pool_size < 1:
+      raise ValueError(f"Invalid pool_size: {pool_size}. Must be at least 1")
+
+    self.pool_size = pool_size
+    self.session = requests.Session()
+    adapter = HTTPAdapter(
+      pool_connections=pool_size, pool_maxsize=pool_size, pool_block=pool_block
+    )
+    self.session.mount("https://", adapter)
+    self.session.mount("http://", adapter)
+
+  def get(
+    self, url: str, headers: Dict[str, str], timeout: float
+  ) -> requests.Response:
+    """
+    Send a GET request over the pooled session.
+    """
+    return self.session.get(url, headers=headers, timeout=timeout)
+
+  def close(self) -> None:
+    """
+    Close all pooled connections.
+    """
+    self.session.close()
+
+
+_transport: Optional[Transport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> Transport:
+  """
+  Return the shared transport, creating it on first use.
+  """
+  global _transport
+  if _transport is None:
+    with _transport_lock:
+      if _transport is None:
+        _transport = HTTPTransport()
+  return _transport
+
+
+def set_transport(transport: Optional[Transport]) -> None:
+  """
+  Replace the shared transport used by all API calls.
+
+  Passing None closes the current transport; a fresh default one is created
+  on the next request.
+  """
+  global _transport
+  with _transport_lock:
+    previous = _transport
+    _transport = transport
+  if previous is not None and previous is not transport:
+    previous.close()
+
+
+def configure(pool_size: int = DEFAULT_POOL_SIZE, pool_block: bool = False) -> None:
+  """
+  Replace the shared transport with one using the given pool settings.
+
+  Args:
+    pool_size: Maximum number of connections kept open per host
+    pool_block: Whether to block when the pool is exhausted
+  """
+  set_transport(HTTPTransport(pool_size=pool_size, pool_block=pool_block))